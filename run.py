@@ -1,44 +1,39 @@
 #!/usr/bin/env python3
 """Simple runner script for Media Toolkit."""
 
+import argparse
 import sys
-from pathlib import Path
 
-def main():
-    # Defaults
-    data_dir = Path("./data")
-    # Default to user requested directory (parent of GP_URL.md)
-    source_dir = Path("/Users/joon/Documents/Obsidian/02_INBOX/_Hub/_Creative/GP/test") 
-    port = 8080
-    
-    # Parse simple args
-    args = sys.argv[1:]
-    if "--help" in args or "-h" in args:
-        print("""
-Media Toolkit - 소셜 미디어 수집 + 범용 미디어 다운로더
+DEFAULT_SOURCE_DIR = "/Users/joon/Documents/Obsidian/02_INBOX/_Hub/_Creative/GP/test"
 
-사용법:
-    python run.py [옵션]
 
-옵션:
-    --data DIR      데이터 저장 경로 (기본: ./data)
-    --source DIR    MD 파일 경로 (기본: Obsidian 폴더)
-    --port PORT     서버 포트 (기본: 8080)
-    -h, --help      도움말 표시
-
-예시:
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Media Toolkit - 소셜 미디어 수집 + 범용 미디어 다운로더",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""예시:
     python run.py
     python run.py --data ./my_data --port 3000
-""")
-        return
-    
-    for i, arg in enumerate(args):
-        if arg == "--data" and i + 1 < len(args):
-            data_dir = Path(args[i + 1])
-        elif arg == "--source" and i + 1 < len(args):
-            source_dir = Path(args[i + 1])
-        elif arg == "--port" and i + 1 < len(args):
-            port = int(args[i + 1])
+""",
+    )
+    parser.add_argument("--data", default="./data", metavar="DIR",
+                        help="데이터 저장 경로 (기본: ./data)")
+    # Default to user requested directory (parent of GP_URL.md)
+    parser.add_argument("--source", default=DEFAULT_SOURCE_DIR, metavar="DIR",
+                        help="MD 파일 경로 (기본: Obsidian 폴더)")
+    parser.add_argument("--port", type=int, default=8080,
+                        help="서버 포트 (기본: 8080)")
+    return parser.parse_args(argv)
+
+
+def main():
+    # argparse handles --help and exits before anything heavy is imported
+    args = parse_args()
+
+    from pathlib import Path
+    data_dir = Path(args.data)
+    source_dir = Path(args.source)
+    port = args.port
     
     # Ensure data directory exists
     data_dir.mkdir(parents=True, exist_ok=True)
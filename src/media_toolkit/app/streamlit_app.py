@@ -1,12 +1,26 @@
 """Streamlit UI for general-purpose media downloading."""
 
 import os
+from typing import Optional
+
 import streamlit as st
 
 from media_toolkit.extractor import extract_media
 from media_toolkit.downloader.general_downloader import DownloadManager
 
 
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False)
+def _cached_extract(url: str, cookies_browser: Optional[str]) -> tuple[list, list]:
+    """Memoize extraction across reruns so re-analyzing a URL skips yt-dlp."""
+    return extract_media(url, cookies_browser=cookies_browser)
+
+
+@st.cache_resource
+def get_manager(save_dir: str, cookies_browser: Optional[str]) -> DownloadManager:
+    """Reuse one DownloadManager (and its HTTP session) per settings combination."""
+    return DownloadManager(save_dir, cookies_browser=cookies_browser)
+
+
 def main():
     st.set_page_config(page_title="Media Toolkit - Downloader", layout="wide")
 
@@ -41,7 +55,7 @@ def main():
     if st.button("Analyze"):
         if url:
             with st.spinner("Extracting media..."):
-                items, logs = extract_media(url, cookies_browser=cookies_browser)
+                items, logs = _cached_extract(url, cookies_browser)
                 if items:
                     st.session_state.media_items = items
                     st.session_state.selected_indices = set(range(len(items))) # Select all by default
@@ -61,68 +75,85 @@ def main():
         st.divider()
         st.subheader("Found Media")
 
-        # Filter items based on user selection
-        filtered_items = [item for item in st.session_state.media_items if item.type in filter_type]
+        # Filter items based on user selection, keeping their original indices
+        wanted_types = frozenset(filter_type)
+        filtered_indices = [i for i, item in enumerate(st.session_state.media_items) if item.type in wanted_types]
 
-        if not filtered_items:
+        if not filtered_indices:
             st.info(f"No items found matching the selected filters ({', '.join(filter_type)}).")
         else:
-            # Select All / Deselect All (targeting only filtered items)
-            col1, col2 = st.columns(2)
-            # Map filtered items back to their original indices
-            filtered_indices = [i for i, item in enumerate(st.session_state.media_items) if item.type in filter_type]
-
-            if col1.button("Select All Visible"):
-                st.session_state.selected_indices.update(filtered_indices)
-            if col2.button("Deselect All Visible"):
-                st.session_state.selected_indices.difference_update(filtered_indices)
-
-            # Grid view
-            cols = st.columns(4)
-            for idx, item_idx in enumerate(filtered_indices):
-                item = st.session_state.media_items[item_idx]
-                col = cols[idx % 4]
-                with col:
-                    # Show thumbnail
-                    if item.thumbnail_url:
-                        try:
-                            st.image(item.thumbnail_url)
-                        except Exception:
-                            st.text("No Preview")
-                    else:
-                        st.text("No Preview")
-
-                    # Checkbox
-                    is_selected = item_idx in st.session_state.selected_indices
-                    checked = st.checkbox(f"{item.title or 'Unknown'} ({item.type})", value=is_selected, key=f"check_{item_idx}")
-
-                    if checked:
-                        st.session_state.selected_indices.add(item_idx)
-                    elif item_idx in st.session_state.selected_indices:
-                        st.session_state.selected_indices.remove(item_idx)
-
-                    st.caption(f"Size: {item.file_size or 'Unknown'}")
+            render_grid(filtered_indices)
 
         st.divider()
 
-        if st.button("Download Selected"):
-            selected_items = [st.session_state.media_items[i] for i in st.session_state.selected_indices]
-            if selected_items:
-                manager = DownloadManager(save_dir, cookies_browser=cookies_browser)
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                total = len(selected_items)
-                for i, item in enumerate(selected_items):
-                    status_text.text(f"Downloading {i+1}/{total}: {item.title}")
-                    manager.download_items([item]) # Download one by one to update UI
-                    progress_bar.progress((i + 1) / total)
-
-                st.success(f"Downloaded {len(selected_items)} files to {save_dir}")
-                status_text.text("Done!")
+        render_download(save_dir, cookies_browser)
+
+
+@st.fragment
+def render_grid(filtered_indices: list[int]):
+    """Item grid; checkbox and select-all clicks rerun only this fragment."""
+    # Select All / Deselect All (targeting only filtered items)
+    col1, col2 = st.columns(2)
+
+    if col1.button("Select All Visible"):
+        st.session_state.selected_indices.update(filtered_indices)
+    if col2.button("Deselect All Visible"):
+        st.session_state.selected_indices.difference_update(filtered_indices)
+
+    # Grid view
+    cols = st.columns(4)
+    for idx, item_idx in enumerate(filtered_indices):
+        item = st.session_state.media_items[item_idx]
+        col = cols[idx % 4]
+        with col:
+            # Show thumbnail
+            if item.thumbnail_url:
+                try:
+                    st.image(item.thumbnail_url)
+                except Exception:
+                    st.text("No Preview")
             else:
-                st.warning("No items selected.")
+                st.text("No Preview")
+
+            # Checkbox
+            is_selected = item_idx in st.session_state.selected_indices
+            checked = st.checkbox(f"{item.title or 'Unknown'} ({item.type})", value=is_selected, key=f"check_{item_idx}")
+
+            if checked:
+                st.session_state.selected_indices.add(item_idx)
+            elif item_idx in st.session_state.selected_indices:
+                st.session_state.selected_indices.remove(item_idx)
 
+            st.caption(f"Size: {item.file_size or 'Unknown'}")
+
+
+@st.fragment
+def render_download(save_dir: str, cookies_browser: Optional[str]):
+    """Download button and progress; updates do not rerun the whole page."""
+    if st.button("Download Selected"):
+        selected_items = [st.session_state.media_items[i] for i in st.session_state.selected_indices]
+        if selected_items:
+            manager = get_manager(save_dir, cookies_browser)
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+
+            total = len(selected_items)
+            completed = 0
+
+            def on_progress(message: str):
+                # Invoked from this script thread as each download finishes
+                nonlocal completed
+                completed += 1
+                status_text.text(message)
+                progress_bar.progress(completed / total)
+
+            status_text.text(f"Downloading {total} items...")
+            manager.download_items(selected_items, progress_callback=on_progress)
+
+            st.success(f"Downloaded {len(selected_items)} files to {save_dir}")
+            status_text.text("Done!")
+        else:
+            st.warning("No items selected.")
 
 if __name__ == "__main__":
     main()
@@ -1,37 +1,118 @@
 """General-purpose media download manager (from media_downloader)."""
 
+import atexit
+import functools
+import os
+import shutil
+import tempfile
+import threading
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yt_dlp
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Callable, Optional
 from ..extractor.base import MediaItem
+from ..utils.formatting import sanitize_filename
 from pathlib import Path
 from fake_useragent import UserAgent
 
 
+@functools.cache
+def _user_agents() -> UserAgent:
+    """Load the UserAgent database once, on first use."""
+    return UserAgent()
+
+
 class DownloadManager:
-    def __init__(self, save_dir: str, cookies_browser: Optional[str] = None):
+    def __init__(self, save_dir: str, cookies_browser: Optional[str] = None, max_workers: int = 5):
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
-        self.ua = UserAgent()
+        # One browser identity per manager; sites don't need per-request rotation
+        self.user_agent = _user_agents().random
         self.cookies_browser = cookies_browser
+        self.max_workers = max_workers
+
+        # Shared session so downloads reuse pooled connections across threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=max(20, max_workers),
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Long-lived workers so each keeps its own YoutubeDL between batches
+        # (YoutubeDL is not thread-safe, and building one loads every extractor)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._local = threading.local()
 
     def download_items(self, items: List[MediaItem], progress_callback: Optional[Callable[[str], None]] = None):
+        """Download items concurrently.
+
+        The progress callback is invoked from the calling thread once per
+        finished item, so it is safe to update UI elements from it.
+        """
         total = len(items)
-        for idx, item in enumerate(items):
-            try:
-                if progress_callback:
-                    progress_callback(f"Downloading {idx+1}/{total}: {item.title}")
+        if not total:
+            return
 
-                if item.type == 'video':
-                    self._download_video(item)
-                elif item.type == 'image':
-                    self._download_image(item)
+        futures = [self._executor.submit(self._download_one, item) for item in items]
+        for done, future in enumerate(as_completed(futures), start=1):
+            item = future.result()
+            if progress_callback:
+                progress_callback(f"Downloaded {done}/{total}: {item.title}")
 
-            except Exception as e:
-                print(f"Failed to download {item.title}: {e}")
+    def _download_one(self, item: MediaItem) -> MediaItem:
+        try:
+            if item.type == 'video':
+                self._download_video(item)
+            elif item.type == 'image':
+                self._download_image(item)
+        except Exception as e:
+            print(f"Failed to download {item.title}: {e}")
+        return item
 
     def _download_video(self, item: MediaItem):
-        # For video, we delegate to yt-dlp again to download
+        info = item.original_data or {}
+
+        # Stream the format URL resolved at extraction time when there is one
+        direct_url = info.get('direct_url')
+        if direct_url and self._download_direct(item, direct_url):
+            return
+
+        # Otherwise (or if the signed URL has expired) delegate to yt-dlp
+        ydl = self._get_ydl()
+        if info.get('_type', 'video') == 'video' and info.get('formats'):
+            # Already fully extracted: download without re-resolving the page
+            ydl.process_ie_result(info, download=True)
+        else:
+            ydl.download([item.url])
+
+    def _download_direct(self, item: MediaItem, direct_url: str) -> bool:
+        """Stream a pre-resolved format URL, returning False if it failed.
+
+        Signed CDN URLs expire, so a 403/410 or a dropped connection is
+        expected; any partially written file is removed.
+        """
+        info = item.original_data or {}
+        headers = {'User-Agent': self.user_agent, **(info.get('http_headers') or {})}
+        filepath = None
+        try:
+            with self.session.get(direct_url, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                filename = sanitize_filename(f"{item.title or info.get('id') or 'video'}.{info.get('ext') or 'mp4'}")
+                filepath = self._unique_path(filename)
+                self._write_response(response, filepath)
+            return True
+        except (requests.RequestException, urllib3.exceptions.HTTPError):
+            if filepath is not None:
+                filepath.unlink(missing_ok=True)
+            return False
+
+    def _build_opts(self) -> dict:
         ydl_opts = {
             'outtmpl': str(self.save_dir / '%(title)s.%(ext)s'),
             'quiet': True,
@@ -45,13 +126,20 @@ class DownloadManager:
 
         if self.cookies_browser:
             ydl_opts['cookiesfrombrowser'] = (self.cookies_browser, )
+        return ydl_opts
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            ydl.download([item.url])
+    def _get_ydl(self) -> yt_dlp.YoutubeDL:
+        """Return this worker thread's YoutubeDL, creating it on first use."""
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL(self._build_opts())
+            atexit.register(ydl.close)
+            self._local.ydl = ydl
+        return ydl
 
     def _download_image(self, item: MediaItem):
-        headers = {'User-Agent': self.ua.random}
-        response = requests.get(item.url, headers=headers, stream=True)
+        headers = {'User-Agent': self.user_agent}
+        response = self.session.get(item.url, headers=headers, stream=True)
         response.raise_for_status()
 
         # Determine filename
@@ -73,17 +161,28 @@ class DownloadManager:
             else:
                  filename += '.jpg' # Default
 
-        # Clean filename
-        filename = "".join([c for c in filename if c.isalpha() or c.isdigit() or c in " ._-()"]).rstrip()
-        filepath = self.save_dir / filename
+        self._write_response(response, self._unique_path(sanitize_filename(filename)))
+
+    def _unique_path(self, filename: str) -> Path:
+        """Reserve a file name in save_dir without overwriting existing files.
 
-        # Avoid overwrite
-        counter = 1
-        original_filepath = filepath
-        while filepath.exists():
-            filepath = original_filepath.with_name(f"{original_filepath.stem}_{counter}{original_filepath.suffix}")
-            counter += 1
+        The file is created atomically (O_EXCL), so concurrent downloads can
+        never pick the same name.
+        """
+        filepath = self.save_dir / filename
+        try:
+            # Fast path: the plain name is free
+            with filepath.open('xb'):
+                pass
+            return filepath
+        except FileExistsError:
+            fd, reserved = tempfile.mkstemp(prefix=f"{filepath.stem}_", suffix=filepath.suffix, dir=self.save_dir)
+            os.close(fd)
+            return Path(reserved)
 
+    @staticmethod
+    def _write_response(response: requests.Response, filepath: Path):
+        # Copy straight from the socket in 1 MB blocks; decode gzip/deflate transparently
+        response.raw.decode_content = True
         with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
@@ -2,16 +2,125 @@
 
 import asyncio
 import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Callable
+from typing import Iterable, Optional, Callable
 from PIL import Image
 import aiohttp
+import orjson
+import yt_dlp
 
+from ..utils.fileio import atomic_write_bytes
+from ..utils.formatting import sanitize_filename
 
-@dataclass
+
+# yt-dlp runs in-process on these threads; it releases the GIL during network I/O
+_YDL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="yt-dlp")
+
+# Pillow releases the GIL while decoding and resizing, so threads scale across
+# cores. Threads are started on first submit; a process pool would fork from
+# this already-threaded process and can deadlock.
+_THUMB_POOL = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="thumbnail")
+
+
+def _resize_image(source: Path, dest: Path, size: tuple[int, int]) -> None:
+    """Resize an image to thumbnail size."""
+    with Image.open(source) as img:
+        # Convert to RGB if necessary
+        if img.mode in ('RGBA', 'P'):
+            img = img.convert('RGB')
+        
+        # Resize maintaining aspect ratio. BILINEAR is indistinguishable from
+        # LANCZOS at thumbnail sizes and about twice as fast; thumbnail()
+        # already uses JPEG draft decoding to shrink large sources cheaply.
+        img.thumbnail(size, Image.Resampling.BILINEAR)
+        
+        # Save as JPEG
+        img.save(dest, 'JPEG', quality=85)
+
+
+# Fallback downloads are saved flat in media_dir as {post_id}.ext or
+# {post_id}_{n}.ext (post IDs are 12 hex digits)
+_FLAT_MEDIA_RE = re.compile(r'([0-9a-f]{12})(?:_\d+)?\.\w+')
+
+# Bytes per read when streaming a download to disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Thumbnail images are small; give up on a slow CDN quickly
+THUMBNAIL_TIMEOUT = 30
+
+
+async def _stream_to_file(response: aiohttp.ClientResponse, dest: Path) -> int:
+    """
+    Write a response body straight to a file, chunk by chunk.
+    
+    Chunks go to the file descriptor with os.write as they arrive, so the
+    body is never accumulated in memory and no chunk needs a thread hop.
+    
+    Args:
+        response: Open aiohttp response
+        dest: File to create or overwrite
+        
+    Returns:
+        Number of bytes written
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(dest, flags, 0o644)
+    size = 0
+    try:
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+            size += len(chunk)
+    finally:
+        os.close(fd)
+    return size
+
+
+def _ydl_download(url: str, ydl_opts: dict) -> tuple[list[Path], list[Path]]:
+    """
+    Run a yt-dlp download in the current thread.
+    
+    Returns:
+        (media_files, thumbnail_files) exactly as written by yt-dlp
+    """
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=True) or {}
+    
+    media_files = [
+        Path(d['filepath']) for d in info.get('requested_downloads') or []
+        if d.get('filepath') and not ydl_opts.get('skip_download')
+    ]
+    thumbnail_files = [
+        Path(t['filepath']) for t in info.get('thumbnails') or []
+        if t.get('filepath')
+    ]
+    return media_files, thumbnail_files
+
+
+def _ydl_options(output_template: str, cookies_from_browser: Optional[str] = None, **extra) -> dict:
+    """Build YoutubeDL options equivalent to our former CLI flags."""
+    ydl_opts = {
+        'outtmpl': output_template,
+        'quiet': True,
+        'no_warnings': True,
+        'noprogress': True,
+        'writethumbnail': True,
+        # --convert-thumbnails jpg
+        'postprocessors': [{'key': 'FFmpegThumbnailsConvertor', 'format': 'jpg', 'when': 'before_dl'}],
+        **extra,
+    }
+    if cookies_from_browser:
+        ydl_opts['cookiesfrombrowser'] = (cookies_from_browser, )
+    return ydl_opts
+
+
+@dataclass(slots=True)
 class DownloadResult:
     """Result of a media download operation."""
     
@@ -53,10 +162,85 @@ class MediaDownloader:
         self.media_dir = Path(media_dir)
         self.thumbnails_dir = Path(thumbnails_dir)
         self.thumbnail_size = thumbnail_size
+        self.index_file = self.media_dir / "media_index.json"
         
         # Ensure directories exist
         self.media_dir.mkdir(parents=True, exist_ok=True)
         self.thumbnails_dir.mkdir(parents=True, exist_ok=True)
+        
+        # post_id -> media file paths, so lookups never scan media_dir
+        self._media_index: dict[str, list[str]] = {}
+        self._load_index()
+        self._index_untracked_files()
+        
+        # Pooled HTTP session for direct downloads, bound to the event loop
+        # that created it
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the downloader's shared HTTP session.
+        
+        Thumbnails and fallback media downloads reuse its TCP/TLS
+        connections and DNS lookups. A new session is made if the old one
+        was closed or belongs to another event loop.
+        
+        Returns:
+            aiohttp session for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=4,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session, if one is open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    def _load_index(self) -> None:
+        """Load the media index from disk."""
+        if self.index_file.exists():
+            # orjson parses the raw bytes directly, no intermediate str
+            self._media_index = orjson.loads(self.index_file.read_bytes())
+    
+    def _index_untracked_files(self) -> None:
+        """
+        Add flat fallback downloads missing from the media index to it.
+        
+        One directory scan at startup, so deleting a post never has to
+        search media_dir for its files.
+        """
+        tracked = {path for paths in self._media_index.values() for path in paths}
+        added = False
+        with os.scandir(self.media_dir) as entries:
+            for entry in entries:
+                match = _FLAT_MEDIA_RE.fullmatch(entry.name)
+                if match and entry.path not in tracked and entry.is_file():
+                    self._media_index.setdefault(match.group(1), []).append(entry.path)
+                    added = True
+        if added:
+            self._save_index()
+    
+    def _save_index(self) -> None:
+        """Persist the media index to disk."""
+        atomic_write_bytes(self.index_file, orjson.dumps(self._media_index, option=orjson.OPT_INDENT_2))
+    
+    def _record_media(self, post_id: str, media_paths: list[str]) -> None:
+        """Remember which files belong to a post."""
+        self._media_index[post_id] = media_paths
+        self._save_index()
     
     async def download(
         self,
@@ -79,7 +263,7 @@ class MediaDownloader:
             DownloadResult with paths to downloaded files
         """
         # Create author directory
-        author_clean = self._sanitize_filename(author or "unknown")
+        author_clean = sanitize_filename(author or "unknown") or "unknown"
         author_dir = self.media_dir / author_clean
         author_dir.mkdir(parents=True, exist_ok=True)
         
@@ -87,53 +271,43 @@ class MediaDownloader:
         # Note: id is unique, title adds context
         output_template = str(author_dir / f"%(title).100s-%(id)s.%(ext)s")
         
-        cmd = [
-            'yt-dlp',
-            '--no-warnings',
-            '--no-playlist',
-            '-o', output_template,
-            '--write-thumbnail',
-            '--convert-thumbnails', 'jpg',
-            url,
-        ]
-        
-        if cookies_from_browser:
-            cmd.extend(['--cookies-from-browser', cookies_from_browser])
+        ydl_opts = _ydl_options(output_template, cookies_from_browser, noplaylist=True)
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                error_msg = stderr.decode('utf-8', errors='ignore').strip()
+            loop = asyncio.get_running_loop()
+            try:
+                media_files, thumbnail_files = await loop.run_in_executor(
+                    _YDL_EXECUTOR, _ydl_download, url, ydl_opts
+                )
+            except yt_dlp.utils.DownloadError as e:
                 return DownloadResult(
                     success=False,
                     url=url,
                     post_id=post_id,
-                    error_message=f"yt-dlp failed: {error_msg[:200]}",
+                    error_message=f"yt-dlp failed: {str(e)[:200]}",
                 )
             
-            # Find downloaded files
+            # yt-dlp reports the files it wrote, so no directory scan is needed
             media_paths = []
             thumbnail_path = None
             total_size = 0
             
-            for file in self.media_dir.glob(f"{post_id}.*"):
-                file_size = file.stat().st_size
-                total_size += file_size
-                
-                # Check if it's a thumbnail
-                if file.suffix.lower() in ['.jpg', '.jpeg', '.webp', '.png']:
-                    # Move to thumbnails dir and resize
-                    thumb_dest = self.thumbnails_dir / f"{post_id}.jpg"
-                    thumbnail_path = await self._process_thumbnail(file, thumb_dest)
-                else:
-                    media_paths.append(str(file))
+            # One stat per file: its size, which also proves it exists
+            for file in media_files:
+                try:
+                    total_size += file.stat().st_size
+                except FileNotFoundError:
+                    continue
+                media_paths.append(str(file))
+            
+            for file in thumbnail_files:
+                try:
+                    total_size += file.stat().st_size
+                except FileNotFoundError:
+                    continue
+                # Move to thumbnails dir and resize
+                thumb_dest = self.thumbnails_dir / f"{post_id}.jpg"
+                thumbnail_path = await self._process_thumbnail(file, thumb_dest)
             
             if not media_paths and not thumbnail_path:
                 return DownloadResult(
@@ -143,6 +317,8 @@ class MediaDownloader:
                     error_message="No files downloaded",
                 )
             
+            self._record_media(post_id, media_paths)
+            
             return DownloadResult(
                 success=True,
                 url=url,
@@ -152,43 +328,30 @@ class MediaDownloader:
                 total_size_bytes=total_size,
             )
             
-        except FileNotFoundError:
-            return DownloadResult(
-                success=False,
-                url=url,
-                post_id=post_id,
-                error_message="yt-dlp not installed",
-            )
         except Exception as e:
             # Try fallback if media_urls provided
             if media_urls:
                 try:
-                    downloaded_paths = []
-                    async with aiohttp.ClientSession() as session:
-                        for i, media_url in enumerate(media_urls):
-                            ext = "jpg"  # Default to jpg for images
-                            if "mp4" in media_url: ext = "mp4"
-                            
-                            filename = f"{post_id}_{i}.{ext}" if len(media_urls) > 1 else f"{post_id}.{ext}"
-                            dest = self.media_dir / filename
-                            
-                            async with session.get(media_url) as response:
-                                if response.status == 200:
-                                    with open(dest, 'wb') as f:
-                                        while True:
-                                            chunk = await response.content.read(1024)
-                                            if not chunk:
-                                                break
-                                            f.write(chunk)
-                                    downloaded_paths.append(str(dest))
+                    semaphore = asyncio.Semaphore(5)
+                    session = self._get_session()
+                    results = await asyncio.gather(
+                        *[
+                            self._fetch_one(session, semaphore, post_id, i, media_url, len(media_urls))
+                            for i, media_url in enumerate(media_urls)
+                        ],
+                        return_exceptions=True,
+                    )
+                    fetched = [r for r in results if isinstance(r, tuple)]
+                    downloaded_paths = [path for path, _ in fetched]
                     
                     if downloaded_paths:
+                        self._record_media(post_id, downloaded_paths)
                         return DownloadResult(
                             success=True,
                             url=url,
                             post_id=post_id,
                             media_paths=downloaded_paths,
-                            total_size_bytes=sum(os.path.getsize(p) for p in downloaded_paths),
+                            total_size_bytes=sum(size for _, size in fetched),
                         )
                 except Exception as fallback_error:
                     return DownloadResult(
@@ -205,6 +368,34 @@ class MediaDownloader:
                 error_message=str(e),
             )
     
+    async def _fetch_one(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        post_id: str,
+        index: int,
+        media_url: str,
+        total: int,
+    ) -> Optional[tuple[str, int]]:
+        """
+        Download a single media URL for the fallback path.
+        
+        Returns:
+            (path, bytes written) or None if the server did not return 200
+        """
+        ext = "jpg"  # Default to jpg for images
+        if "mp4" in media_url: ext = "mp4"
+        
+        filename = f"{post_id}_{index}.{ext}" if total > 1 else f"{post_id}.{ext}"
+        dest = self.media_dir / filename
+        
+        async with semaphore:
+            async with session.get(media_url) as response:
+                if response.status != 200:
+                    return None
+                size = await _stream_to_file(response, dest)
+        return str(dest), size
+    
     async def _process_thumbnail(self, source: Path, dest: Path) -> Optional[str]:
         """
         Process and resize a thumbnail image.
@@ -217,13 +408,13 @@ class MediaDownloader:
             Path to processed thumbnail or None on failure
         """
         try:
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._resize_image, source, dest)
+            # Run on the thumbnail pool to avoid blocking the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(_THUMB_POOL, _resize_image, source, dest, self.thumbnail_size)
             
             # Remove original if different from dest
-            if source != dest and source.exists():
-                source.unlink()
+            if source != dest:
+                source.unlink(missing_ok=True)
             
             return str(dest) if dest.exists() else None
             
@@ -237,24 +428,13 @@ class MediaDownloader:
             except Exception:
                 return None
     
-    def _resize_image(self, source: Path, dest: Path) -> None:
-        """Resize an image to thumbnail size."""
-        with Image.open(source) as img:
-            # Convert to RGB if necessary
-            if img.mode in ('RGBA', 'P'):
-                img = img.convert('RGB')
-            
-            # Resize maintaining aspect ratio
-            img.thumbnail(self.thumbnail_size, Image.Resampling.LANCZOS)
-            
-            # Save as JPEG
-            img.save(dest, 'JPEG', quality=85)
-    
     async def download_thumbnail_only(
         self,
         url: str,
         post_id: str,
         cookies_from_browser: Optional[str] = None,
+        thumbnail_url: Optional[str] = None,
+        refresh: bool = False,
     ) -> Optional[str]:
         """
         Download only the thumbnail from a URL.
@@ -262,49 +442,83 @@ class MediaDownloader:
         Args:
             url: URL to get thumbnail from
             post_id: Unique ID for naming
+            cookies_from_browser: Browser to read cookies from for yt-dlp
+            thumbnail_url: Image URL already found by the scraper; fetched
+                directly, with yt-dlp as the fallback
+            refresh: Download even if the post already has a thumbnail
             
         Returns:
             Path to thumbnail or None
         """
-        output_template = str(self.thumbnails_dir / f"{post_id}.%(ext)s")
+        # Re-scrapes keep the thumbnail they already have (one stat, no request)
+        if not refresh:
+            existing = self.thumbnails_dir / f"{post_id}.jpg"
+            try:
+                if existing.stat().st_size > 0:
+                    return str(existing)
+            except FileNotFoundError:
+                pass
+        
+        if thumbnail_url:
+            thumb_path = await self._fetch_thumbnail(thumbnail_url, post_id)
+            if thumb_path:
+                return thumb_path
         
-        cmd = [
-            'yt-dlp',
-            '--no-warnings',
-            '--skip-download',
-            '--write-thumbnail',
-            '--convert-thumbnails', 'jpg',
-            '-o', output_template,
-            url,
-        ]
+        output_template = str(self.thumbnails_dir / f"{post_id}.%(ext)s")
         
-        if cookies_from_browser:
-            cmd.extend(['--cookies-from-browser', cookies_from_browser])
+        ydl_opts = _ydl_options(output_template, cookies_from_browser, skip_download=True)
         
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            loop = asyncio.get_running_loop()
+            try:
+                _, thumbnail_files = await loop.run_in_executor(
+                    _YDL_EXECUTOR, _ydl_download, url, ydl_opts
+                )
+            except yt_dlp.utils.DownloadError:
+                return None
             
-            await process.communicate()
+            # Use the thumbnail yt-dlp wrote (jpg after conversion)
+            final_path = self.thumbnails_dir / f"{post_id}.jpg"
+            for thumb_path in thumbnail_files:
+                if not thumb_path.exists():
+                    continue
+                # Resize if needed
+                if thumb_path != final_path:
+                    await self._process_thumbnail(thumb_path, final_path)
+                    return str(final_path)
+                return str(thumb_path)
             
-            # Find the thumbnail
-            for ext in ['jpg', 'jpeg', 'webp', 'png']:
-                thumb_path = self.thumbnails_dir / f"{post_id}.{ext}"
-                if thumb_path.exists():
-                    # Resize if needed
-                    final_path = self.thumbnails_dir / f"{post_id}.jpg"
-                    if thumb_path != final_path:
-                        await self._process_thumbnail(thumb_path, final_path)
-                        return str(final_path)
-                    return str(thumb_path)
+            return None
             
+        except Exception:
             return None
+    
+    async def _fetch_thumbnail(self, thumbnail_url: str, post_id: str) -> Optional[str]:
+        """
+        Download a thumbnail image URL and resize it.
+        
+        Skips yt-dlp, which would fetch and parse the post page again just
+        to find the same image URL.
+        
+        Args:
+            thumbnail_url: Image URL
+            post_id: Unique ID for naming
             
+        Returns:
+            Path to thumbnail or None on failure
+        """
+        part_path = self.thumbnails_dir / f"{post_id}.part"
+        try:
+            timeout = aiohttp.ClientTimeout(total=THUMBNAIL_TIMEOUT)
+            async with self._get_session().get(thumbnail_url, timeout=timeout) as response:
+                if response.status != 200:
+                    return None
+                await _stream_to_file(response, part_path)
+            return await self._process_thumbnail(part_path, self.thumbnails_dir / f"{post_id}.jpg")
         except Exception:
             return None
+        finally:
+            part_path.unlink(missing_ok=True)
     
     def get_thumbnail(self, post_id: str) -> Optional[Path]:
         """
@@ -329,12 +543,7 @@ class MediaDownloader:
         Returns:
             List of paths to media files
         """
-        files = []
-        for file in self.media_dir.glob(f"{post_id}.*"):
-            # Exclude thumbnails
-            if file.suffix.lower() not in ['.jpg', '.jpeg', '.webp', '.png']:
-                files.append(file)
-        return files
+        return [Path(p) for p in self._media_index.get(post_id, [])]
     
     def delete_media(self, post_id: str) -> bool:
         """
@@ -346,17 +555,36 @@ class MediaDownloader:
         Returns:
             True if any files were deleted
         """
-        deleted = False
+        return self.delete_media_many([post_id]) > 0
+    
+    def delete_media_many(self, post_ids: Iterable[str]) -> int:
+        """
+        Delete all media files and thumbnails for several posts.
         
-        # Delete media files
-        for file in self.media_dir.glob(f"{post_id}.*"):
-            file.unlink()
-            deleted = True
+        Files are found through the media index, and the index is saved
+        once at the end.
         
-        # Delete thumbnail
-        thumb_path = self.thumbnails_dir / f"{post_id}.jpg"
-        if thumb_path.exists():
-            thumb_path.unlink()
-            deleted = True
+        Args:
+            post_ids: Post IDs
+            
+        Returns:
+            Number of posts that had files deleted
+        """
+        count = 0
+        forgotten = False
+        for post_id in post_ids:
+            paths = self._media_index.pop(post_id, None)
+            forgotten = forgotten or paths is not None
+            
+            deleted = False
+            for path in [*(paths or ()), self.thumbnails_dir / f"{post_id}.jpg"]:
+                try:
+                    os.unlink(path)
+                    deleted = True
+                except FileNotFoundError:
+                    pass
+            count += deleted
         
-        return deleted
+        if forgotten:
+            self._save_index()
+        return count
@@ -5,11 +5,14 @@ from .base import MediaExtractor, MediaItem
 from .video import YouTubeExtractor
 from .web_image import WebImageExtractor
 
+# Extractors are stateless, so build them once at import
+_EXTRACTORS: List[MediaExtractor] = [
+    YouTubeExtractor(),
+    WebImageExtractor() # Generic fallback
+]
+
 def get_all_extractors() -> List[MediaExtractor]:
-    return [
-        YouTubeExtractor(),
-        WebImageExtractor() # Generic fallback
-    ]
+    return list(_EXTRACTORS)
 
 def extract_media(url: str, cookies_browser: str = None) -> tuple[list, list]:
     """Extract media items from a URL using available extractors.
@@ -17,14 +20,12 @@ def extract_media(url: str, cookies_browser: str = None) -> tuple[list, list]:
     Returns:
         (items, logs) - list of MediaItem and list of error/info messages
     """
-    extractors = get_all_extractors()
     logs = []
 
-    for extractor in extractors:
+    for extractor in _EXTRACTORS:
         if extractor.is_supported(url):
             try:
-                # Check if extractor supports cookies
-                if hasattr(extractor.extract, '__code__') and 'cookies_browser' in extractor.extract.__code__.co_varnames:
+                if extractor.accepts_cookies:
                      items = extractor.extract(url, cookies_browser=cookies_browser)
                 else:
                      items = extractor.extract(url)
@@ -1,8 +1,10 @@
+import inspect
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class MediaItem:
     url: str
     type: str  # 'image' or 'video'
@@ -12,6 +14,11 @@ class MediaItem:
     original_data: Optional[dict] = None # Store raw metadata if needed
 
 class MediaExtractor(ABC):
+    @cached_property
+    def accepts_cookies(self) -> bool:
+        """Whether extract() takes a cookies_browser argument (checked once)."""
+        return 'cookies_browser' in inspect.signature(self.extract).parameters
+
     @abstractmethod
     def extract(self, url: str) -> List[MediaItem]:
         """Extract media items from the given URL."""
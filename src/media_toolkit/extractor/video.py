@@ -1,64 +1,115 @@
+import atexit
+import re
+import threading
 import yt_dlp
 from typing import List
+from yt_dlp.extractor import gen_extractor_classes
 from .base import MediaExtractor, MediaItem
 from ..utils.formatting import human_readable_size
 
 class YouTubeExtractor(MediaExtractor):
+    # Fast path for the most common video hosts
+    URL_RE = re.compile(
+        r'(?:youtube\.com|youtu\.be|vimeo\.com|dailymotion\.com|twitch\.tv|tiktok\.com'
+        r'|instagram\.com|facebook\.com|fb\.watch|twitter\.com|x\.com|soundcloud\.com)/',
+        re.IGNORECASE | re.ASCII
+    )
+
+    # Site-specific yt-dlp extractors, loaded on first use (excludes the generic one)
+    _site_extractors = None
+
+    @classmethod
+    def _get_site_extractors(cls):
+        if cls._site_extractors is None:
+            cls._site_extractors = [ie for ie in gen_extractor_classes() if ie.ie_key() != 'Generic']
+        return cls._site_extractors
+
     def is_supported(self, url: str) -> bool:
-        # We'll allow yt-dlp to try on any URL since it supports thousands of sites.
-        # The extract method handles failures gracefully.
-        return True
+        if self.URL_RE.search(url):
+            return True
+        # yt-dlp supports thousands of sites; ask its extractors before
+        # falling through to the (slow) network probe of a generic page.
+        return any(ie.suitable(url) for ie in self._get_site_extractors())
 
-    def extract(self, url: str, cookies_browser: str = None) -> List[MediaItem]:
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True, # Fast extraction for playlists
-            'nocheckcertificate': True, # Sometimes helps with SSL issues
-            'http_headers': {
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
+    def __init__(self):
+        # One YoutubeDL per (thread, cookie browser); they are not thread-safe
+        self._local = threading.local()
+
+    def _get_ydl(self, cookies_browser: str = None) -> yt_dlp.YoutubeDL:
+        cache = getattr(self._local, 'ydl_flat', None)
+        if cache is None:
+            cache = self._local.ydl_flat = {}
+        ydl = cache.get(cookies_browser)
+        if ydl is None:
+            ydl_opts = {
+                'quiet': True,
+                'no_warnings': True,
+                'extract_flat': True, # Fast extraction for playlists
+                'nocheckcertificate': True, # Sometimes helps with SSL issues
+                'http_headers': {
+                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+                    'Accept-Language': 'en-US,en;q=0.5',
+                }
             }
-        }
 
-        if cookies_browser:
-            ydl_opts['cookiesfrombrowser'] = (cookies_browser, ) # Tuple required
+            if cookies_browser:
+                ydl_opts['cookiesfrombrowser'] = (cookies_browser, ) # Tuple required
+
+            ydl = cache[cookies_browser] = yt_dlp.YoutubeDL(ydl_opts)
+            atexit.register(ydl.close)
+        return ydl
 
+    def extract(self, url: str, cookies_browser: str = None) -> List[MediaItem]:
         items = []
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            try:
-                info = ydl.extract_info(url, download=False)
+        ydl = self._get_ydl(cookies_browser)
+        try:
+            info = ydl.extract_info(url, download=False)
 
-                # Check if it's a playlist or single video
-                if 'entries' in info:
-                    entries = info['entries']
+            # Check if it's a playlist or single video
+            if 'entries' in info:
+                entries = info['entries']
+            else:
+                entries = [info]
+
+            for entry in entries:
+                if not entry: continue
+
+                title = entry.get('title', 'Unknown Title')
+                original_url = entry.get('url', entry.get('webpage_url'))
+                thumbs = entry.get('thumbnails', [])
+                thumbnail = thumbs[-1]['url'] if thumbs else None
+
+                # Progressive http(s) formats can be streamed directly later,
+                # sparing the downloader a second extraction round-trip.
+                direct_url = self._direct_url(entry)
+                if direct_url:
+                    entry['direct_url'] = direct_url
+
+                filesize = entry.get('filesize')
+                if filesize:
+                    size_str = human_readable_size(filesize)
                 else:
-                    entries = [info]
-
-                for entry in entries:
-                    if not entry: continue
-
-                    title = entry.get('title', 'Unknown Title')
-                    original_url = entry.get('url', entry.get('webpage_url'))
-                    thumbs = entry.get('thumbnails', [])
-                    thumbnail = thumbs[-1]['url'] if thumbs else None
-
-                    filesize = entry.get('filesize')
-                    if filesize:
-                        size_str = human_readable_size(filesize)
-                    else:
-                        size_str = "Calc upon download"
-
-                    items.append(MediaItem(
-                        url=original_url or url,
-                        type='video',
-                        thumbnail_url=thumbnail,
-                        title=title,
-                        file_size=size_str,
-                        original_data=entry
-                    ))
-            except Exception as e:
-                # Re-raise to be caught by the manager with the specific error
-                raise Exception(f"yt-dlp processing failed: {str(e)}")
+                    size_str = "Calc upon download"
+
+                items.append(MediaItem(
+                    url=original_url or url,
+                    type='video',
+                    thumbnail_url=thumbnail,
+                    title=title,
+                    file_size=size_str,
+                    original_data=entry
+                ))
+        except Exception as e:
+            # Re-raise to be caught by the manager with the specific error
+            raise Exception(f"yt-dlp processing failed: {str(e)}")
 
         return items
+
+    @staticmethod
+    def _direct_url(entry: dict):
+        """Return the selected format's media URL if it is a single plain HTTP file."""
+        if entry.get('_type', 'video') != 'video' or entry.get('requested_formats'):
+            return None
+        if entry.get('protocol') not in ('http', 'https'):
+            return None
+        return entry.get('url')
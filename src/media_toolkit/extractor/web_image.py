@@ -1,58 +1,40 @@
+import threading
+
 import cloudscraper
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+from lxml import etree, html as lxml_html
 from typing import List
 from .base import MediaExtractor, MediaItem
 
 class WebImageExtractor(MediaExtractor):
+    # Images declaring both dimensions below this (px) are icons/pixels
+    MIN_IMAGE_SIZE = 64
+
     def is_supported(self, url: str) -> bool:
         # Fallback for generic websites
         return True
 
+    def __init__(self):
+        # One scraper session per thread; requests sessions are not thread-safe
+        self._local = threading.local()
+
+    def _get_scraper(self) -> cloudscraper.CloudScraper:
+        scraper = getattr(self._local, 'scraper', None)
+        if scraper is None:
+            # Cloudscraper creates a session that mimics a browser and solves simple JS challenges.
+            # Reusing it keeps TCP/TLS connections (and solved challenge cookies) alive across URLs.
+            scraper = self._local.scraper = cloudscraper.create_scraper(
+                browser={'browser': 'chrome', 'platform': 'darwin', 'desktop': True}
+            )
+        return scraper
+
     def extract(self, url: str) -> List[MediaItem]:
-        items = []
-        # Cloudscraper creates a session that mimics a browser and solves simple JS challenges
-        scraper = cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'darwin', 'desktop': True})
+        scraper = self._get_scraper()
 
         try:
             response = scraper.get(url, timeout=15)
             response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            images = soup.find_all('img')
-
-            seen_urls = set()
-
-            for img in images:
-                src = img.get('src')
-                if not src:
-                    continue
-
-                absolute_url = urljoin(url, src)
-
-                # Basic dedup
-                if absolute_url in seen_urls:
-                    continue
-                seen_urls.add(absolute_url)
-
-                # Check for cached width/height attributes to filter tiny icons
-                width = img.get('width')
-                height = img.get('height')
-
-                # Prepare title from alt or filename
-                alt = img.get('alt', '')
-                filename = urlparse(absolute_url).path.split('/')[-1]
-                title = alt if alt else filename
-
-                items.append(MediaItem(
-                    url=absolute_url,
-                    type='image',
-                    thumbnail_url=absolute_url, # Use the image itself as thumbnail
-                    title=title,
-                    file_size="Unknown",
-                    original_data={'alt': alt, 'width': width, 'height': height}
-                ))
+            return self._parse_images(response.content, url)
 
         except requests.exceptions.HTTPError as e:
              raise Exception(f"HTTP Error {e.response.status_code}: {e.response.reason} for {url}")
@@ -63,4 +45,54 @@ class WebImageExtractor(MediaExtractor):
         except Exception as e:
             raise Exception(f"Web scraping failed: {str(e)}")
 
+    def _parse_images(self, content: bytes, url: str) -> List[MediaItem]:
+        items = []
+
+        # Only <img> attributes are needed, so skip BeautifulSoup and walk
+        # the lxml tree directly; lxml sniffs the encoding from the raw bytes
+        try:
+            tree = lxml_html.fromstring(content)
+        except (etree.ParserError, ValueError):
+            return items  # Empty or non-HTML document
+        tree.make_links_absolute(url, handle_failures='ignore')
+
+        seen_urls = set()
+
+        for img in tree.iter('img'):
+            absolute_url = img.get('src')
+            # Inline data: URIs are placeholders/pixels, not downloadable images
+            if not absolute_url or absolute_url.startswith('data:'):
+                continue
+
+            # Basic dedup
+            if absolute_url in seen_urls:
+                continue
+            seen_urls.add(absolute_url)
+
+            # Check for cached width/height attributes to filter tiny icons
+            width = img.get('width')
+            height = img.get('height')
+            if width and height:
+                try:
+                    if int(width) < self.MIN_IMAGE_SIZE and int(height) < self.MIN_IMAGE_SIZE:
+                        continue
+                except ValueError:
+                    pass  # e.g. "100%" - keep the image
+
+            # Prepare title from alt or filename
+            alt = img.get('alt') or ''
+            # Last path segment, without query/fragment (no full urlparse needed)
+            path = absolute_url.partition('#')[0].partition('?')[0]
+            filename = path.rpartition('/')[2]
+            title = alt if alt else filename
+
+            items.append(MediaItem(
+                url=absolute_url,
+                type='image',
+                thumbnail_url=absolute_url, # Use the image itself as thumbnail
+                title=title,
+                file_size="Unknown",
+                original_data={'alt': alt, 'width': width, 'height': height}
+            ))
+
         return items
@@ -10,9 +10,14 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.table import Table
 
-from .parser import scan_directory, detect_duplicates
+try:
+    import uvloop  # Optional libuv event loop (pip install media-toolkit[fast])
+except ImportError:
+    uvloop = None
+
+from .parser import scan_directory, analyze_urls
 from .validator import URLValidator, URLStatus
-from .scraper import scrape_url
+from .scraper import scrape_url, close_scrapers
 from .downloader import MediaDownloader
 from .storage import Database, Post, Platform
 from .storage.models import PostStatus
@@ -27,8 +32,9 @@ def main(cfg: DictConfig) -> None:
     console.print("[bold blue]Media Toolkit[/bold blue]")
     console.print()
     
-    # Run the full pipeline
-    asyncio.run(run_pipeline(cfg))
+    # Run the full pipeline (on uvloop when installed)
+    run = uvloop.run if uvloop is not None else asyncio.run
+    run(run_pipeline(cfg))
 
 
 async def run_pipeline(cfg: DictConfig) -> None:
@@ -51,6 +57,7 @@ async def run_pipeline(cfg: DictConfig) -> None:
     validator = URLValidator(
         timeout=cfg.validator.timeout,
     )
+    concurrency = max(1, cfg.scraper.concurrent_requests)
     
     # Step 1: Parse MD files
     console.print("[bold]Step 1: Parsing MD files[/bold]")
@@ -63,18 +70,19 @@ async def run_pipeline(cfg: DictConfig) -> None:
     
     console.print(f"  Found [green]{len(collection)}[/green] URLs in [green]{len(collection.source_files)}[/green] files")
     
-    # Check for duplicates
-    duplicates = detect_duplicates(collection.urls)
+    # Check for duplicates and get unique URLs
+    analysis = analyze_urls(collection.urls)
+    duplicates = analysis.duplicates
     if duplicates:
         console.print(f"  [yellow]Warning:[/yellow] Found {duplicates.total_duplicates} duplicate URLs")
     
-    # Get unique URLs
-    unique_urls = collection.unique_urls()
+    unique_urls = analysis.unique
     console.print(f"  Processing [green]{len(unique_urls)}[/green] unique URLs")
     console.print()
     
     # Step 2: Filter already processed
-    new_urls = [u for u in unique_urls if not db.exists(u.id)]
+    existing_ids = db.existing_ids(u.id for u in unique_urls)
+    new_urls = [u for u in unique_urls if u.id not in existing_ids]
     console.print(f"[bold]Step 2: Filtering[/bold]")
     console.print(f"  Already in DB: {len(unique_urls) - len(new_urls)}")
     console.print(f"  New URLs: [green]{len(new_urls)}[/green]")
@@ -97,14 +105,20 @@ async def run_pipeline(cfg: DictConfig) -> None:
     ) as progress:
         task = progress.add_task("Validating...", total=len(new_urls))
         
-        validation_results = {}
-        for url_obj in new_urls:
-            result = await validator.validate(url_obj.url)
-            validation_results[url_obj.id] = result
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def validate_one(url_obj):
+            async with semaphore:
+                result = await validator.validate(url_obj.url)
+                # Rate limiting (holds the slot, so at most `concurrency` in flight)
+                await asyncio.sleep(cfg.scraper.delay_min)
             progress.advance(task)
-            
-            # Rate limiting
-            await asyncio.sleep(cfg.scraper.delay_min)
+            return url_obj.id, result
+        
+        validation_results = dict(
+            await asyncio.gather(*(validate_one(u) for u in new_urls))
+        )
+    await validator.close()
     
     # Count by status
     status_counts = {}
@@ -134,12 +148,22 @@ async def run_pipeline(cfg: DictConfig) -> None:
     ) as progress:
         task = progress.add_task("Scraping...", total=len(accessible_urls))
         
-        for url_obj in accessible_urls:
+        # One semaphore per platform so a single host never sees more than
+        # `concurrency` requests at once, while different platforms overlap.
+        platform_semaphores: dict[str, asyncio.Semaphore] = {}
+        
+        async def scrape_one(url_obj):
+            semaphore = platform_semaphores.setdefault(
+                url_obj.platform, asyncio.Semaphore(concurrency)
+            )
             try:
-                scrape_result = await scrape_url(
-                    url_obj.url,
-                    timeout=cfg.scraper.timeout,
-                )
+                async with semaphore:
+                    scrape_result = await _with_retries(
+                        lambda: scrape_url(url_obj.url, timeout=cfg.scraper.timeout),
+                        retries=cfg.scraper.retry_count,
+                        base_delay=cfg.scraper.delay_min,
+                    )
+                    await asyncio.sleep(cfg.scraper.delay_min)
                 
                 # Create post object
                 post = Post(
@@ -166,34 +190,58 @@ async def run_pipeline(cfg: DictConfig) -> None:
                     error_message=scrape_result.error_message,
                 )
                 
-                # Download thumbnail
+                # Download thumbnail in the background; the post is saved
+                # once it finishes, while this slot moves on to the next scrape
                 if cfg.output.download_media and scrape_result.thumbnail_url:
-                    thumb_path = await downloader.download_thumbnail_only(
-                        url_obj.url, 
-                        url_obj.id,
+                    pending_thumbs.append(
+                        asyncio.create_task(thumbnail_and_save(post, url_obj))
                     )
-                    if thumb_path:
-                        post.thumbnail_path = thumb_path
-                
-                db.save_post(post)
+                else:
+                    db.save_post(post)
                 
             except Exception as e:
                 console.print(f"  [red]Error scraping {url_obj.url}: {e}[/red]")
             
             progress.advance(task)
-            await asyncio.sleep(cfg.scraper.delay_min)
+        
+        thumb_semaphore = asyncio.Semaphore(concurrency)
+        pending_thumbs: list[asyncio.Task] = []
+        
+        async def thumbnail_and_save(post, url_obj):
+            try:
+                async with thumb_semaphore:
+                    thumb_path = await downloader.download_thumbnail_only(
+                        url_obj.url, 
+                        url_obj.id,
+                        thumbnail_url=post.thumbnail_url,
+                    )
+                if thumb_path:
+                    post.thumbnail_path = thumb_path
+            except Exception as e:
+                console.print(f"  [red]Error downloading thumbnail for {url_obj.url}: {e}[/red]")
+            
+            db.save_post(post)
+        
+        # Posts are saved as they finish; the index is persisted once at the end
+        with db.batch():
+            await asyncio.gather(*(scrape_one(u) for u in accessible_urls))
+            await asyncio.gather(*pending_thumbs)
+    
+    await close_scrapers()
+    await downloader.close()
     
     # Save inaccessible URLs too
+    accessible_ids = {u.id for u in accessible_urls}
+    status_map = {
+        URLStatus.PRIVATE: PostStatus.PRIVATE,
+        URLStatus.DELETED: PostStatus.DELETED,
+        URLStatus.LOGIN_REQUIRED: PostStatus.PRIVATE,
+    }
+    inaccessible_posts = []
     for url_obj in new_urls:
-        if url_obj.id not in [u.id for u in accessible_urls]:
+        if url_obj.id not in accessible_ids:
             validation = validation_results[url_obj.id]
-            status_map = {
-                URLStatus.PRIVATE: PostStatus.PRIVATE,
-                URLStatus.DELETED: PostStatus.DELETED,
-                URLStatus.LOGIN_REQUIRED: PostStatus.PRIVATE,
-            }
-            
-            post = Post(
+            inaccessible_posts.append(Post(
                 id=url_obj.id,
                 url=url_obj.url,
                 platform=Platform(url_obj.platform),
@@ -202,13 +250,37 @@ async def run_pipeline(cfg: DictConfig) -> None:
                 source_file=str(url_obj.source_file),
                 source_context=url_obj.context,
                 error_message=validation.error_message,
-            )
-            db.save_post(post)
+            ))
+    db.save_posts(inaccessible_posts)
     
     console.print()
     show_stats(db)
 
 
+async def _with_retries(make_call, retries: int = 3, base_delay: float = 1.0):
+    """
+    Await ``make_call()`` and retry with exponential backoff on failure.
+    
+    Scrapers report most failures through ``ScrapeResult.error_message``;
+    this only covers exceptions (e.g. connection resets under high fan-out).
+    
+    Args:
+        make_call: Zero-argument callable returning a fresh awaitable
+        retries: Number of attempts before the last exception is re-raised
+        base_delay: Delay before the first retry, doubled on each attempt
+        
+    Returns:
+        Result of the first successful call
+    """
+    for attempt in range(max(1, retries)):
+        try:
+            return await make_call()
+        except Exception:
+            if attempt + 1 >= retries:
+                raise
+            await asyncio.sleep(base_delay * (2 ** attempt))
+
+
 def show_stats(db: Database) -> None:
     """Display collection statistics."""
     stats = db.get_stats()
@@ -4,9 +4,11 @@ from .md_parser import (
     ExtractedURL,
     URLCollection,
     DuplicateReport,
+    URLAnalysis,
     parse_md_file,
     scan_directory,
     detect_duplicates,
+    analyze_urls,
     detect_platform,
 )
 
@@ -14,8 +16,10 @@ __all__ = [
     "ExtractedURL",
     "URLCollection", 
     "DuplicateReport",
+    "URLAnalysis",
     "parse_md_file",
     "scan_directory",
     "detect_duplicates",
+    "analyze_urls",
     "detect_platform",
 ]
@@ -1,11 +1,24 @@
 """Markdown file parser for extracting social media URLs."""
 
+import mmap
+import multiprocessing
+import os
 import re
 import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
+from operator import itemgetter
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
-from collections import defaultdict
+from typing import Iterator, Optional
+from collections import Counter, defaultdict
+
+try:
+    import hyperscan  # Optional SIMD pre-scan (pip install media-toolkit[fast])
+except ImportError:
+    hyperscan = None
 
 
 # Regex patterns for social media URLs
@@ -28,14 +41,38 @@ URL_PATTERNS = {
     ),
 }
 
-# Combined pattern for any social media URL
+# Combined pattern for any social media URL; the named group that matched
+# (match.lastgroup) is the platform, or None for an unusual domain/TLD pair
 COMBINED_PATTERN = re.compile(
-    r'https?://(?:www\.)?(?:instagram|facebook|linkedin|threads)\.(?:com|net)/[^\s\]\)]+',
+    r'https?://(?:www\.)?'
+    r'(?:(?P<instagram>instagram\.com)|(?P<facebook>facebook\.com)'
+    r'|(?P<linkedin>linkedin\.com)|(?P<threads>threads\.net)'
+    r'|(?:instagram|facebook|linkedin|threads)\.(?:com|net))'
+    r'/[^\s\]\)]+',
     re.IGNORECASE
 )
 
+# Byte-level twin of COMBINED_PATTERN for scanning memory-mapped files
+# without decoding them; matches are re-checked against the str pattern.
+COMBINED_PATTERN_B = re.compile(COMBINED_PATTERN.pattern.encode(), re.IGNORECASE)
+
+# Fixed-length URL prefix handed to Hyperscan; COMBINED_PATTERN_B then
+# extends each hit to the full URL.
+_URL_PREFIX_B = rb'https?://(?:www\.)?(?:instagram|facebook|linkedin|threads)\.(?:com|net)/'
+
+# Closing frontmatter fence; files with CRLF line endings use "\n---\r\n"
+_FRONTMATTER_END_B = re.compile(rb'\n---\r?\n')
+
+# Below this many files, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 32
 
-@dataclass
+# Tracking-parameter cleanup used by ExtractedURL._normalize_url
+_TRACKING_PARAM_RE = re.compile(r'[?&](?:igsh|mibextid|img_index)=[^&\s]*')
+_TRAILING_QUERY_RE = re.compile(r'\?$')
+_LEADING_AMP_RE = re.compile(r'\?&')
+
+
+@dataclass(slots=True)
 class ExtractedURL:
     """Represents a URL extracted from a Markdown file."""
     
@@ -44,25 +81,30 @@ class ExtractedURL:
     source_file: Path
     line_number: int
     context: Optional[str] = None  # Nearby text/comment
+    _id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def id(self) -> str:
-        """Generate a unique ID from the URL."""
-        # Normalize URL before hashing (remove tracking params)
-        normalized = self._normalize_url(self.url)
-        return hashlib.sha256(normalized.encode()).hexdigest()[:12]
+        """Generate a unique ID from the URL (computed once per instance)."""
+        if self._id is None:
+            # Normalize URL before hashing (remove tracking params)
+            normalized = self._normalize_url(self.url)
+            # IDs are persisted (post filenames, index keys), so the hash must
+            # stay SHA-256; caching already limits it to one call.
+            self._id = hashlib.sha256(normalized.encode()).hexdigest()[:12]
+        return self._id
     
     def _normalize_url(self, url: str) -> str:
         """Remove tracking parameters for consistent ID generation."""
         # Remove common tracking params like igsh, mibextid, img_index
-        url = re.sub(r'[?&](igsh|mibextid|img_index)=[^&\s]*', '', url)
+        url = _TRACKING_PARAM_RE.sub('', url)
         # Clean up leftover ? or &
-        url = re.sub(r'\?$', '', url)
-        url = re.sub(r'\?&', '?', url)
+        url = _TRAILING_QUERY_RE.sub('', url)
+        url = _LEADING_AMP_RE.sub('?', url)
         return url.rstrip('/')
 
 
-@dataclass
+@dataclass(slots=True)
 class URLCollection:
     """Collection of URLs extracted from multiple files."""
     
@@ -98,7 +140,7 @@ class URLCollection:
         return unique
 
 
-@dataclass
+@dataclass(slots=True)
 class DuplicateReport:
     """Report of duplicate URLs found across files."""
     
@@ -118,6 +160,15 @@ class DuplicateReport:
         return bool(self.duplicates)
 
 
+@dataclass(slots=True)
+class URLAnalysis:
+    """Deduplicated URLs, their duplicates and platform counts."""
+    
+    unique: list[ExtractedURL] = field(default_factory=list)
+    duplicates: DuplicateReport = field(default_factory=DuplicateReport)
+    by_platform: Counter = field(default_factory=Counter)  # Over unique URLs
+
+
 def detect_platform(url: str) -> str:
     """Detect the platform from a URL."""
     url_lower = url.lower()
@@ -132,13 +183,76 @@ def detect_platform(url: str) -> str:
     return 'unknown'
 
 
-def extract_context(lines: list[str], line_idx: int, context_lines: int = 1) -> Optional[str]:
-    """Extract context (nearby text) around a URL."""
-    context_parts = []
+def _compile_hyperscan_db():
+    """Compile the URL prefix into a Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[_URL_PREFIX_B],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST],
+        )
+        return db
+    except hyperscan.error:
+        return None
+
+
+_HS_DB = _compile_hyperscan_db()
+_hs_local = threading.local()  # Scratch space must not be shared across threads
+
+
+def _iter_url_matches(buf: bytes, pos: int = 0) -> Iterator[re.Match]:
+    """
+    Yield non-overlapping COMBINED_PATTERN_B matches in ``buf`` from ``pos``.
+    
+    With Hyperscan installed, candidate starts are found in one SIMD scan
+    and only those offsets are matched with ``re``; otherwise this is
+    plain ``finditer``.
+    """
+    if _HS_DB is None:
+        yield from COMBINED_PATTERN_B.finditer(buf, pos)
+        return
     
-    # Get preceding non-empty, non-URL lines
-    for i in range(max(0, line_idx - context_lines), line_idx):
-        line = lines[i].strip()
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hs_local.scratch = hyperscan.Scratch(_HS_DB)
+    
+    starts = []
+    _HS_DB.scan(
+        buf,
+        match_event_handler=lambda _id, start, _end, _flags, _ctx: starts.append(start),
+        scratch=scratch,
+    )
+    
+    for start in sorted(starts):
+        if start < pos:
+            continue  # Inside frontmatter or an earlier URL
+        match = COMBINED_PATTERN_B.match(buf, start)
+        if match:
+            pos = match.end()
+            yield match
+
+
+def extract_context(buf: bytes, line_start: int, context_lines: int = 1) -> Optional[str]:
+    """Extract context (nearby text) preceding the line starting at ``line_start``."""
+    raw_lines = []
+    
+    # Walk back over the preceding lines
+    end = line_start
+    for _ in range(context_lines):
+        if end <= 0:
+            break
+        start = buf.rfind(b'\n', 0, end - 1) + 1
+        raw_lines.append(buf[start:end - 1])
+        end = start
+    
+    # Keep non-empty, non-URL lines
+    context_parts = []
+    for raw in reversed(raw_lines):
+        line = raw.decode('utf-8', errors='replace').strip()
         if line and not COMBINED_PATTERN.search(line):
             context_parts.append(line)
     
@@ -149,6 +263,9 @@ def parse_md_file(path: Path) -> list[ExtractedURL]:
     """
     Parse a single Markdown file and extract all social media URLs.
     
+    The file is memory-mapped and scanned as bytes, so only matched URLs
+    and their context lines are ever decoded.
+    
     Args:
         path: Path to the Markdown file
         
@@ -160,52 +277,79 @@ def parse_md_file(path: Path) -> list[ExtractedURL]:
     
     extracted = []
     
-    with open(path, 'r', encoding='utf-8') as f:
-        content = f.read()
-        lines = content.split('\n')
-    
-    # Skip YAML frontmatter if present
-    start_line = 0
-    if content.startswith('---'):
-        # Find closing ---
-        end_match = re.search(r'\n---\n', content[3:])
-        if end_match:
-            frontmatter_end = end_match.end() + 3
-            start_line = content[:frontmatter_end].count('\n')
-    
-    # Extract URLs from each line
-    for line_idx, line in enumerate(lines):
-        if line_idx < start_line:
-            continue
-            
-        # Find all URLs in this line
-        for match in COMBINED_PATTERN.finditer(line):
-            url = match.group(0)
-            # Clean trailing punctuation
-            url = url.rstrip('.,;:!?)\'\"')
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return extracted  # mmap cannot map empty files
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            # Skip YAML frontmatter if present
+            body_start = 0
+            if buf.find(b'---', 0, 3) == 0:
+                # Find closing ---
+                end = _FRONTMATTER_END_B.search(buf, 3)
+                if end is not None:
+                    body_start = end.end()
             
-            platform = detect_platform(url)
-            context = extract_context(lines, line_idx)
+            # Newlines are only counted lazily, up to each match
+            line_number = 1  # 1-indexed
+            counted_to = 0
             
-            extracted.append(ExtractedURL(
-                url=url,
-                platform=platform,
-                source_file=path,
-                line_number=line_idx + 1,  # 1-indexed
-                context=context,
-            ))
+            # Scan the whole body in one pass (URLs never span lines)
+            for match in _iter_url_matches(buf, body_start):
+                # Decode just the match and let the str pattern decide the
+                # exact boundary (it also stops at non-ASCII whitespace)
+                url_match = COMBINED_PATTERN.match(match.group(0).decode('utf-8'))
+                url = url_match.group(0)
+                # Clean trailing punctuation
+                url = url.rstrip('.,;:!?)\'\"')
+                
+                start = match.start()
+                line_number += buf[counted_to:start].count(b'\n')
+                counted_to = start
+                line_start = buf.rfind(b'\n', 0, start) + 1
+                
+                platform = url_match.lastgroup or detect_platform(url)
+                context = extract_context(buf, line_start)
+                
+                extracted.append(ExtractedURL(
+                    url=url,
+                    platform=platform,
+                    source_file=path,
+                    line_number=line_number,
+                    context=context,
+                ))
     
     return extracted
 
 
-def scan_directory(path: Path, pattern: str = "*.md", recursive: bool = True) -> URLCollection:
+def _parse_md_file_safe(path: Path) -> tuple[Path, list[ExtractedURL], Optional[str]]:
+    """Parse a file, returning the error message instead of raising."""
+    try:
+        return path, parse_md_file(path), None
+    except Exception as e:
+        return path, [], str(e)
+
+
+def scan_directory(
+    path: Path,
+    pattern: str = "*.md",
+    recursive: bool = True,
+    max_workers: Optional[int] = None,
+) -> URLCollection:
     """
     Scan a directory for Markdown files and extract all URLs.
     
+    Files are parsed in a process pool once there are enough of them to
+    amortize worker start-up. Workers are spawned rather than forked, since
+    the viewer server calls this from threaded request handlers. Parsing
+    starts while the directory walk is still running; results are sorted by
+    file path once at the end.
+    
     Args:
         path: Directory path to scan
         pattern: Glob pattern for files (default: *.md)
         recursive: Whether to scan subdirectories
+        max_workers: Worker processes (default: CPU count, 1 = serial)
         
     Returns:
         URLCollection containing all extracted URLs
@@ -215,20 +359,40 @@ def scan_directory(path: Path, pattern: str = "*.md", recursive: bool = True) ->
     
     collection = URLCollection()
     
-    # Get matching files
-    if recursive:
-        files = list(path.rglob(pattern))
-    else:
-        files = list(path.glob(pattern))
+    def walk():
+        return path.rglob(pattern) if recursive else path.glob(pattern)
+    
+    # Only buffer enough paths to decide whether a pool is worth starting
+    files = walk()
+    head = list(islice(files, PARALLEL_MIN_FILES))
     
-    for file_path in sorted(files):
+    workers = max_workers or os.cpu_count() or 1
+    results = None
+    if workers > 1 and len(head) >= PARALLEL_MIN_FILES:
         try:
-            urls = parse_md_file(file_path)
-            for url in urls:
-                collection.add(url)
-        except Exception as e:
+            # fork() from a threaded process can deadlock in the child
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                # map() submits chunks as the walk yields them
+                results = list(executor.map(
+                    _parse_md_file_safe, chain(head, files), chunksize=8
+                ))
+        except (BrokenProcessPool, OSError, NotImplementedError):
+            # Process pools are unavailable on some platforms/sandboxes;
+            # the walk was partly consumed, so start it over
+            head, files = [], walk()
+    if results is None:
+        results = map(_parse_md_file_safe, chain(head, files))
+    
+    for file_path, urls, error in sorted(results, key=itemgetter(0)):
+        if error is not None:
             # Log error but continue processing
-            print(f"Warning: Error parsing {file_path}: {e}")
+            print(f"Warning: Error parsing {file_path}: {error}")
+            continue
+        for url in urls:
+            collection.add(url)
     
     return collection
 
@@ -243,17 +407,52 @@ def detect_duplicates(urls: list[ExtractedURL]) -> DuplicateReport:
     Returns:
         DuplicateReport with grouped duplicates
     """
-    # Group by normalized URL ID
-    by_id: dict[str, list[ExtractedURL]] = defaultdict(list)
-    
-    for url in urls:
-        by_id[url.id].append(url)
-    
-    # Filter to only those with duplicates
-    duplicates = {
-        url_id: url_list 
-        for url_id, url_list in by_id.items() 
-        if len(url_list) > 1
+    # Count by normalized URL ID first, so lists are only built for the
+    # (usually few) IDs that actually repeat
+    counts = Counter(url.id for url in urls)
+    duplicates: dict[str, list[ExtractedURL]] = {
+        url_id: []
+        for url_id, count in counts.items()
+        if count > 1
     }
     
+    if duplicates:
+        for url in urls:
+            group = duplicates.get(url.id)
+            if group is not None:
+                group.append(url)
+    
     return DuplicateReport(duplicates=duplicates)
+
+
+def analyze_urls(urls: list[ExtractedURL]) -> URLAnalysis:
+    """
+    Deduplicate URLs, group duplicates and count platforms in one pass.
+    
+    Equivalent to ``detect_duplicates`` plus ``URLCollection.unique_urls``
+    plus a platform count, without walking the list three times.
+    
+    Args:
+        urls: List of ExtractedURL objects
+        
+    Returns:
+        URLAnalysis; ``unique`` keeps the first occurrence of each ID, in order
+    """
+    first: dict[str, ExtractedURL] = {}
+    duplicates: dict[str, list[ExtractedURL]] = {}
+    by_platform: Counter = Counter()
+    
+    for url in urls:
+        original = first.setdefault(url.id, url)
+        if original is url:
+            by_platform[url.platform] += 1
+        elif url.id in duplicates:
+            duplicates[url.id].append(url)
+        else:
+            duplicates[url.id] = [original, url]
+    
+    return URLAnalysis(
+        unique=list(first.values()),
+        duplicates=DuplicateReport(duplicates=duplicates),
+        by_platform=by_platform,
+    )
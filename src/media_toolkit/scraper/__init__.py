@@ -1,11 +1,9 @@
 """Scraper module for extracting metadata from social media posts."""
 
+import importlib
+
 from .base import BaseScraper, ScrapeResult
-from .instagram import InstagramScraper
-from .facebook import FacebookScraper
-from .threads import ThreadsScraper
-from .linkedin import LinkedInScraper
-from .factory import get_scraper, scrape_url, list_supported_platforms
+from .factory import classify, get_scraper, scrape_url, scrape_urls, close_scrapers, list_supported_platforms
 
 __all__ = [
     "BaseScraper",
@@ -14,8 +12,27 @@ __all__ = [
     "FacebookScraper",
     "ThreadsScraper",
     "LinkedInScraper",
+    "classify",
     "get_scraper",
     "scrape_url",
+    "scrape_urls",
+    "close_scrapers",
     "list_supported_platforms",
 ]
 
+
+# Concrete scrapers are imported on first access (yt-dlp is slow to import)
+_LAZY_SCRAPERS = {
+    "InstagramScraper": ".instagram",
+    "FacebookScraper": ".facebook",
+    "ThreadsScraper": ".threads",
+    "LinkedInScraper": ".linkedin",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SCRAPERS:
+        value = getattr(importlib.import_module(_LAZY_SCRAPERS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,19 @@
 """Base scraper interface."""
 
+import asyncio
+import codecs
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional
 
+import aiohttp
+from lxml import etree, html as lxml_html
 
-@dataclass
+
+@dataclass(slots=True)
 class ScrapeResult:
     """Result of scraping a URL."""
     
@@ -41,11 +48,48 @@ class ScrapeResult:
     error_message: Optional[str] = None
 
 
+# End of the document head (meta tags live before it)
+_RE_HEAD_END = re.compile(r'</head\s*>', re.IGNORECASE | re.ASCII)
+
+# Characters kept between chunks so matches spanning a boundary are seen
+_CHUNK_OVERLAP = 128
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Request headers for HTML pages, shared read-only by every scraper instance
+_DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': DEFAULT_USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+})
+
+
 class BaseScraper(ABC):
     """Abstract base class for social media scrapers."""
     
     platform: str = "unknown"
     
+    # Hostnames a scraper handles (subdomains included), used to dispatch
+    # URLs without trying every scraper's regexes
+    HOSTS: tuple[str, ...] = ()
+    
+    # URL regexes a scraper handles, and the flags to match them with.
+    # Subclasses get them precompiled into one alternation as _URL_RE.
+    URL_PATTERNS: list[str] = []
+    URL_FLAGS: int = 0
+    _URL_RE: re.Pattern = re.compile(r'(?!)')  # Matches nothing
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'URL_PATTERNS' in cls.__dict__ or 'URL_FLAGS' in cls.__dict__:
+            cls._URL_RE = re.compile(
+                '|'.join(f'(?:{pattern})' for pattern in cls.URL_PATTERNS) or r'(?!)',
+                cls.URL_FLAGS,
+            )
+    
     def __init__(
         self,
         timeout: int = 30,
@@ -54,24 +98,54 @@ class BaseScraper(ABC):
         cookies_file: Optional[str] = None,  # Path to cookies.txt
     ):
         self.timeout = timeout
-        self.user_agent = user_agent or (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
         self.cookies_from_browser = cookies_from_browser
         self.cookies_file = cookies_file
+        
+        # HTML request headers, built once rather than per request
+        if self.user_agent == DEFAULT_USER_AGENT:
+            self._headers = _DEFAULT_HEADERS
+        else:
+            self._headers = MappingProxyType({**_DEFAULT_HEADERS, 'User-Agent': self.user_agent})
+        
+        # Pooled HTTP session, bound to the event loop that created it
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
     
-    def _get_cookie_args(self) -> list[str]:
-        """Get yt-dlp cookie arguments."""
-        args = []
-        if self.cookies_from_browser:
-            args.extend(['--cookies-from-browser', self.cookies_from_browser])
-        elif self.cookies_file:
-            args.extend(['--cookies', self.cookies_file])
-        return args
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the scraper's shared HTTP session.
+        
+        Reusing one session keeps TCP/TLS connections and DNS lookups alive
+        across URLs. A new session is made if the old one was closed or
+        belongs to another event loop.
+        
+        Returns:
+            aiohttp session for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=4,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session, if one is open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
     
+    @classmethod
     @abstractmethod
-    def supports(self, url: str) -> bool:
+    def supports(cls, url: str) -> bool:
         """
         Check if this scraper supports the given URL.
         
@@ -96,6 +170,101 @@ class BaseScraper(ABC):
         """
         pass
     
+    async def _read_html(
+        self,
+        response: aiohttp.ClientResponse,
+        stats_pattern: Optional[re.Pattern] = None,
+        chunk_size: int = 16384,
+    ) -> str:
+        """
+        Read and decode an HTML response incrementally.
+        
+        Reading stops early once ``</head>`` has been seen and every named
+        group of ``stats_pattern`` has matched, so the rest of a large page
+        is neither downloaded nor decoded.
+        
+        Args:
+            response: Open aiohttp response
+            stats_pattern: Alternation with one named group per wanted stat
+            chunk_size: Bytes per read
+            
+        Returns:
+            Decoded HTML (possibly truncated after the head and stats)
+        """
+        decoder = codecs.getincrementaldecoder(response.charset or 'utf-8')(errors='replace')
+        wanted = set(stats_pattern.groupindex) if stats_pattern else set()
+        found = set()
+        head_done = False
+        parts = []
+        tail = ''
+        
+        async for chunk in response.content.iter_chunked(chunk_size):
+            text = decoder.decode(chunk)
+            parts.append(text)
+            
+            window = tail + text
+            if not head_done:
+                head_done = _RE_HEAD_END.search(window) is not None
+            if wanted - found:
+                found.update(m.lastgroup for m in stats_pattern.finditer(window))
+            if head_done and found >= wanted:
+                return ''.join(parts)
+            tail = window[-_CHUNK_OVERLAP:]
+        
+        parts.append(decoder.decode(b'', final=True))
+        return ''.join(parts)
+    
+    def _parse_meta(self, html: str) -> dict[str, str]:
+        """
+        Collect <meta> tags into a dict in one parse.
+        
+        Args:
+            html: Page HTML
+            
+        Returns:
+            Mapping of ``property`` (or ``name``) to ``content``; the first
+            tag wins when a key repeats
+        """
+        try:
+            tree = lxml_html.fromstring(html)
+        except ValueError:
+            # str input with an XML encoding declaration; hand lxml bytes
+            tree = lxml_html.fromstring(
+                html.encode('utf-8'), parser=lxml_html.HTMLParser(encoding='utf-8')
+            )
+        except etree.ParserError:
+            return {}  # Empty document
+        
+        meta = {}
+        for tag in tree.iter('meta'):
+            key = tag.get('property') or tag.get('name')
+            content = tag.get('content')
+            if key and content is not None:
+                meta.setdefault(key, content)
+        return meta
+    
+    def _find_counts(self, pattern: re.Pattern, text: str) -> dict[str, int]:
+        """
+        Collect integer counts from one pass over ``text``.
+        
+        Args:
+            pattern: Alternation with one named digit group per count
+            text: Text to scan
+            
+        Returns:
+            First value found for each named group; scanning stops as soon
+            as every group has a value
+        """
+        wanted = len(pattern.groupindex)
+        counts = {}
+        for match in pattern.finditer(text):
+            name = match.lastgroup
+            if name not in counts:
+                counts[name] = int(match.group(name))
+                if len(counts) == wanted:
+                    break
+        return counts
+    
     def _clean_text(self, text: Optional[str]) -> Optional[str]:
         """Clean and normalize text content."""
         if not text:
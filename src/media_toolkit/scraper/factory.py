@@ -1,21 +1,187 @@
 """Scraper factory for selecting the appropriate scraper."""
 
+import asyncio
+import importlib
+import re
+import threading
 from typing import Optional
+from urllib.parse import urlsplit
+
+try:
+    import hyperscan  # Optional multi-pattern matcher (pip install media-toolkit[fast])
+except ImportError:
+    hyperscan = None
 
 from .base import BaseScraper, ScrapeResult
-from .instagram import InstagramScraper
-from .facebook import FacebookScraper
-from .threads import ThreadsScraper
-from .linkedin import LinkedInScraper
-
-
-# Registry of available scrapers
-_SCRAPERS: list[type[BaseScraper]] = [
-    InstagramScraper,
-    FacebookScraper,
-    ThreadsScraper,
-    LinkedInScraper,
+
+
+# Registry of available scrapers. Built-in ones are (module, class name)
+# pairs imported on first use, so importing the package does not pull in
+# yt-dlp until a URL is actually dispatched.
+_SCRAPERS: list = [
+    (".instagram", "InstagramScraper"),
+    (".facebook", "FacebookScraper"),
+    (".threads", "ThreadsScraper"),
+    (".linkedin", "LinkedInScraper"),
 ]
+_scrapers_resolved = False
+
+
+def _scraper_classes() -> list[type[BaseScraper]]:
+    """Return the registered scraper classes, importing lazy entries once."""
+    global _scrapers_resolved
+    if not _scrapers_resolved:
+        for i, entry in enumerate(_SCRAPERS):
+            if isinstance(entry, tuple):
+                module_name, class_name = entry
+                _SCRAPERS[i] = getattr(importlib.import_module(module_name, __package__), class_name)
+        _scrapers_resolved = True
+    return _SCRAPERS
+
+
+# Scraper instances per (class, constructor kwargs); scrapers hold only
+# configuration, so one instance can serve every URL with the same settings
+_INSTANCES: dict[tuple, BaseScraper] = {}
+
+
+# Dispatch tables, rebuilt lazily after register_scraper:
+# - hostname -> scraper class, from each scraper's HOSTS
+# - Hyperscan database over the URL patterns (pattern id = index in _SCRAPERS)
+_HOST_INDEX: dict[str, type[BaseScraper]] = {}
+_hs_db = None
+_dispatch_stale = True
+_hs_local = threading.local()  # Scratch space must not be shared across threads
+
+
+def _build_hyperscan_db():
+    """Compile every scraper's URL alternation into one Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    indexed = [(i, cls) for i, cls in enumerate(_scraper_classes()) if cls.URL_PATTERNS]
+    if not indexed:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[cls._URL_RE.pattern.encode('ascii') for _, cls in indexed],
+            ids=[i for i, _ in indexed],
+            elements=len(indexed),
+            flags=[
+                hyperscan.HS_FLAG_SINGLEMATCH
+                | (hyperscan.HS_FLAG_CASELESS if cls.URL_FLAGS & re.IGNORECASE else 0)
+                for _, cls in indexed
+            ],
+        )
+        return db
+    except (hyperscan.error, UnicodeEncodeError):
+        return None
+
+
+def _refresh_dispatch() -> None:
+    """Rebuild the host index and Hyperscan database if the registry changed."""
+    global _hs_db, _dispatch_stale
+    if not _dispatch_stale:
+        return
+    
+    _HOST_INDEX.clear()
+    for scraper_class in _scraper_classes():
+        for host in scraper_class.HOSTS:
+            _HOST_INDEX.setdefault(host.lower(), scraper_class)  # First registered wins
+    _hs_db = _build_hyperscan_db()
+    _dispatch_stale = False
+
+
+def _lookup_host(host: str) -> Optional[type[BaseScraper]]:
+    """Find the scraper registered for ``host`` or any parent domain of it."""
+    while host:
+        scraper_class = _HOST_INDEX.get(host)
+        if scraper_class is not None:
+            return scraper_class
+        host = host.partition('.')[2]
+    return None
+
+
+def classify(url: str) -> Optional[type[BaseScraper]]:
+    """
+    Find the scraper class that handles a URL.
+    
+    The URL's hostname is looked up in an index built from each scraper's
+    ``HOSTS``, and only that scraper's ``supports`` is checked. URLs on
+    other hosts fall back to pattern matching: one Hyperscan scan when
+    installed, otherwise each class's ``supports`` in turn (registration
+    order decides ties).
+    
+    Args:
+        url: URL to classify
+        
+    Returns:
+        Matching scraper class, or None
+    """
+    _refresh_dispatch()
+    
+    try:
+        host = urlsplit(url).hostname or ''
+    except ValueError:
+        host = ''
+    scraper_class = _lookup_host(host)
+    if scraper_class is not None:
+        # Host is known; the regex only has to check the path
+        return scraper_class if scraper_class.supports(url) else None
+    
+    return _classify_by_pattern(url)
+
+
+def _classify_by_pattern(url: str) -> Optional[type[BaseScraper]]:
+    """Match a URL against every registered scraper's patterns."""
+    db = _hs_db
+    if db is None:
+        # A host substring test rejects foreign URLs far faster than the
+        # regex engine, so only run supports() where the host appears
+        lowered = url.lower()
+        for scraper_class in _scraper_classes():
+            for host in scraper_class.HOSTS:
+                if host in lowered:
+                    break
+            else:
+                if scraper_class.HOSTS:
+                    continue
+            if scraper_class.supports(url):
+                return scraper_class
+        return None
+    
+    try:
+        data = url.encode('ascii')
+    except UnicodeEncodeError:
+        data = url.encode('utf-8')
+    
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None or _hs_local.db is not db:
+        scratch = _hs_local.scratch = hyperscan.Scratch(db)
+        _hs_local.db = db
+    
+    hits = set()
+    db.scan(
+        data,
+        match_event_handler=lambda id_, _start, _end, _flags, _ctx: hits.add(id_),
+        scratch=scratch,
+    )
+    
+    for i, scraper_class in enumerate(_scraper_classes()):
+        if scraper_class.URL_PATTERNS:
+            if i in hits:
+                return scraper_class
+        elif scraper_class.supports(url):
+            return scraper_class  # Custom supports() not covered by the database
+    return None
+
+
+def _get_instance(scraper_class: type[BaseScraper], kwargs: dict) -> BaseScraper:
+    """Return the cached instance of a scraper class for the given kwargs."""
+    key = (scraper_class, tuple(sorted(kwargs.items())))
+    scraper = _INSTANCES.get(key)
+    if scraper is None:
+        scraper = _INSTANCES[key] = scraper_class(**kwargs)
+    return scraper
 
 
 def get_scraper(url: str, **kwargs) -> Optional[BaseScraper]:
@@ -27,13 +193,14 @@ def get_scraper(url: str, **kwargs) -> Optional[BaseScraper]:
         **kwargs: Additional arguments passed to scraper constructor
         
     Returns:
-        Scraper instance or None if no matching scraper
+        Scraper instance (shared across calls with the same kwargs) or None
+        if no matching scraper
     """
-    for scraper_class in _SCRAPERS:
-        scraper = scraper_class(**kwargs)
-        if scraper.supports(url):
-            return scraper
-    return None
+    # Match on the class so only the chosen scraper is ever constructed
+    scraper_class = classify(url)
+    if scraper_class is None:
+        return None
+    return _get_instance(scraper_class, kwargs)
 
 
 async def scrape_url(url: str, **kwargs) -> ScrapeResult:
@@ -59,6 +226,33 @@ async def scrape_url(url: str, **kwargs) -> ScrapeResult:
     return await scraper.scrape(url)
 
 
+async def scrape_urls(urls: list[str], concurrency: int = 8, **kwargs) -> list[ScrapeResult]:
+    """
+    Scrape many URLs concurrently.
+    
+    Args:
+        urls: URLs to scrape
+        concurrency: Maximum number of scrapes in flight
+        **kwargs: Additional arguments passed to scraper
+        
+    Returns:
+        ScrapeResults in the same order as ``urls``
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def scrape_one(url: str) -> ScrapeResult:
+        async with semaphore:
+            return await scrape_url(url, **kwargs)
+    
+    return await asyncio.gather(*(scrape_one(url) for url in urls))
+
+
+async def close_scrapers() -> None:
+    """Close HTTP sessions held by cached scraper instances."""
+    for scraper in _INSTANCES.values():
+        await scraper.close()
+
+
 def register_scraper(scraper_class: type[BaseScraper]) -> None:
     """
     Register a new scraper class.
@@ -66,13 +260,15 @@ def register_scraper(scraper_class: type[BaseScraper]) -> None:
     Args:
         scraper_class: Scraper class to register
     """
-    if scraper_class not in _SCRAPERS:
+    global _dispatch_stale
+    if scraper_class not in _scraper_classes():
         _SCRAPERS.append(scraper_class)
+        _dispatch_stale = True
 
 
 def list_supported_platforms() -> list[str]:
     """List all supported platforms."""
     platforms = set()
-    for scraper_class in _SCRAPERS:
+    for scraper_class in _scraper_classes():
         platforms.add(scraper_class.platform)
     return sorted(platforms)
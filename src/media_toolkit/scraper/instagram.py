@@ -1,13 +1,14 @@
 """Instagram scraper using yt-dlp."""
 
 import asyncio
-import json
-import subprocess
 import re
 from datetime import datetime
 from typing import Optional
 
+from yt_dlp.utils import DownloadError
+
 from .base import BaseScraper, ScrapeResult
+from .ytdlp_api import extract_info
 
 
 class InstagramScraper(BaseScraper):
@@ -15,6 +16,8 @@ class InstagramScraper(BaseScraper):
     
     platform = "instagram"
     
+    HOSTS = ('instagram.com',)
+    
     # URL patterns for Instagram
     URL_PATTERNS = [
         r'instagram\.com/p/',
@@ -22,10 +25,12 @@ class InstagramScraper(BaseScraper):
         r'instagram\.com/stories/',
         r'instagram\.com/tv/',
     ]
+    URL_FLAGS = re.IGNORECASE | re.ASCII  # URLs are ASCII; skip Unicode case folding
     
-    def supports(self, url: str) -> bool:
+    @classmethod
+    def supports(cls, url: str) -> bool:
         """Check if URL is an Instagram URL."""
-        return any(re.search(pattern, url, re.IGNORECASE) for pattern in self.URL_PATTERNS)
+        return cls._URL_RE.search(url) is not None
     
     async def scrape(self, url: str) -> ScrapeResult:
         """
@@ -35,73 +40,43 @@ class InstagramScraper(BaseScraper):
         for public posts. Private posts will fail.
         """
         try:
-            # Use yt-dlp to extract metadata (JSON only, no download)
-            cmd = [
-                'yt-dlp',
-                '--dump-json',
-                '--no-download',
-                '--no-warnings',
-            ]
-            # Add cookie authentication if configured
-            cmd.extend(self._get_cookie_args())
-            cmd.append(url)
-            
-            # Run yt-dlp asynchronously
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            # Use the yt-dlp API in a worker thread (no process spawn or JSON round-trip)
+            data = await asyncio.wait_for(
+                asyncio.to_thread(
+                    extract_info,
+                    url,
+                    cookies_from_browser=self.cookies_from_browser,
+                    cookies_file=self.cookies_file,
+                ),
                 timeout=self.timeout,
             )
             
-            if process.returncode != 0:
-                error_msg = stderr.decode('utf-8', errors='ignore').strip()
-                
-                # Check for specific error types
-                if 'login' in error_msg.lower() or 'private' in error_msg.lower():
-                    return ScrapeResult(
-                        success=False,
-                        url=url,
-                        platform=self.platform,
-                        error_message="Private or login required",
-                    )
-                
+            return self._parse_ytdlp_result(url, data)
+            
+        except DownloadError as e:
+            error_msg = str(e).strip()
+            
+            # Check for specific error types
+            if 'login' in error_msg.lower() or 'private' in error_msg.lower():
                 return ScrapeResult(
                     success=False,
                     url=url,
                     platform=self.platform,
-                    error_message=f"yt-dlp failed: {error_msg[:200]}",
+                    error_message="Private or login required",
                 )
             
-            # Parse JSON output
-            data = json.loads(stdout.decode('utf-8'))
-            
-            return self._parse_ytdlp_result(url, data)
-            
-        except asyncio.TimeoutError:
-            return ScrapeResult(
-                success=False,
-                url=url,
-                platform=self.platform,
-                error_message=f"Timeout after {self.timeout}s",
-            )
-        except json.JSONDecodeError as e:
             return ScrapeResult(
                 success=False,
                 url=url,
                 platform=self.platform,
-                error_message=f"Invalid JSON response: {e}",
+                error_message=f"yt-dlp failed: {error_msg[:200]}",
             )
-        except FileNotFoundError:
+        except asyncio.TimeoutError:
             return ScrapeResult(
                 success=False,
                 url=url,
                 platform=self.platform,
-                error_message="yt-dlp not installed. Run: pip install yt-dlp",
+                error_message=f"Timeout after {self.timeout}s",
             )
         except Exception as e:
             return ScrapeResult(
@@ -112,7 +87,7 @@ class InstagramScraper(BaseScraper):
             )
     
     def _parse_ytdlp_result(self, url: str, data: dict) -> ScrapeResult:
-        """Parse yt-dlp JSON output into ScrapeResult."""
+        """Parse a yt-dlp info dict into ScrapeResult."""
         
         # Extract author
         author = data.get('uploader') or data.get('channel')
@@ -127,7 +102,10 @@ class InstagramScraper(BaseScraper):
         upload_date = data.get('upload_date')  # Format: YYYYMMDD
         if upload_date and len(upload_date) == 8:
             try:
-                posted_at = datetime.strptime(upload_date, '%Y%m%d')
+                # Fixed YYYYMMDD: slicing is much cheaper than strptime
+                posted_at = datetime(
+                    int(upload_date[:4]), int(upload_date[4:6]), int(upload_date[6:8])
+                )
             except ValueError:
                 pass
         
@@ -8,11 +8,20 @@ import aiohttp
 from .base import BaseScraper, ScrapeResult
 
 
+# Precompiled patterns for _parse_html
+_RE_AUTHOR_TITLE = re.compile(r'^(.+?) on LinkedIn')
+_RE_STATS = re.compile(
+    r'"numLikes":\s*(?P<likes>\d+)|"numComments":\s*(?P<comments>\d+)'
+)
+
+
 class LinkedInScraper(BaseScraper):
     """Scraper for LinkedIn posts."""
     
     platform = "linkedin"
     
+    HOSTS = ('linkedin.com',)
+    
     # URL patterns for LinkedIn
     URL_PATTERNS = [
         r'linkedin\.com/posts/',
@@ -21,30 +30,27 @@ class LinkedInScraper(BaseScraper):
         r'linkedin\.com/video/',
     ]
     
-    def supports(self, url: str) -> bool:
+    @classmethod
+    def supports(cls, url: str) -> bool:
         """Check if URL is a LinkedIn post."""
-        return any(re.search(pattern, url) for pattern in self.URL_PATTERNS)
+        return cls._URL_RE.search(url) is not None
     
     async def scrape(self, url: str) -> ScrapeResult:
         """Scrape metadata from a LinkedIn post."""
         try:
-            headers = {
-                'User-Agent': self.user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        return ScrapeResult(
-                            success=False,
-                            url=url,
-                            platform=self.platform,
-                            error_message=f"HTTP {response.status}",
-                        )
-                    
-                    html = await response.text()
+            session = self._get_session()
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with session.get(url, headers=self._headers, timeout=timeout) as response:
+                if response.status != 200:
+                    return ScrapeResult(
+                        success=False,
+                        url=url,
+                        platform=self.platform,
+                        error_message=f"HTTP {response.status}",
+                    )
+                
+                # Stop reading once the head and the stats have arrived
+                html = await self._read_html(response, _RE_STATS)
             
             # Extract data from HTML
             result = self._parse_html(html, url)
@@ -68,33 +74,27 @@ class LinkedInScraper(BaseScraper):
     def _parse_html(self, html: str, url: str) -> ScrapeResult:
         """Parse LinkedIn HTML for metadata."""
         # Extract from Open Graph meta tags
-        title = self._extract_meta(html, 'og:title')
-        content = self._extract_meta(html, 'og:description')
-        thumbnail = self._extract_meta(html, 'og:image')
+        meta = self._parse_meta(html)
+        title = meta.get('og:title')
+        content = meta.get('og:description')
+        thumbnail = meta.get('og:image')
         
         # Try to extract author from title or page
         author = None
         if title:
             # LinkedIn titles often format as "Author Name on LinkedIn: content..."
-            author_match = re.match(r'^(.+?) on LinkedIn', title)
+            author_match = _RE_AUTHOR_TITLE.match(title)
             if author_match:
                 author = author_match.group(1)
         
         # Try to extract from article:author
         if not author:
-            author = self._extract_meta(html, 'article:author')
+            author = meta.get('article:author')
         
-        # Try to extract reactions count
-        likes = None
-        reactions_match = re.search(r'"numLikes":\s*(\d+)', html)
-        if reactions_match:
-            likes = int(reactions_match.group(1))
-        
-        # Comments
-        comments = None
-        comments_match = re.search(r'"numComments":\s*(\d+)', html)
-        if comments_match:
-            comments = int(comments_match.group(1))
+        # Reactions and comments counts, in a single scan
+        counts = self._find_counts(_RE_STATS, html)
+        likes = counts.get('likes')
+        comments = counts.get('comments')
         
         return ScrapeResult(
             success=True,
@@ -107,22 +107,3 @@ class LinkedInScraper(BaseScraper):
             comments=comments,
             thumbnail_url=thumbnail,
         )
-    
-    def _extract_meta(self, html: str, property_name: str) -> Optional[str]:
-        """Extract content from meta tag."""
-        # Try property attribute
-        pattern = rf'<meta[^>]+property="{property_name}"[^>]+content="([^"]*)"'
-        match = re.search(pattern, html, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        
-        # Try alternate format
-        pattern = rf'<meta[^>]+content="([^"]*)"[^>]+property="{property_name}"'
-        match = re.search(pattern, html, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        
-        # Try name attribute (LinkedIn sometimes uses this)
-        pattern = rf'<meta[^>]+name="{property_name}"[^>]+content="([^"]*)"'
-        match = re.search(pattern, html, re.IGNORECASE)
-        return match.group(1) if match else None
@@ -8,41 +8,47 @@ import aiohttp
 from .base import BaseScraper, ScrapeResult
 
 
+# Precompiled patterns for _parse_html
+_RE_AUTHOR = re.compile(r'threads\.net/@([\w.]+)')
+_RE_STATS = re.compile(
+    r'"likeCount":\s*(?P<likes>\d+)|"replyCount":\s*(?P<replies>\d+)'
+)
+
+
 class ThreadsScraper(BaseScraper):
     """Scraper for Threads posts."""
     
     platform = "threads"
     
+    HOSTS = ('threads.net',)
+    
     # URL patterns for Threads
     URL_PATTERNS = [
         r'threads\.net/@[\w.]+/post/[\w-]+',
         r'threads\.net/t/[\w-]+',
     ]
     
-    def supports(self, url: str) -> bool:
+    @classmethod
+    def supports(cls, url: str) -> bool:
         """Check if URL is a Threads post."""
-        return any(re.search(pattern, url) for pattern in self.URL_PATTERNS)
+        return cls._URL_RE.search(url) is not None
     
     async def scrape(self, url: str) -> ScrapeResult:
         """Scrape metadata from a Threads post."""
         try:
-            headers = {
-                'User-Agent': self.user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        return ScrapeResult(
-                            success=False,
-                            url=url,
-                            platform=self.platform,
-                            error_message=f"HTTP {response.status}",
-                        )
-                    
-                    html = await response.text()
+            session = self._get_session()
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with session.get(url, headers=self._headers, timeout=timeout) as response:
+                if response.status != 200:
+                    return ScrapeResult(
+                        success=False,
+                        url=url,
+                        platform=self.platform,
+                        error_message=f"HTTP {response.status}",
+                    )
+                
+                # Stop reading once the head and the stats have arrived
+                html = await self._read_html(response, _RE_STATS)
             
             # Extract data from HTML
             result = self._parse_html(html, url)
@@ -66,25 +72,19 @@ class ThreadsScraper(BaseScraper):
     def _parse_html(self, html: str, url: str) -> ScrapeResult:
         """Parse Threads HTML for metadata."""
         # Extract author from URL
-        author_match = re.search(r'threads\.net/@([\w.]+)', url)
+        author_match = _RE_AUTHOR.search(url)
         author = f"@{author_match.group(1)}" if author_match else None
         
         # Try to extract from meta tags
-        title = self._extract_meta(html, 'og:title')
-        content = self._extract_meta(html, 'og:description')
-        thumbnail = self._extract_meta(html, 'og:image')
+        meta = self._parse_meta(html)
+        title = meta.get('og:title')
+        content = meta.get('og:description')
+        thumbnail = meta.get('og:image')
         
-        # Try to parse likes/replies from content
-        likes = None
-        comments = None
-        
-        likes_match = re.search(r'"likeCount":\s*(\d+)', html)
-        if likes_match:
-            likes = int(likes_match.group(1))
-        
-        replies_match = re.search(r'"replyCount":\s*(\d+)', html)
-        if replies_match:
-            comments = int(replies_match.group(1))
+        # Try to parse likes/replies from content, in a single scan
+        counts = self._find_counts(_RE_STATS, html)
+        likes = counts.get('likes')
+        comments = counts.get('replies')
         
         return ScrapeResult(
             success=True,
@@ -97,15 +97,3 @@ class ThreadsScraper(BaseScraper):
             comments=comments,
             thumbnail_url=thumbnail,
         )
-    
-    def _extract_meta(self, html: str, property_name: str) -> Optional[str]:
-        """Extract content from meta tag."""
-        pattern = rf'<meta[^>]+property="{property_name}"[^>]+content="([^"]*)"'
-        match = re.search(pattern, html, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        
-        # Try alternate format
-        pattern = rf'<meta[^>]+content="([^"]*)"[^>]+property="{property_name}"'
-        match = re.search(pattern, html, re.IGNORECASE)
-        return match.group(1) if match else None
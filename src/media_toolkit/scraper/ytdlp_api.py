@@ -0,0 +1,71 @@
+"""In-process yt-dlp metadata extraction shared by the yt-dlp based scrapers."""
+
+import atexit
+import threading
+from typing import Optional
+
+import yt_dlp
+
+
+# One YoutubeDL per (worker thread, cookie settings); instances are not thread-safe
+_local = threading.local()
+
+
+class _QuietLogger:
+    """Swallow yt-dlp log output; errors surface as DownloadError instead."""
+
+    def debug(self, msg: str) -> None:
+        pass
+
+    info = warning = error = debug
+
+
+def _get_ydl(cookies_from_browser: Optional[str], cookies_file: Optional[str]) -> yt_dlp.YoutubeDL:
+    """Return this thread's metadata-only YoutubeDL, creating it on first use."""
+    cache = getattr(_local, 'ydl', None)
+    if cache is None:
+        cache = _local.ydl = {}
+
+    key = (cookies_from_browser, cookies_file)
+    ydl = cache.get(key)
+    if ydl is None:
+        ydl_opts = {
+            'quiet': True,
+            'no_warnings': True,
+            'skip_download': True,
+            'logger': _QuietLogger(),
+        }
+        # Same precedence as the old CLI flags: browser cookies win
+        if cookies_from_browser:
+            ydl_opts['cookiesfrombrowser'] = (cookies_from_browser, )
+        elif cookies_file:
+            ydl_opts['cookiefile'] = cookies_file
+
+        ydl = cache[key] = yt_dlp.YoutubeDL(ydl_opts)
+        atexit.register(ydl.close)
+    return ydl
+
+
+def extract_info(
+    url: str,
+    cookies_from_browser: Optional[str] = None,
+    cookies_file: Optional[str] = None,
+) -> dict:
+    """
+    Extract metadata for a URL without downloading (blocking).
+
+    Run it in a worker thread (``asyncio.to_thread``) from async code.
+
+    Args:
+        url: URL to extract
+        cookies_from_browser: Browser to load cookies from (e.g. "chrome")
+        cookies_file: Path to a cookies.txt file
+
+    Returns:
+        yt-dlp info dict
+
+    Raises:
+        yt_dlp.utils.DownloadError: If extraction fails
+    """
+    ydl = _get_ydl(cookies_from_browser, cookies_file)
+    return ydl.extract_info(url, download=False)
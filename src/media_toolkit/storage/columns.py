@@ -0,0 +1,158 @@
+"""Columnar (NumPy) view of the post index for vectorized list_posts."""
+
+from datetime import datetime
+from typing import Optional
+
+try:
+    import numpy as np  # Optional: vectorized filtering/sorting (pip install media-toolkit[fast])
+except ImportError:
+    np = None
+
+from .models import FilterOptions
+
+
+# Index fields filtered by membership, stored as integer codes
+CATEGORICAL_FIELDS = ("platform", "status", "author", "category", "media_type")
+
+# Sort keys with a numeric column; any other key is sorted in Python
+COUNT_FIELDS = ("views", "likes", "comments", "shares")
+DATE_FIELDS = ("posted_at", "scraped_at")
+
+
+def _timestamp(value: Optional[str]) -> float:
+    """ISO datetime string to POSIX seconds; missing values sort first."""
+    return datetime.fromisoformat(value).timestamp() if value else -np.inf
+
+
+class PostColumns:
+    """
+    Index entries laid out as one NumPy array per filterable field.
+
+    Built from a snapshot of the index and thrown away when it changes, so
+    list_posts masks and sorts in C instead of looping over dicts.
+    """
+
+    def __init__(self, index: dict[str, dict], tag_blooms: dict[str, int]):
+        """
+        Build the columns.
+
+        Args:
+            index: post_id -> index entry
+            tag_blooms: post_id -> tag Bloom filter
+        """
+        count = len(index)
+        self.ids = list(index)
+        self.metas = list(index.values())
+
+        self._codes: dict[str, "np.ndarray"] = {}
+        self._vocab: dict[str, dict] = {}
+        for field in CATEGORICAL_FIELDS:
+            vocab = {}
+            self._codes[field] = np.fromiter(
+                (vocab.setdefault(meta.get(field), len(vocab)) for meta in self.metas),
+                dtype=np.int32, count=count,
+            )
+            self._vocab[field] = vocab
+
+        self._numbers: dict[str, "np.ndarray"] = {}
+        for field in COUNT_FIELDS:
+            self._numbers[field] = np.fromiter(
+                (meta.get(field) or 0 for meta in self.metas), dtype=np.float64, count=count,
+            )
+        for field in DATE_FIELDS:
+            self._numbers[field] = np.fromiter(
+                (_timestamp(meta.get(field)) for meta in self.metas), dtype=np.float64, count=count,
+            )
+
+        self._tag_blooms = np.fromiter(
+            (tag_blooms[post_id] for post_id in self.ids), dtype=np.uint64, count=count,
+        )
+
+    def _isin(self, field: str, values: list) -> "np.ndarray":
+        """Mask of entries whose ``field`` is one of ``values`` (enums allowed)."""
+        vocab = self._vocab[field]
+        codes = [vocab[v] for v in (getattr(v, "value", v) for v in values) if v in vocab]
+        return np.isin(self._codes[field], codes)
+
+    def match(
+        self,
+        filters: FilterOptions,
+        tag_bloom: int,
+        search_ids: Optional[set[str]] = None,
+    ) -> "np.ndarray":
+        """
+        Find the entries matching the filters.
+
+        Args:
+            filters: Filter options (sorting and pagination are ignored)
+            tag_bloom: Bloom filter of ``filters.tags``
+            search_ids: IDs matching ``filters.search_query``, if one is set
+
+        Returns:
+            Positions of the matching entries, in index order
+        """
+        if search_ids is None:
+            mask = np.ones(len(self.ids), dtype=bool)
+        else:
+            mask = np.fromiter(
+                (post_id in search_ids for post_id in self.ids), dtype=bool, count=len(self.ids),
+            )
+
+        for field, values in (
+            ("platform", filters.platforms),
+            ("status", filters.statuses),
+            ("author", filters.authors),
+            ("category", filters.categories),
+            ("media_type", filters.media_types),
+        ):
+            if values:
+                mask &= self._isin(field, values)
+
+        if filters.posted_after or filters.posted_before:
+            posted_at = self._numbers["posted_at"]
+            mask &= np.isfinite(posted_at)
+            if filters.posted_after:
+                mask &= posted_at >= filters.posted_after.timestamp()
+            if filters.posted_before:
+                mask &= posted_at <= filters.posted_before.timestamp()
+
+        positions = np.flatnonzero(mask)
+
+        # Tags (match any): the bloom rejects most posts, survivors are checked exactly
+        if filters.tags:
+            positions = positions[(self._tag_blooms[positions] & np.uint64(tag_bloom)) != 0]
+            wanted = set(filters.tags)
+            positions = [
+                i for i in positions.tolist()
+                if not wanted.isdisjoint(self.metas[i].get("tags") or ())
+            ]
+            positions = np.asarray(positions, dtype=np.intp)
+
+        return positions
+
+    def page(self, positions: "np.ndarray", filters: FilterOptions) -> list[str]:
+        """
+        Sort and paginate matched entries.
+
+        Args:
+            positions: Result of ``match``
+            filters: Sort and pagination options
+
+        Returns:
+            IDs of the requested page, in order
+        """
+        # Stable sort either way, so ties keep index order like list.sort
+        sort_key = filters.sort_by
+        if sort_key in self._numbers:
+            keys = self._numbers[sort_key][positions]
+            order = np.argsort(-keys if filters.sort_desc else keys, kind="stable")
+            positions = positions[order].tolist()
+        else:
+            positions = sorted(
+                positions.tolist(),
+                key=lambda i: self.metas[i].get(sort_key) or "",
+                reverse=filters.sort_desc,
+            )
+
+        page = positions[filters.offset:filters.offset + filters.limit]
+        return [self.ids[i] for i in page]
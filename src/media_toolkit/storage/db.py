@@ -1,50 +1,370 @@
-"""JSON-based database for storing posts."""
+"""Markdown + SQLite database for storing posts."""
 
-import json
+import gzip
+import heapq
+import os
+import shutil
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
-from collections import defaultdict
+from typing import Iterable, Iterator, Optional
+from collections import Counter, OrderedDict
 
+from . import columns
 from .models import Post, PostStatus, Platform, Statistics, FilterOptions
+from ..utils.fileio import atomic_write_bytes
 import frontmatter
+from frontmatter.default_handlers import YAMLHandler
+import orjson
+import yaml
+from pydantic import TypeAdapter
 
 
+# Index fields stored per post (besides the id), in table column order
+INDEX_COLUMNS = (
+    "url", "platform", "author", "status", "posted_at", "scraped_at", "tags",
+    "category", "has_media", "media_type", "views", "likes", "comments", "thumbnail_path",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    url TEXT,
+    platform TEXT,
+    author TEXT,
+    status TEXT,
+    posted_at TEXT,
+    scraped_at TEXT,
+    tags TEXT,  -- JSON array
+    category TEXT,
+    has_media INTEGER,
+    media_type TEXT,
+    views INTEGER,
+    likes INTEGER,
+    comments INTEGER,
+    thumbnail_path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_posts_platform ON posts(platform);
+CREATE INDEX IF NOT EXISTS idx_posts_status ON posts(status);
+CREATE INDEX IF NOT EXISTS idx_posts_author ON posts(author);
+CREATE INDEX IF NOT EXISTS idx_posts_posted_at ON posts(posted_at);
+CREATE INDEX IF NOT EXISTS idx_posts_scraped_at ON posts(scraped_at);
+"""
+
+# Updates in place (not INSERT OR REPLACE) so a post keeps its rowid, which
+# links it to its post_text row
+_UPSERT_SQL = (
+    f"INSERT INTO posts (id, {', '.join(INDEX_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(INDEX_COLUMNS) + 1))}) "
+    f"ON CONFLICT(id) DO UPDATE SET "
+    f"{', '.join(f'{col} = excluded.{col}' for col in INDEX_COLUMNS)}"
+)
+
+# Searchable text (title, content, author) per post, keyed by posts.rowid.
+# A trigram FTS5 table answers substring LIKE queries from its index (and
+# works for text without spaces between words); SQLite builds without FTS5
+# get a plain table, searched by scanning.
+_TEXT_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS post_text USING fts5(text, tokenize='trigram')"
+_TEXT_SCHEMA_FALLBACK = "CREATE TABLE IF NOT EXISTS post_text (text TEXT)"
+_DELETE_TEXT_SQL = "DELETE FROM post_text WHERE rowid = (SELECT rowid FROM posts WHERE id = ?)"
+_INSERT_TEXT_SQL = "INSERT INTO post_text (rowid, text) SELECT rowid, ? FROM posts WHERE id = ?"
+
+
+class _YAMLHandler(YAMLHandler):
+    """frontmatter's YAML handler, parsing with libyaml when it is available."""
+    
+    def load(self, fm: str, **kwargs):
+        kwargs.setdefault("Loader", getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        return super().load(fm, **kwargs)
+
+
+# Same YAML settings frontmatter.dump uses, for header-only rewrites
+_YAML = _YAMLHandler()
+
+# reindex reads many small files; threads overlap the open/read latency
+REINDEX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Threads for loading a page of posts; file reads release the GIL
+_READ_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix="post-read")
+
+# Distinct filters whose match counts are remembered between index changes
+COUNT_CACHE_SIZE = 256
+
+# Parsed posts kept by get_post (dashboard pages re-read the same posts)
+POST_CACHE_SIZE = 2048
+
+# Accepted values of Database(synchronous=...)
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Encodes one post to JSON bytes in pydantic-core
+_POST_JSON = TypeAdapter(Post)
+
 
 class Database:
-    """JSON file-based database for posts."""
+    """Database of posts: one Markdown file each, indexed in SQLite."""
     
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self,
+        data_dir: Path,
+        flush_delay: Optional[float] = None,
+        synchronous: str = "NORMAL",
+    ):
         """
         Initialize the database.
         
         Args:
             data_dir: Root directory for data storage
+            flush_delay: If set, writes outside ``batch()`` persist the index
+                this many seconds later (coalescing bursts) instead of at once
+            synchronous: SQLite ``synchronous`` level for the index. "OFF"
+                suits one-shot imports, since the index can be rebuilt from
+                the post files with ``reindex``
         """
+        if synchronous.upper() not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unknown synchronous level: {synchronous}")
+        
         self.data_dir = Path(data_dir)
         self.posts_dir = self.data_dir / "posts"
-        self.index_file = self.data_dir / "index.json"
+        self.index_db_file = self.data_dir / "index.sqlite"
+        self.legacy_index_file = self.data_dir / "index.json"
         self.stats_file = self.data_dir / "stats.json"
         
         # Ensure directories exist
         self.posts_dir.mkdir(parents=True, exist_ok=True)
         
+        # Index store; also used from the debounced flush thread (guarded by _lock)
+        self._conn = sqlite3.connect(
+            self.index_db_file, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={synchronous.upper()}")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-20000")  # KiB
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.execute(_TEXT_SCHEMA)
+        except sqlite3.OperationalError:
+            self._conn.execute(_TEXT_SCHEMA_FALLBACK)
+        
         # In-memory index for fast lookups
         self._index: dict[str, dict] = {}
+        # Bumped on every index change; callers key derived caches on it
+        self.version = 0
         self._load_index()
+        
+        # Aggregates over the index, kept in step with every change so the
+        # tag/author lists, stats and analytics never rescan all posts
+        self._rebuild_aggregates()
+        
+        # Writes only record which IDs changed; flush() stores them in one
+        # transaction (and rewrites data.js) once per batch or debounce window
+        self.flush_delay = flush_delay
+        self._pending: set[str] = set()
+        self._pending_text: dict[str, Optional[str]] = {}  # post_id -> search text (None: removed)
+        self._rewrite = False  # Whole index replaced; rewrite the table
+        self._batch_depth = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        
+        # Post files written since the last durable_barrier(), not yet fsynced
+        self._unsynced: set[Path] = set()
+        
+        # post_id -> parsed post (and its JSON), least recently used first
+        self._post_cache: OrderedDict[str, _CachedPost] = OrderedDict()
     
     def _load_index(self) -> None:
-        """Load the index from disk."""
-        if self.index_file.exists():
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                self._index = json.load(f)
-        else:
-            self._index = {}
+        """Load the index from SQLite, importing a legacy index.json once."""
+        rows = self._conn.execute(f"SELECT id, {', '.join(INDEX_COLUMNS)} FROM posts").fetchall()
+        self._index = {row[0]: _meta_from_row(row) for row in rows}
+        
+        if not self._index and self.legacy_index_file.exists():
+            self._index = orjson.loads(self.legacy_index_file.read_bytes())
+            with self._transaction():
+                self._conn.executemany(
+                    _UPSERT_SQL, [_row_from_meta(pid, meta) for pid, meta in self._index.items()]
+                )
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one SQLite transaction."""
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+    
+    def _rebuild_aggregates(self) -> None:
+        """Recompute all aggregates from the index."""
+        self.version += 1
+        self._tag_counts: Counter[str] = Counter()
+        self._field_counts: dict[str, Counter] = {
+            field: Counter() for field in ("platform", "status", "author", "category", "media_type")
+        }
+        self._author_totals: dict[str, list[int]] = {}  # name -> [posts, likes, comments]
+        self._media_count = 0
+        # post_id -> tag bloom, letting tag filters reject most posts with one AND
+        self._tag_blooms: dict[str, int] = {}
+        # post_id -> posted_at as a POSIX timestamp, for date range filters
+        self._posted_ts: dict[str, Optional[float]] = {}
+        self._columns: Optional[columns.PostColumns] = None  # Built on demand
+        self._count_cache: dict[str, int] = {}  # Filter key -> matching posts
+        for post_id, meta in self._index.items():
+            self._count_meta(meta, 1)
+            self._tag_blooms[post_id] = _tag_bloom(meta.get("tags"))
+            self._posted_ts[post_id] = _iso_timestamp(meta.get("posted_at"))
+    
+    def _count_meta(self, meta: dict, sign: int) -> None:
+        """
+        Add (sign=1) or remove (sign=-1) one index entry from the aggregates.
+        
+        Args:
+            meta: Index entry
+            sign: 1 to add, -1 to remove
+        """
+        for tag in meta.get("tags") or ():
+            _bump(self._tag_counts, tag, sign)
+        for field, counter in self._field_counts.items():
+            _bump(counter, meta.get(field), sign)
+        
+        author = meta.get("author") or "Unknown"
+        totals = self._author_totals.setdefault(author, [0, 0, 0])
+        totals[0] += sign
+        totals[1] += sign * (meta.get("likes") or 0)
+        totals[2] += sign * (meta.get("comments") or 0)
+        if totals[0] <= 0:
+            del self._author_totals[author]
+        
+        if meta.get("has_media"):
+            self._media_count += sign
+    
+    def _set_meta(self, post_id: str, meta: Optional[dict]) -> None:
+        """Replace (or with None, remove) an index entry, updating the aggregates."""
+        self.version += 1
+        self._columns = None
+        self._count_cache.clear()
+        old = self._index.pop(post_id, None)
+        if old is not None:
+            self._count_meta(old, -1)
+            del self._tag_blooms[post_id]
+            del self._posted_ts[post_id]
+        if meta is not None:
+            self._index[post_id] = meta
+            self._count_meta(meta, 1)
+            self._tag_blooms[post_id] = _tag_bloom(meta.get("tags"))
+            self._posted_ts[post_id] = _iso_timestamp(meta.get("posted_at"))
     
     def _save_index(self) -> None:
-        """Persist the index to disk."""
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(self._index, f, indent=2, default=str)
+        """Persist pending index changes in a single transaction."""
+        if self._rewrite:
+            puts = self._index.items()
+            deletes = []
+        else:
+            puts = [(pid, self._index[pid]) for pid in self._pending if pid in self._index]
+            deletes = [(pid,) for pid in self._pending if pid not in self._index]
+        
+        with self._transaction() as conn:
+            if self._rewrite:
+                conn.execute("DELETE FROM posts")
+                conn.execute("DELETE FROM post_text")
+            else:
+                # Before the posts rows go, while their rowids still resolve
+                conn.executemany(_DELETE_TEXT_SQL, [(pid,) for pid in self._pending_text])
+            conn.executemany(_UPSERT_SQL, [_row_from_meta(pid, meta) for pid, meta in puts])
+            conn.executemany("DELETE FROM posts WHERE id = ?", deletes)
+            conn.executemany(
+                _INSERT_TEXT_SQL,
+                [(text, pid) for pid, text in self._pending_text.items() if text is not None],
+            )
+    
+    def close(self) -> None:
+        """Persist pending changes, force them to disk and close the index store."""
+        self.durable_barrier()
+        with self._lock:
+            self._conn.close()
+    
+    def durable_barrier(self) -> None:
+        """
+        Flush pending changes and force the index to disk.
+        
+        Post files are replaced atomically but not fsynced when written, and
+        index commits (WAL mode, synchronous=NORMAL) are only fsynced at
+        checkpoints. Call this at points where recent writes must survive a
+        power loss, not after every write.
+        """
+        self.flush()
+        with self._lock:
+            unsynced, self._unsynced = self._unsynced, set()
+            for post_path in unsynced:
+                try:
+                    fd = os.open(post_path, os.O_RDONLY)
+                except FileNotFoundError:
+                    continue  # Deleted since
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            self._conn.execute("PRAGMA wal_checkpoint(FULL)")
+    
+    def flush(self) -> None:
+        """Persist index changes and data.js if anything changed since the last flush."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending and not self._rewrite:
+                return
+            self._save_index()
+            self.export_static_data()
+            self._pending.clear()
+            self._rewrite = False
+            if self._pending_text:
+                self._pending_text.clear()
+                self._count_cache.clear()  # Search results may have changed
+    
+    @contextmanager
+    def batch(self) -> Iterator["Database"]:
+        """
+        Group writes so the index is persisted once, on exit.
+        
+        Batches may be nested; only the outermost one flushes.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = self._batch_depth == 0
+            if outermost:
+                self.flush()
+    
+    def _mark_dirty(self, post_id: Optional[str] = None) -> None:
+        """
+        Record an index change and schedule it to be persisted.
+        
+        Args:
+            post_id: ID that was added, updated or removed; None means the
+                whole index was replaced
+        """
+        with self._lock:
+            if post_id is None:
+                self._rewrite = True
+            else:
+                self._pending.add(post_id)
+            if self._batch_depth:
+                return  # batch() flushes on exit
+            if self.flush_delay is None:
+                self.flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+                self._flush_timer.start()
     
     def _post_path(self, post_id: str) -> Path:
         """Get the file path for a post."""
@@ -57,15 +377,8 @@ class Database:
         Args:
             post: The post to save
         """
-        # Prepare metadata for frontmatter
-        post_data = post.model_dump(exclude={"content", "note"})
-        
-        # Convert enums to strings
-        for key, value in post_data.items():
-            if hasattr(value, "value"):
-                post_data[key] = value.value
-            elif isinstance(value, datetime):
-                post_data[key] = value.isoformat()
+        # Prepare metadata for frontmatter (JSON mode: enum values, ISO datetimes)
+        post_data = post.model_dump(exclude={"content", "note"}, mode="json")
         
         # Create frontmatter object
         fm = frontmatter.Post(post.content or "")
@@ -85,31 +398,48 @@ class Database:
         if post.note:
             fm.metadata['note'] = post.note
 
-        # Save as Markdown
+        # Save as Markdown; readers see the old file or the new one, never a torn write.
+        # Re-saving an unchanged post (e.g. validation with the same status)
+        # leaves the file and the index alone.
         post_path = self._post_path(post.id)
-        with open(post_path, 'wb') as f:
-            frontmatter.dump(fm, f)
+        data = frontmatter.dumps(fm).encode('utf-8')
+        if _file_equals(post_path, data):
+            entry = _index_entry(post)
+            if self._index.get(post.id) == entry:
+                return
+            with self._lock:
+                self._set_meta(post.id, entry)
+            self._mark_dirty(post.id)
+            return
+        atomic_write_bytes(post_path, data)
         
         # Update index with essential fields for fast filtering
-        self._index[post.id] = {
-            "url": post.url,
-            "platform": post.platform,
-            "author": post.author,
-            "status": post.status,
-            "posted_at": post.posted_at.isoformat() if post.posted_at else None,
-            "scraped_at": post.scraped_at.isoformat() if post.scraped_at else None,
-            "tags": post.tags,
-            "category": post.category,
-            "has_media": bool(post.media_paths),
-            "media_type": post.media_type,
-            # Stats for sorting
-            "views": post.views,
-            "likes": post.likes,
-            "comments": post.comments,
-            "thumbnail_path": post.thumbnail_path # Added for dashboard
-        }
-        self._save_index()
-        self.export_static_data() # Update static data on save
+        with self._lock:
+            self._post_cache.pop(post.id, None)
+            self._unsynced.add(post_path)
+            self._set_meta(post.id, _index_entry(post))
+            self._pending_text[post.id] = _search_text(post)
+        self._mark_dirty(post.id)
+
+    def save_posts(self, posts: Iterable[Post]) -> int:
+        """
+        Save or update several posts, persisting the index once.
+    
+        The index rows for the whole group are written in a single SQLite
+        transaction when the batch ends.
+    
+        Args:
+            posts: Posts to save
+    
+        Returns:
+            Number of posts saved
+        """
+        count = 0
+        with self.batch():
+            for post in posts:
+                self.save_post(post)
+                count += 1
+        return count
     
     def get_post(self, post_id: str) -> Optional[Post]:
         """
@@ -121,23 +451,69 @@ class Database:
         Returns:
             Post object or None if not found
         """
+        cached = self._load_cached(post_id)
+        if cached is None:
+            return None
+        # Callers get a copy since they may modify the post before saving it
+        return cached.post.model_copy(deep=True)
+    
+    def get_post_json(self, post_id: str) -> Optional[bytes]:
+        """
+        Retrieve a post by ID as JSON.
+        
+        The encoding is cached with the parsed post, so serving an unchanged
+        post again costs neither validation nor serialization.
+        
+        Args:
+            post_id: The post ID
+            
+        Returns:
+            JSON object (as ``Post.model_dump_json`` would give) or None if
+            not found
+        """
+        cached = self._load_cached(post_id)
+        if cached is None:
+            return None
+        if cached.json is None:
+            cached.json = _POST_JSON.dump_json(cached.post)
+        return cached.json
+    
+    def _load_cached(self, post_id: str) -> Optional["_CachedPost"]:
+        """Cache entry for a post, parsing the file unless it is unchanged."""
         post_path = self._post_path(post_id)
-        if not post_path.exists():
+        try:
+            stat = post_path.stat()
+        except FileNotFoundError:
             return None
         
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._post_cache.get(post_id)
+            if cached is not None and cached.version == version:
+                self._post_cache.move_to_end(post_id)
+                return cached
+        
         try:
             with open(post_path, 'r', encoding='utf-8') as f:
-                fm = frontmatter.load(f)
+                fm = frontmatter.load(f, handler=_YAML)
             
             data = fm.metadata
             data["content"] = fm.content
             # ID is usually not in metadata if it's in filename, but let's assume we stored it in metadata in save_post
             # Actually save_post took post_data from post.model_dump, so ID is there.
             
-            return Post.model_validate(data)
+            post = Post.model_validate(data)
         except Exception as e:
             print(f"Error loading post {post_id}: {e}")
             return None
+        
+        cached = _CachedPost(version, post)
+        with self._lock:
+            self._post_cache[post_id] = cached
+            self._post_cache.move_to_end(post_id)
+            if len(self._post_cache) > POST_CACHE_SIZE:
+                self._post_cache.popitem(last=False)
+        return cached
     
     def delete_post(self, post_id: str) -> bool:
         """
@@ -149,14 +525,19 @@ class Database:
         Returns:
             True if deleted, False if not found
         """
-        post_path = self._post_path(post_id)
-        if not post_path.exists():
-            return False
+        # An index entry whose file has gone missing is still removed
+        try:
+            self._post_path(post_id).unlink()
+        except FileNotFoundError:
+            if post_id not in self._index:
+                return False
         
-        post_path.unlink()
-        if post_id in self._index:
-            del self._index[post_id]
-            self._save_index()
+        with self._lock:
+            self._post_cache.pop(post_id, None)
+            if post_id in self._index:
+                self._set_meta(post_id, None)
+                self._pending_text[post_id] = None
+                self._mark_dirty(post_id)
         
         return True
     
@@ -164,6 +545,35 @@ class Database:
         """Check if a post exists."""
         return post_id in self._index
     
+    def existing_ids(self, post_ids: Iterable[str]) -> set[str]:
+        """
+        Return the subset of IDs that are already stored.
+        
+        Args:
+            post_ids: Candidate post IDs
+            
+        Returns:
+            Set of IDs present in the index
+        """
+        return self._index.keys() & set(post_ids)
+    
+    def get_posts(self, post_ids: Iterable[str]) -> dict[str, Post]:
+        """
+        Retrieve several posts, reading the files concurrently.
+        
+        Args:
+            post_ids: Post IDs (duplicates are loaded once)
+            
+        Returns:
+            Mapping of ID to post, in first-seen order, for the IDs found
+        """
+        post_ids = list(dict.fromkeys(post_ids))
+        if len(post_ids) <= 1:
+            posts = map(self.get_post, post_ids)
+        else:
+            posts = _READ_POOL.map(self.get_post, post_ids)
+        return {post_id: post for post_id, post in zip(post_ids, posts) if post}
+    
     def list_posts(self, filters: Optional[FilterOptions] = None) -> list[Post]:
         """
         List posts with optional filtering.
@@ -174,58 +584,169 @@ class Database:
         Returns:
             List of matching posts
         """
-        if filters is None:
-            filters = FilterOptions()
+        post_ids, _ = self._page_ids(filters or FilterOptions())
+        return self._load_posts(post_ids)
+    
+    def list_posts_json(self, filters: Optional[FilterOptions] = None) -> list[bytes]:
+        """
+        List posts with optional filtering, each encoded as JSON.
         
-        # Filter using index first for performance
+        For read-only callers such as the viewer API, which can join the
+        cached encodings into a response without touching Post objects.
+        
+        Args:
+            filters: Optional filter options
+            
+        Returns:
+            JSON object per matching post (see ``get_post_json``)
+        """
+        post_ids, _ = self._page_ids(filters or FilterOptions())
+        if len(post_ids) <= 1:
+            rows = map(self.get_post_json, post_ids)
+        else:
+            rows = _READ_POOL.map(self.get_post_json, post_ids)
+        return [row for row in rows if row is not None]
+    
+    def _page_ids(self, filters: FilterOptions) -> tuple[list[str], int]:
+        """Filter, sort and paginate the index, caching the match count.
+        
+        Returns:
+            The page of post IDs and the number of posts matching the filters
+        """
+        # A post sharing a tag with the filter has one of its bloom bits set
+        filter_bloom = _tag_bloom(filters.tags)
+        search_ids = self._search(filters.search_query)
+        
+        if columns.np is not None:
+            # Vectorized filter + sort over a columnar snapshot of the index
+            with self._lock:
+                if self._columns is None:
+                    self._columns = columns.PostColumns(self._index, self._tag_blooms)
+                post_columns = self._columns
+            positions = post_columns.match(filters, filter_bloom, search_ids)
+            self._cache_count(filters, len(positions))
+            return post_columns.page(positions, filters), len(positions)
+        
+        # Filter using index first for performance. The lock keeps writes from
+        # worker threads (e.g. a scan) from changing the index mid-loop.
         matching_ids = []
+        filter_sets = _FilterSets.from_options(filters)
         
-        for post_id, meta in self._index.items():
-            if not self._matches_filter(meta, filters):
-                continue
-            matching_ids.append((post_id, meta))
+        with self._lock:
+            tag_blooms = self._tag_blooms
+            for post_id, meta in self._index.items():
+                if search_ids is not None and post_id not in search_ids:
+                    continue
+                if filter_bloom and not tag_blooms[post_id] & filter_bloom:
+                    continue
+                if not self._matches_filter(post_id, meta, filter_sets):
+                    continue
+                matching_ids.append((post_id, meta))
+        self._cache_count(filters, len(matching_ids))
         
         # Sort
         sort_key = filters.sort_by
+        default = 0 if sort_key in ('views', 'likes', 'comments', 'shares') else ""
         
         def get_sort_value(item):
-            val = item[1].get(sort_key)
-            # Handle numeric fields
-            if sort_key in ['views', 'likes', 'comments', 'shares']:
-                return val or 0
-            # Handle string fields
-            return val or ""
-
-        matching_ids.sort(
-            key=get_sort_value,
-            reverse=filters.sort_desc,
-        )
+            return item[1].get(sort_key) or default
         
-        # Apply pagination
-        start = filters.offset
-        end = start + filters.limit
-        paginated = matching_ids[start:end]
+        # Only the rows up to the end of the page need ordering; nlargest and
+        # nsmallest match a stable full sort truncated to that many rows
+        end = filters.offset + filters.limit
+        select = heapq.nlargest if filters.sort_desc else heapq.nsmallest
+        paginated = select(end, matching_ids, key=get_sort_value)[filters.offset:]
         
-        # Load full posts
-        posts = []
-        for post_id, _ in paginated:
-            post = self.get_post(post_id)
-            if post:
-                posts.append(post)
+        return [post_id for post_id, _ in paginated], len(matching_ids)
+    
+    def _search(self, query: Optional[str]) -> Optional[set[str]]:
+        """
+        Find posts whose title, content or author contain every search term.
+        
+        Terms are whitespace-separated and matched as case-insensitive
+        substrings, answered by SQLite from the post_text table.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Matching post IDs, or None if there are no terms
+        """
+        terms = query.split() if query else []
+        if not terms:
+            return None
+        
+        # The trigram index serves LIKE without ESCAPE. Terms with wildcard
+        # characters need ESCAPE, and terms under three characters need it
+        # too: it keeps them off the index, which misses short non-ASCII
+        # terms (e.g. two-syllable Korean words) instead of scanning.
+        clauses = []
+        params = []
+        for term in terms:
+            escaped = _escape_like(term)
+            indexed = escaped == term and len(term) >= 3
+            clauses.append("t.text LIKE ?" if indexed else "t.text LIKE ? ESCAPE '\\'")
+            params.append(f"%{escaped}%")
         
-        return posts
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.id FROM post_text AS t JOIN posts AS p ON p.rowid = t.rowid WHERE "
+                + " AND ".join(clauses),
+                params,
+            ).fetchall()
+            found = {row[0] for row in rows}
+            # Texts saved since the last flush are matched in memory; flushing
+            # here would rewrite data.js on every search during a batch
+            if self._pending_text:
+                folded = [term.casefold() for term in terms]
+                for post_id, text in self._pending_text.items():
+                    text = (text or "").casefold()
+                    if text and all(term in text for term in folded):
+                        found.add(post_id)
+                    else:
+                        found.discard(post_id)
+        return found
     
-    def _matches_filter(self, meta: dict, filters: FilterOptions) -> bool:
+    def count_posts(self, filters: FilterOptions) -> int:
+        """
+        Count the posts matching the filters (ignoring pagination).
+        
+        Counts are cached per filter until the index changes; list_posts
+        fills the cache, so counting right after listing is free.
+        
+        Args:
+            filters: Filter options
+            
+        Returns:
+            Number of matching posts
+        """
+        total = self._count_cache.get(_count_key(filters))
+        if total is None:
+            # Use the computed count: a concurrent write may clear the cache
+            _, total = self._page_ids(filters.model_copy(update={"limit": 1, "offset": 0}))
+        return total
+    
+    def _cache_count(self, filters: FilterOptions, total: int) -> None:
+        with self._lock:
+            if len(self._count_cache) >= COUNT_CACHE_SIZE:
+                self._count_cache.clear()
+            self._count_cache[_count_key(filters)] = total
+    
+    def _load_posts(self, post_ids: list[str]) -> list[Post]:
+        """Load a page of posts, reading the files concurrently."""
+        return list(self.get_posts(post_ids).values())
+    
+    def _matches_filter(self, post_id: str, meta: dict, filters: "_FilterSets") -> bool:
         """Check if a post metadata matches the filter criteria."""
         
         # Platform filter
         if filters.platforms:
-            if meta.get("platform") not in [p.value if isinstance(p, Platform) else p for p in filters.platforms]:
+            if meta.get("platform") not in filters.platforms:
                 return False
         
         # Status filter
         if filters.statuses:
-            if meta.get("status") not in [s.value if isinstance(s, PostStatus) else s for s in filters.statuses]:
+            if meta.get("status") not in filters.statuses:
                 return False
         
         # Author filter
@@ -235,8 +756,8 @@ class Database:
         
         # Tags filter (match any)
         if filters.tags:
-            post_tags = set(meta.get("tags", []))
-            if not post_tags.intersection(filters.tags):
+            post_tags = meta.get("tags")
+            if not post_tags or filters.tags.isdisjoint(post_tags):
                 return False
         
         # Category filter
@@ -244,13 +765,14 @@ class Database:
             if meta.get("category") not in filters.categories:
                 return False
         
-        # Date range
-        if filters.posted_after:
-            posted_at = meta.get("posted_at")
-            if not posted_at or datetime.fromisoformat(posted_at) < filters.posted_after:
+        # Date range, on timestamps parsed once per post rather than per query
+        if filters.posted_after is not None or filters.posted_before is not None:
+            posted_ts = self._posted_ts[post_id]
+            if posted_ts is None:
                 return False
-        
-            if not posted_at or datetime.fromisoformat(posted_at) > filters.posted_before:
+            if filters.posted_after is not None and posted_ts < filters.posted_after:
+                return False
+            if filters.posted_before is not None and posted_ts > filters.posted_before:
                 return False
         
         # Media Type filter
@@ -262,28 +784,15 @@ class Database:
     
     def get_all_tags(self) -> list[str]:
         """Get all unique tags."""
-        tags = set()
-        for meta in self._index.values():
-            tags.update(meta.get("tags", []))
-        return sorted(tags)
+        return sorted(self._tag_counts)
     
     def get_all_categories(self) -> list[str]:
         """Get all unique categories."""
-        categories = set()
-        for meta in self._index.values():
-            cat = meta.get("category")
-            if cat:
-                categories.add(cat)
-        return sorted(categories)
+        return sorted(cat for cat in self._field_counts["category"] if cat)
     
     def get_all_authors(self) -> list[str]:
         """Get all unique authors."""
-        authors = set()
-        for meta in self._index.values():
-            author = meta.get("author")
-            if author:
-                authors.add(author)
-        return sorted(authors)
+        return sorted(author for author in self._field_counts["author"] if author)
     
     def update_tags(self, post_id: str, tags: list[str]) -> bool:
         """
@@ -296,13 +805,7 @@ class Database:
         Returns:
             True if updated, False if not found
         """
-        post = self.get_post(post_id)
-        if not post:
-            return False
-        
-        post.tags = tags
-        self.save_post(post)
-        return True
+        return self._update_fields(post_id, {"tags": tags})
     
     def update_category(self, post_id: str, category: Optional[str]) -> bool:
         """
@@ -315,12 +818,76 @@ class Database:
         Returns:
             True if updated, False if not found
         """
-        post = self.get_post(post_id)
-        if not post:
+        return self._update_fields(post_id, {"category": category})
+    
+    def _update_fields(self, post_id: str, updates: dict) -> bool:
+        """
+        Change indexed metadata fields of a stored post.
+        
+        Only the frontmatter is rewritten; the body is copied through
+        unparsed. Files without a frontmatter header fall back to a full
+        load and save.
+        
+        Args:
+            post_id: The post ID
+            updates: Field values to set (must be index fields)
+            
+        Returns:
+            True if updated, False if not found
+        """
+        post_path = self._post_path(post_id)
+        if post_id not in self._index or not post_path.exists():
             return False
         
-        post.category = category
-        self.save_post(post)
+        if not self._rewrite_frontmatter(post_path, updates):
+            post = self.get_post(post_id)
+            if not post:
+                return False
+            for key, value in updates.items():
+                setattr(post, key, value)
+            self.save_post(post)
+            return True
+        
+        with self._lock:
+            self._post_cache.pop(post_id, None)
+            self._unsynced.add(post_path)
+            self._set_meta(post_id, {**self._index[post_id], **updates})
+        self._mark_dirty(post_id)
+        return True
+    
+    def _rewrite_frontmatter(self, post_path: Path, updates: dict) -> bool:
+        """
+        Merge ``updates`` into a Markdown file's YAML header in place.
+        
+        Args:
+            post_path: Markdown file with a frontmatter header
+            updates: Metadata values to set
+            
+        Returns:
+            False (leaving the file untouched) if it has no header
+        """
+        tmp_path = post_path.with_suffix(".md.tmp")
+        with open(post_path, 'r', encoding='utf-8', newline='') as src:
+            opening = src.readline()
+            if not _YAML.FM_BOUNDARY.match(opening):
+                return False
+            header = []
+            for line in src:
+                if _YAML.FM_BOUNDARY.match(line):
+                    closing = line
+                    break
+                header.append(line)
+            else:
+                return False
+            
+            metadata = _YAML.load(''.join(header)) or {}
+            metadata.update(updates)
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as dst:
+                dst.write(opening)
+                dst.write(_YAML.export(metadata) + '\n')
+                dst.write(closing)
+                shutil.copyfileobj(src, dst)  # Body, unparsed
+        os.replace(tmp_path, post_path)
         return True
     
     def get_stats(self) -> Statistics:
@@ -332,46 +899,25 @@ class Database:
         """
         stats = Statistics()
         
-        by_platform = defaultdict(int)
-        by_author = defaultdict(int)
-        
-        for meta in self._index.values():
-            stats.total_posts += 1
-            
-            # By status
-            status = meta.get("status", "pending")
-            if status == "accessible":
-                stats.accessible += 1
-            elif status == "private":
-                stats.private += 1
-            elif status == "deleted":
-                stats.deleted += 1
-            elif status == "pending":
-                stats.pending += 1
-            elif status == "failed":
-                stats.failed += 1
-            
-            # By platform
-            platform = meta.get("platform", "unknown")
-            by_platform[platform] += 1
-            
-            # By author
-            author = meta.get("author")
-            if author:
-                by_author[author] += 1
-            
-            # Count media
-            if meta.get("has_media"):
-                stats.total_media_downloaded += 1
+        statuses = self._field_counts["status"]
+        stats.total_posts = len(self._index)
+        stats.accessible = statuses["accessible"]
+        stats.private = statuses["private"]
+        stats.deleted = statuses["deleted"]
+        stats.pending = statuses["pending"]
+        stats.failed = statuses["failed"]
+        stats.total_media_downloaded = self._media_count
         
         stats.unique_posts = len(self._index)
-        stats.by_platform = dict(by_platform)
-        stats.by_author = dict(sorted(by_author.items(), key=lambda x: -x[1])[:20])  # Top 20
+        stats.by_platform = dict(self._field_counts["platform"])
+        # Top 20; most_common(n) keeps a heap instead of sorting every author.
+        # Two extra slots cover the None and "" authors, which are skipped.
+        top_authors = [(a, n) for a, n in self._field_counts["author"].most_common(22) if a]
+        stats.by_author = dict(top_authors[:20])
         stats.last_updated = datetime.now()
         
         # Save stats
-        with open(self.stats_file, 'w', encoding='utf-8') as f:
-            f.write(stats.model_dump_json(indent=2))
+        atomic_write_bytes(self.stats_file, stats.model_dump_json().encode('utf-8'))
         
         return stats
     
@@ -383,42 +929,24 @@ class Database:
         """Rebuild index from files."""
         count = 0
         new_index = {}
+        texts = {}
         
         if not self.posts_dir.exists():
             return 0
             
-        for post_file in self.posts_dir.glob("*.md"):
-            try:
-                with open(post_file, 'r', encoding='utf-8') as f:
-                    fm = frontmatter.load(f)
-                    
-                data = fm.metadata
-                data["content"] = fm.content
-                post = Post.model_validate(data)
-                    
-                new_index[post.id] = {
-                    "url": post.url,
-                    "platform": post.platform,
-                    "author": post.author,
-                    "status": post.status,
-                    "posted_at": post.posted_at.isoformat() if post.posted_at else None,
-                    "scraped_at": post.scraped_at.isoformat() if post.scraped_at else None,
-                    "tags": post.tags,
-                    "category": post.category,
-                    "has_media": bool(post.media_paths),
-                    "media_type": post.media_type,
-                    "views": post.views,
-                    "likes": post.likes,
-                    "comments": post.comments,
-                    "thumbnail_path": post.thumbnail_path
-                }
+        with ThreadPoolExecutor(max_workers=REINDEX_WORKERS) as executor:
+            for post in executor.map(_load_post_file, self.posts_dir.glob("*.md")):
+                if post is None:
+                    continue
+                new_index[post.id] = _index_entry(post)
+                texts[post.id] = _search_text(post)
                 count += 1
-            except Exception:
-                continue
         
-        self._index = new_index
-        self._save_index()
-        self.export_static_data()
+        with self._lock:
+            self._index = new_index
+            self._pending_text = texts
+            self._rebuild_aggregates()
+            self._mark_dirty()
         return count
 
     def export_static_data(self) -> None:
@@ -435,50 +963,178 @@ class Database:
         # Sort by date (newest first)
         posts_list.sort(key=lambda x: x.get('scraped_at') or "", reverse=True)
             
-        js_content = f"window.POSTS_DATA = {json.dumps(posts_list, indent=2)};"
+        # Compact JSON; the dashboard only parses it
+        js_content = b"window.POSTS_DATA = " + orjson.dumps(posts_list, default=str) + b";"
+        atomic_write_bytes(data_js_path, js_content)
         
-        with open(data_js_path, 'w', encoding='utf-8') as f:
-            f.write(js_content)
+        # Precompressed copy for web servers that serve .gz files directly
+        # (e.g. nginx gzip_static); mtime=0 keeps unchanged data byte-identical
+        atomic_write_bytes(
+            data_js_path.with_name("data.js.gz"),
+            gzip.compress(js_content, compresslevel=6, mtime=0),
+        )
 
     def get_analytics(self) -> dict:
         """Get detailed analytics."""
+        media_types = self._field_counts["media_type"]
         analytics = {
-            "platform_counts": {},
+            "platform_counts": dict(self._field_counts["platform"]),
             "author_stats": [],
-            "media_type_counts": {"image": 0, "video": 0, "carousel": 0},
-            "status_counts": {},
+            "media_type_counts": {
+                mtype: media_types[mtype] for mtype in ("image", "video", "carousel")
+            },
+            "status_counts": dict(self._field_counts["status"]),
         }
         
-        author_map = {}
-        
-        for meta in self._index.values():
-            # Platform
-            plat = meta.get("platform", "unknown")
-            analytics["platform_counts"][plat] = analytics["platform_counts"].get(plat, 0) + 1
-            
-            # Status
-            status = meta.get("status", "unknown")
-            analytics["status_counts"][status] = analytics["status_counts"].get(status, 0) + 1
-            
-            # Media Type
-            mtype = meta.get("media_type")
-            if mtype in analytics["media_type_counts"]:
-                analytics["media_type_counts"][mtype] += 1
-            
-            # Author Stats
-            author = meta.get("author") or "Unknown"
-            if author not in author_map:
-                author_map[author] = {"name": author, "count": 0, "likes": 0, "comments": 0}
-            
-            author_map[author]["count"] += 1
-            author_map[author]["likes"] += (meta.get("likes") or 0)
-            author_map[author]["comments"] += (meta.get("comments") or 0)
-        
-        # Convert author map to list and sort by count
-        analytics["author_stats"] = sorted(
-            author_map.values(), 
-            key=lambda x: x["count"], 
-            reverse=True
-        )
+        # Author stats sorted by post count (sort the totals, then build dicts)
+        by_count = sorted(self._author_totals.items(), key=_author_post_count, reverse=True)
+        analytics["author_stats"] = [
+            {"name": name, "count": count, "likes": likes, "comments": comments}
+            for name, (count, likes, comments) in by_count
+        ]
         
         return analytics
+
+
+def _author_post_count(item: tuple[str, list[int]]) -> int:
+    """Sort key for (name, [posts, likes, comments]) author totals."""
+    return item[1][0]
+
+
+def _bump(counter: Counter, key, delta: int) -> None:
+    """Adjust a count, dropping the key when it reaches zero."""
+    counter[key] += delta
+    if counter[key] <= 0:
+        del counter[key]
+
+
+@dataclass(slots=True)
+class _CachedPost:
+    """A parsed post file, keyed by the (mtime_ns, size) it was read at."""
+    
+    version: tuple[int, int]
+    post: Post
+    json: Optional[bytes] = None  # Encoded on first get_post_json
+
+
+@dataclass(slots=True)
+class _FilterSets:
+    """FilterOptions with the value lists turned into sets, built once per query."""
+    
+    platforms: frozenset
+    statuses: frozenset
+    authors: frozenset
+    tags: frozenset
+    categories: frozenset
+    media_types: frozenset
+    posted_after: Optional[float]  # POSIX timestamps
+    posted_before: Optional[float]
+    
+    @classmethod
+    def from_options(cls, filters: FilterOptions) -> "_FilterSets":
+        return cls(
+            platforms=frozenset(p.value if isinstance(p, Platform) else p for p in filters.platforms or ()),
+            statuses=frozenset(s.value if isinstance(s, PostStatus) else s for s in filters.statuses or ()),
+            authors=frozenset(filters.authors or ()),
+            tags=frozenset(filters.tags or ()),
+            categories=frozenset(filters.categories or ()),
+            media_types=frozenset(filters.media_types or ()),
+            posted_after=filters.posted_after.timestamp() if filters.posted_after else None,
+            posted_before=filters.posted_before.timestamp() if filters.posted_before else None,
+        )
+
+
+def _count_key(filters: FilterOptions) -> str:
+    """Cache key for the filter part of FilterOptions."""
+    return filters.model_dump_json(exclude={"limit", "offset", "sort_by", "sort_desc"})
+
+
+def _tag_bloom(tags: Optional[Iterable[str]]) -> int:
+    """
+    Fold tags into a 64-bit Bloom filter (two bits per tag).
+    
+    Uses the per-process str hash, so blooms are kept in memory only.
+    """
+    bloom = 0
+    for tag in tags or ():
+        h = hash(tag)
+        bloom |= (1 << (h & 63)) | (1 << ((h >> 6) & 63))
+    return bloom
+
+
+def _search_text(post: Post) -> str:
+    """Text of a post that search matches against."""
+    return "\n".join(part for part in (post.title, post.content, post.author) if part)
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so a search term matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _file_equals(path: Path, data: bytes) -> bool:
+    """Whether a file already holds exactly ``data`` (size checked before reading)."""
+    try:
+        if path.stat().st_size != len(data):
+            return False
+        return path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+
+def _iso_timestamp(value: Optional[str]) -> Optional[float]:
+    """ISO datetime string from the index to a POSIX timestamp."""
+    return datetime.fromisoformat(value).timestamp() if value else None
+
+
+def _row_from_meta(post_id: str, meta: dict) -> tuple:
+    """Convert an index entry to a ``posts`` table row."""
+    row = [post_id]
+    for column in INDEX_COLUMNS:
+        value = meta.get(column)
+        if column == "tags":
+            value = orjson.dumps(value or []).decode()
+        elif column == "has_media":
+            value = int(bool(value))
+        row.append(value)
+    return tuple(row)
+
+
+def _meta_from_row(row: tuple) -> dict:
+    """Convert a ``posts`` table row (id first) back to an index entry."""
+    meta = dict(zip(INDEX_COLUMNS, row[1:]))
+    meta["tags"] = orjson.loads(meta["tags"] or "[]")
+    meta["has_media"] = bool(meta["has_media"])
+    return meta
+
+
+def _index_entry(post: Post) -> dict:
+    """Build the index entry (fields used for filtering and sorting) for a post."""
+    return {
+        "url": post.url,
+        "platform": post.platform,
+        "author": post.author,
+        "status": post.status,
+        "posted_at": post.posted_at.isoformat() if post.posted_at else None,
+        "scraped_at": post.scraped_at.isoformat() if post.scraped_at else None,
+        "tags": post.tags,
+        "category": post.category,
+        "has_media": bool(post.media_paths),
+        "media_type": post.media_type,
+        # Stats for sorting
+        "views": post.views,
+        "likes": post.likes,
+        "comments": post.comments,
+        "thumbnail_path": post.thumbnail_path # Added for dashboard
+    }
+
+
+def _load_post_file(post_file: Path) -> Optional[Post]:
+    """Load a post from its Markdown file, or None if it cannot be parsed."""
+    try:
+        fm = frontmatter.loads(post_file.read_text(encoding='utf-8'), handler=_YAML)
+        data = fm.metadata
+        data["content"] = fm.content
+        return Post.model_validate(data)
+    except Exception:
+        return None
@@ -1,5 +1,6 @@
 """Utility functions."""
 
-from .formatting import human_readable_size
+from .fileio import atomic_write_bytes
+from .formatting import human_readable_size, sanitize_filename
 
-__all__ = ["human_readable_size"]
+__all__ = ["atomic_write_bytes", "human_readable_size", "sanitize_filename"]
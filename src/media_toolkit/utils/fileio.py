@@ -0,0 +1,18 @@
+import os
+from pathlib import Path
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = False) -> None:
+    """Replace a file's contents so readers (and crashes) never see a partial file.
+
+    The data goes to a sibling ``.tmp`` file that is then renamed over
+    ``path``. With ``fsync`` the data is forced to disk before the rename;
+    leave it off for files that can be regenerated, to keep writes cheap.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
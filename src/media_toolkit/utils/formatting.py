@@ -1,10 +1,37 @@
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def human_readable_size(size_in_bytes: int) -> str:
     """Converts bytes to a human readable string (e.g. 10.5 MB)."""
     if size_in_bytes is None:
         return "Unknown"
+    if size_in_bytes < 1024:
+        return f"{size_in_bytes:.2f} B"
+
+    # Unit index straight from the integer log2, instead of dividing per unit
+    exponent = min(int(size_in_bytes).bit_length() - 1, 50) // 10
+    return f"{size_in_bytes / (1 << (10 * exponent)):.2f} {_SIZE_UNITS[exponent]}"
+
+
+class _FilenameTable(dict):
+    """str.translate table that keeps letters, digits and " ._-()".
+
+    Entries are filled in lazily per code point, so repeated characters are
+    resolved by a C-level dict lookup instead of per-character Python calls.
+    """
+
+    _EXTRA = frozenset(" ._-()")
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = char.isalpha() or char.isdigit() or char in self._EXTRA
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+
+_FILENAME_TABLE = _FilenameTable()
+
 
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_in_bytes < 1024.0:
-            return f"{size_in_bytes:.2f} {unit}"
-        size_in_bytes /= 1024.0
-    return f"{size_in_bytes:.2f} PB"
+def sanitize_filename(filename: str) -> str:
+    """Strip characters that are unsafe in file names (e.g. 'a/b?.jpg' -> 'ab.jpg')."""
+    return filename.translate(_FILENAME_TABLE).rstrip()
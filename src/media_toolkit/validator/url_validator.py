@@ -1,12 +1,19 @@
 """URL validator for checking accessibility of social media URLs."""
 
 import asyncio
+import threading
+from functools import lru_cache
 import aiohttp
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+try:
+    import hyperscan  # Optional multi-pattern matcher (pip install media-toolkit[fast])
+except ImportError:
+    hyperscan = None
+
 
 class URLStatus(Enum):
     """Status of a URL after validation."""
@@ -20,7 +27,7 @@ class URLStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of URL validation."""
     
@@ -32,12 +39,34 @@ class ValidationResult:
     response_time_ms: Optional[float] = None
 
 
+_hs_local = threading.local()  # Scratch space must not be shared across threads
+
+
+@lru_cache(maxsize=None)
+def _compile_indicator_db(indicators: tuple[str, ...]):
+    """Compile page indicators into one caseless Hyperscan database, if available."""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[indicator.encode('utf-8') for indicator in indicators],
+            ids=list(range(len(indicators))),
+            elements=len(indicators),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(indicators),
+        )
+        return db
+    except hyperscan.error:
+        return None
+
+
 class URLValidator:
     """Validates URLs for accessibility."""
     
     # HTTP status codes and their meanings for social media
     STATUS_MAPPING = {
         200: URLStatus.ACCESSIBLE,
+        206: URLStatus.ACCESSIBLE,  # Range honoured
         401: URLStatus.LOGIN_REQUIRED,
         403: URLStatus.PRIVATE,
         404: URLStatus.DELETED,
@@ -61,6 +90,14 @@ class URLValidator:
         "no longer available",
     ]
     
+    # Only the start of a page is checked; error banners render early
+    MAX_CONTENT_BYTES = 64 * 1024
+    
+    MAX_REDIRECTS = 5
+    
+    # HEAD answers that may only mean the server refuses HEAD; GET decides
+    HEAD_FALLBACK_STATUSES = frozenset({403, 405, 501})
+    
     def __init__(
         self,
         timeout: int = 10,
@@ -73,52 +110,111 @@ class URLValidator:
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
             "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
+        self._headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+        }
+        # GETs ask for just the checked window, so the body is read to the
+        # end and the connection goes back to the pool
+        self._get_headers = {**self._headers, "Range": f"bytes=0-{self.MAX_CONTENT_BYTES - 1}"}
+        
+        # Pooled HTTP session, bound to the event loop that created it
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> "URLValidator":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
     
-    async def validate(self, url: str) -> ValidationResult:
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the validator's shared HTTP session.
+        
+        One session serves every URL (and every task of ``batch_validate``),
+        so TCP/TLS connections and DNS lookups are reused. A new session is
+        made if the old one was closed or belongs to another event loop.
+        
+        Returns:
+            aiohttp session for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=0,  # Callers bound concurrency themselves
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                ),
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session, if one is open."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def validate(self, url: str, method: str = "GET") -> ValidationResult:
         """
         Validate a single URL for accessibility.
         
         Args:
             url: The URL to validate
+            method: "GET" fetches the start of the page and checks it for
+                private/deleted indicators. "HEAD" judges by the status code
+                alone, which is cheaper but misses pages that answer 200
+                with an error banner (as Instagram does); a HEAD refused
+                with 403/405/501 is retried as a GET.
             
         Returns:
             ValidationResult with status information
         """
         start_time = datetime.now()
         
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
-        
         timeout = aiohttp.ClientTimeout(total=self.timeout)
+        session = self._get_session()
+        headers = self._get_headers if method == "GET" else self._headers
         
         for attempt in range(self.max_retries):
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    async with session.get(url, headers=headers, allow_redirects=True) as response:
-                        elapsed = (datetime.now() - start_time).total_seconds() * 1000
-                        
-                        # Check HTTP status first
-                        status = self.STATUS_MAPPING.get(response.status, URLStatus.UNKNOWN)
-                        
-                        # For 200 responses, check content for private/deleted indicators
-                        if response.status == 200:
-                            try:
-                                content = await response.text()
-                                status = self._analyze_content(content)
-                            except Exception:
-                                # If we can't read content, assume accessible
-                                pass
-                        
-                        return ValidationResult(
-                            url=url,
-                            status=status,
-                            http_status=response.status,
-                            response_time_ms=elapsed,
-                        )
-                        
+                async with session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=timeout,
+                    allow_redirects=True,
+                    max_redirects=self.MAX_REDIRECTS,
+                ) as response:
+                    if method == "HEAD" and response.status in self.HEAD_FALLBACK_STATUSES:
+                        return await self.validate(url)
+                    
+                    elapsed = (datetime.now() - start_time).total_seconds() * 1000
+                    
+                    # Check HTTP status first
+                    status = self.STATUS_MAPPING.get(response.status, URLStatus.UNKNOWN)
+                    
+                    # For 200 responses, check content for private/deleted indicators
+                    if method == "GET" and response.status in (200, 206):
+                        try:
+                            content = await self._read_head(response)
+                            status = self._analyze_content(content)
+                        except Exception:
+                            # If we can't read content, assume accessible
+                            pass
+                    
+                    return ValidationResult(
+                        url=url,
+                        status=status,
+                        http_status=response.status,
+                        response_time_ms=elapsed,
+                    )
+                    
             except asyncio.TimeoutError:
                 if attempt == self.max_retries - 1:
                     return ValidationResult(
@@ -143,8 +239,51 @@ class URLValidator:
             error_message="Max retries exceeded",
         )
     
+    async def _read_head(self, response: aiohttp.ClientResponse, chunk_size: int = 16384) -> str:
+        """
+        Read and decode at most ``MAX_CONTENT_BYTES`` of a response body.
+        
+        Args:
+            response: Open aiohttp response
+            chunk_size: Bytes per read
+            
+        Returns:
+            Decoded start of the page
+        """
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(chunk_size):
+            buf.extend(chunk)
+            if len(buf) >= self.MAX_CONTENT_BYTES:
+                break
+        del buf[self.MAX_CONTENT_BYTES:]
+        return buf.decode(response.charset or 'utf-8', errors='ignore')
+    
     def _analyze_content(self, content: str) -> URLStatus:
         """Analyze page content to detect private/deleted posts."""
+        # With Hyperscan, every indicator is found in one pass over the page
+        indicators = tuple(self.DELETED_INDICATORS) + tuple(self.PRIVATE_INDICATORS)
+        db = _compile_indicator_db(indicators)
+        if db is not None:
+            scratches = getattr(_hs_local, 'scratches', None)
+            if scratches is None:
+                scratches = _hs_local.scratches = {}
+            scratch = scratches.get(db)
+            if scratch is None:
+                scratch = scratches[db] = hyperscan.Scratch(db)
+            
+            hits = set()
+            db.scan(
+                content.encode('utf-8', 'replace'),
+                match_event_handler=lambda id_, _start, _end, _flags, _ctx: hits.add(id_),
+                scratch=scratch,
+            )
+            if not hits:
+                return URLStatus.ACCESSIBLE
+            # Deleted indicators take precedence, as in the fallback below
+            if min(hits) < len(self.DELETED_INDICATORS):
+                return URLStatus.DELETED
+            return URLStatus.PRIVATE
+        
         content_lower = content.lower()
         
         for indicator in self.DELETED_INDICATORS:
@@ -162,6 +301,7 @@ class URLValidator:
         urls: list[str],
         concurrent_limit: int = 5,
         delay: float = 1.0,
+        method: str = "GET",
     ) -> list[ValidationResult]:
         """
         Validate multiple URLs with concurrency control.
@@ -170,6 +310,7 @@ class URLValidator:
             urls: List of URLs to validate
             concurrent_limit: Maximum concurrent requests
             delay: Delay between batches (to avoid rate limiting)
+            method: Request method (see ``validate``)
             
         Returns:
             List of ValidationResults in the same order as input
@@ -178,7 +319,7 @@ class URLValidator:
         
         async def validate_with_semaphore(url: str) -> ValidationResult:
             async with semaphore:
-                result = await self.validate(url)
+                result = await self.validate(url, method)
                 await asyncio.sleep(delay)  # Rate limiting
                 return result
         
@@ -189,8 +330,8 @@ class URLValidator:
 # Convenience functions
 async def validate_url(url: str, timeout: int = 10) -> ValidationResult:
     """Validate a single URL."""
-    validator = URLValidator(timeout=timeout)
-    return await validator.validate(url)
+    async with URLValidator(timeout=timeout) as validator:
+        return await validator.validate(url)
 
 
 async def batch_validate(
@@ -199,5 +340,5 @@ async def batch_validate(
     delay: float = 1.0,
 ) -> list[ValidationResult]:
     """Validate multiple URLs."""
-    validator = URLValidator()
-    return await validator.batch_validate(urls, concurrent_limit, delay)
+    async with URLValidator() as validator:
+        return await validator.batch_validate(urls, concurrent_limit, delay)
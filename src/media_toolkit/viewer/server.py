@@ -1,21 +1,29 @@
 """FastAPI web server for the viewer."""
 
 import asyncio
+import hashlib
+import itertools
+import time
+from collections import OrderedDict, defaultdict, deque
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Optional
+from urllib.parse import urlsplit
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request, Response
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse
 from pydantic import BaseModel
+import orjson
 
 from ..storage import Database, Post, FilterOptions, Platform, Statistics
 from ..storage.models import PostStatus
-from ..parser import scan_directory, detect_duplicates
+from ..parser import ExtractedURL, scan_directory, analyze_urls
 from ..validator import URLValidator, URLStatus
-from ..scraper import scrape_url
+from ..scraper import scrape_url, close_scrapers
 from ..downloader import MediaDownloader
 
 
@@ -23,6 +31,28 @@ from ..downloader import MediaDownloader
 MODULE_DIR = Path(__file__).parent
 
 
+class _LargeFileResponse(FileResponse):
+    """FileResponse reading 1 MiB per chunk (each read is a worker-thread hop)."""
+    
+    chunk_size = 1024 * 1024
+
+
+class MediaFiles(StaticFiles):
+    """
+    StaticFiles for large media (videos) served to the viewer.
+    
+    Responses still get Range, ETag and Last-Modified handling from
+    FileResponse, and zero-copy ``http.response.pathsend`` on ASGI servers
+    that offer it; otherwise files go out in 1 MiB chunks instead of 64 KiB.
+    """
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = _LargeFileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
 class TagsUpdate(BaseModel):
     """Request body for updating tags."""
     tags: list[str]
@@ -55,6 +85,93 @@ class DownloadBatchRequest(BaseModel):
     post_ids: list[str]
 
 
+class ThumbnailCache:
+    """
+    LRU cache of thumbnail bytes for the grid view.
+    
+    Entries are checked against the file's mtime and size on every lookup,
+    so a re-downloaded thumbnail replaces the cached one.
+    """
+    
+    def __init__(self, thumbnails_dir: Path, maxsize: int = 512):
+        self.thumbnails_dir = thumbnails_dir
+        self.maxsize = maxsize
+        # post_id -> ((mtime_ns, size), etag, bytes), least recently used first
+        self._entries: OrderedDict[str, tuple[tuple[int, int], str, bytes]] = OrderedDict()
+    
+    def get(self, post_id: str) -> Optional[tuple[str, bytes]]:
+        """
+        Get a thumbnail.
+        
+        Args:
+            post_id: Post ID
+            
+        Returns:
+            (etag, JPEG bytes), or None if the post has no thumbnail
+        """
+        thumb_path = self.thumbnails_dir / f"{post_id}.jpg"
+        try:
+            stat = thumb_path.stat()
+        except FileNotFoundError:
+            self._entries.pop(post_id, None)
+            return None
+        
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(post_id)
+        if entry is None or entry[0] != version:
+            try:
+                content = thumb_path.read_bytes()
+            except FileNotFoundError:
+                return None
+            entry = (version, f'"{version[0]:x}-{version[1]:x}"', content)
+            self._entries[post_id] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        self._entries.move_to_end(post_id)
+        return entry[1], entry[2]
+    
+    def discard(self, post_id: str) -> None:
+        """Forget a post's thumbnail."""
+        self._entries.pop(post_id, None)
+
+
+class ResponseCache:
+    """
+    JSON bodies derived from the database, kept until the index changes.
+    
+    Entries are tagged with ``Database.version`` when built; any save,
+    delete, tag/category update or reindex bumps it, so a stale body is
+    never served.
+    """
+    
+    def __init__(self, db: Database):
+        self.db = db
+        # name -> (db version, JSON bytes)
+        self._entries: dict[str, tuple[int, bytes]] = {}
+    
+    def get(self, name: str, build: Callable[[], object]) -> Response:
+        """
+        Get a cached JSON response, building it if the index has changed.
+        
+        Args:
+            name: Cache entry name
+            build: Returns the JSON-serializable payload
+            
+        Returns:
+            JSON response
+        """
+        version = self.db.version
+        entry = self._entries.get(name)
+        if entry is None or entry[0] != version:
+            entry = (version, orjson.dumps(build()))
+            self._entries[name] = entry
+        return Response(entry[1], media_type="application/json")
+
+
+# Errors and collected posts a task keeps for the status view
+TASK_HISTORY_SIZE = 10
+
+
 # Global state for background tasks
 class TaskState:
     is_running: bool = False
@@ -62,19 +179,249 @@ class TaskState:
     progress: int = 0
     total: int = 0
     message: str = ""
-    errors: list[str] = []
-    recent_posts: list[dict] = []  # Recently collected posts for live updates
+    
+    # Fields of snapshot(); assigning one wakes every open stream
+    _STATUS_FIELDS = frozenset({"is_running", "current_task", "progress", "total", "message"})
+    
+    def __init__(self):
+        # Bounded, so long runs keep only the latest entries without copying
+        self.errors: deque[str] = deque(maxlen=TASK_HISTORY_SIZE)
+        self.recent_posts: deque[dict] = deque(maxlen=TASK_HISTORY_SIZE)  # Last few collected posts
+        # Open /api/task/stream connections; each gets collected posts, and
+        # None whenever the status changes
+        self.listeners: set[asyncio.Queue] = set()
+    
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name in self._STATUS_FIELDS:
+            for queue in self.listeners:
+                queue.put_nowait(None)
+    
+    def claim(self) -> bool:
+        """
+        Mark a task as running, unless one already is.
+        
+        Endpoints call this right before scheduling their task. There is no
+        await between the check and the set, so on the event loop it is
+        atomic: of two concurrent requests, exactly one wins.
+        
+        Returns:
+            True if the caller now owns the task slot
+        """
+        if self.is_running:
+            return False
+        self.is_running = True
+        return True
+    
+    def add_recent_post(self, post: dict) -> None:
+        """Record a collected post and push it to every open stream."""
+        self.recent_posts.append(post)
+        for queue in self.listeners:
+            queue.put_nowait(post)
+    
+    def snapshot(self) -> dict:
+        """Current progress, without the recent posts."""
+        return {
+            "is_running": self.is_running,
+            "current_task": self.current_task,
+            "progress": self.progress,
+            "total": self.total,
+            "message": self.message,
+            "errors": list(self.errors),
+        }
 
 task_state = TaskState()
 
+# Outbound requests in flight for a background task, overall and per host
+TASK_CONCURRENCY = 32
+HOST_CONCURRENCY = 4
+
 
-def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
+class RateLimiter:
+    """
+    Token bucket pacing request starts: ``rate`` per ``per`` seconds.
+    
+    Up to ``rate`` requests start at once; after that, one starts every
+    ``per / rate`` seconds. Unlike sleeping after each request, time
+    spent waiting on a slow response counts toward the pacing.
+    """
+    
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Wait until another request may start."""
+        if self.per <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+
+# Validation result -> stored post status
+STATUS_MAP = {
+    URLStatus.ACCESSIBLE: PostStatus.ACCESSIBLE,
+    URLStatus.PRIVATE: PostStatus.PRIVATE,
+    URLStatus.LOGIN_REQUIRED: PostStatus.PRIVATE,
+    URLStatus.DELETED: PostStatus.DELETED,
+}
+
+
+async def run_for_posts(
+    posts: list[Post],
+    work: Callable[[Post], Awaitable[None]],
+    delay: float,
+    verb: str,
+    error_prefix: str = "",
+) -> None:
+    """
+    Run ``work`` for every post concurrently, updating task progress.
+    
+    At most HOST_CONCURRENCY posts per host (TASK_CONCURRENCY overall) are
+    in flight, and each host gets about HOST_CONCURRENCY new posts per
+    ``delay`` seconds (a RateLimiter per host). Slots are freed as soon as
+    a post is done, so slow responses do not add to the pacing.
+    
+    Args:
+        posts: Posts to process
+        work: Coroutine function handling one post
+        delay: Seconds per HOST_CONCURRENCY posts on one host (politeness)
+        verb: Progress message verb, e.g. "Validating"
+        error_prefix: Prefix for errors recorded in task_state.errors
+    """
+    overall = asyncio.Semaphore(TASK_CONCURRENCY)
+    per_host: defaultdict[str, asyncio.Semaphore] = defaultdict(
+        lambda: asyncio.Semaphore(HOST_CONCURRENCY)
+    )
+    pacers: defaultdict[str, RateLimiter] = defaultdict(
+        lambda: RateLimiter(HOST_CONCURRENCY, delay)
+    )
+    
+    async def run_one(post: Post) -> None:
+        host = urlsplit(post.url).hostname or ""
+        # Host slot and pacing first, so posts queued for a busy host hold
+        # no overall slot
+        async with per_host[host]:
+            await pacers[host].acquire()
+            async with overall:
+                task_state.message = f"{verb} {post.url[:50]}..."
+                try:
+                    await work(post)
+                except Exception as e:
+                    task_state.errors.append(f"{error_prefix}{post.id}: {str(e)}")
+        task_state.progress += 1
+    
+    await asyncio.gather(*(run_one(post) for post in posts))
+
+
+def _persist_scan(db: Database, unique_urls: list[ExtractedURL]) -> list[Post]:
+    """
+    Create pending posts for scanned URLs that are not in the database yet.
+    
+    Blocking (hashes URLs and writes post files); run it in a thread.
+    
+    Args:
+        db: Database to add the posts to
+        unique_urls: Deduplicated scanned URLs
+        
+    Returns:
+        The new pending posts, in scan order
+    """
+    existing_ids = db.existing_ids(url_obj.id for url_obj in unique_urls)
+    new_posts = [
+        Post(
+            id=url_obj.id,
+            url=url_obj.url,
+            platform=Platform(url_obj.platform),
+            status=PostStatus.PENDING,
+            source_file=str(url_obj.source_file),
+            source_context=url_obj.context,
+        )
+        for url_obj in unique_urls
+        if url_obj.id not in existing_ids
+    ]
+    db.save_posts(new_posts)
+    return new_posts
+
+
+def _read_page(path: Path) -> Optional[tuple[str, bytes]]:
+    """
+    Read a static page for serving from memory.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        (etag, bytes), or None if the file does not exist
+    """
+    try:
+        content = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"', content
+
+
+def _json_response(content) -> Response:
+    """
+    Encode a response body with orjson directly.
+    
+    Skips FastAPI's jsonable_encoder pass, which copies every container
+    before encoding. Values orjson does not know (e.g. Path) are encoded
+    as strings.
+    
+    Args:
+        content: JSON-compatible value
+    
+    Returns:
+        application/json response
+    """
+    return Response(orjson.dumps(content, default=str), media_type="application/json")
+
+
+def _posts_page_json(posts: list[bytes], total: int, limit: int, offset: int) -> bytes:
+    """
+    Encode a /api/posts response body.
+    
+    The posts arrive already encoded (``Database.list_posts_json``), so
+    they are only joined, not validated or serialized again.
+    
+    Args:
+        posts: JSON object per post on the page
+        total: Number of posts matching the filters
+        limit: Page size
+        offset: Page start
+    
+    Returns:
+        JSON object with ``posts``, ``total``, ``limit`` and ``offset``
+    """
+    return b'{"posts":[%b],"total":%d,"limit":%d,"offset":%d}' % (
+        b",".join(posts), total, limit, offset,
+    )
+
+
+# How long /api/task/stream waits for a just-requested task to start
+# before reporting it finished, and the least time between its events
+# (changes in between are sent together)
+STREAM_START_GRACE = 3.0
+STREAM_MIN_INTERVAL = 0.2
+
+
+def create_app(data_dir: Path, source_dir: Optional[Path] = None, debug: bool = False) -> FastAPI:
     """
     Create the FastAPI application.
     
     Args:
         data_dir: Path to the data directory
         source_dir: Default source directory for MD files
+        debug: Re-read the page template on every request (for editing it)
         
     Returns:
         Configured FastAPI app
@@ -94,8 +441,8 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
         allow_headers=["*"],
     )
     
-    # Initialize components
-    db = Database(data_dir)
+    # Initialize components (edits persist the index after a short debounce)
+    db = Database(data_dir, flush_delay=0.1)
     
     @app.on_event("startup")
     async def startup_event():
@@ -103,6 +450,15 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
         print("Building database index...")
         count = db.reindex()
         print(f"Index rebuilt: {count} posts")
+    
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Close pooled HTTP sessions and persist pending index changes."""
+        await close_scrapers()
+        await validator.close()
+        await downloader.close()
+        db.close()
+    
     downloader = MediaDownloader(
         media_dir=data_dir / "media",
         thumbnails_dir=data_dir / "thumbnails",
@@ -130,21 +486,26 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
     thumbnails_dir.mkdir(parents=True, exist_ok=True)
     
     if media_dir.exists():
-        app.mount("/media", StaticFiles(directory=str(media_dir)), name="media")
+        app.mount("/media", MediaFiles(directory=str(media_dir)), name="media")
     if thumbnails_dir.exists():
-        app.mount("/thumbnails", StaticFiles(directory=str(thumbnails_dir)), name="thumbnails")
+        app.mount("/thumbnails", MediaFiles(directory=str(thumbnails_dir)), name="thumbnails")
     
     # ==================== PAGE ROUTES ====================
     
+    template_path = MODULE_DIR / "templates" / "index.html"
+    index_page = _read_page(template_path)  # Read once; the page is static
+    
     @app.get("/", response_class=HTMLResponse)
-    async def index():
-        """Serve the main HTML page."""
-        template_path = MODULE_DIR / "templates" / "index.html"
-        if not template_path.exists():
+    async def index(request: Request):
+        """Serve the main HTML page from memory (304 when the browser has it)."""
+        page = _read_page(template_path) if debug else index_page
+        if page is None:
             return HTMLResponse("<h1>Template not found</h1>", status_code=500)
         
-        with open(template_path, 'r', encoding='utf-8') as f:
-            return HTMLResponse(f.read())
+        etag, content = page
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return HTMLResponse(content, headers={"ETag": etag})
     
     # ==================== POSTS API ====================
     
@@ -177,23 +538,20 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             sort_desc=sort_desc,
         )
         
-        posts = db.list_posts(filters)
-        total = db.count()
+        posts = db.list_posts_json(filters)
+        total = db.count_posts(filters)  # Cached by list_posts_json
         
-        return {
-            "posts": [post.model_dump() for post in posts],
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-        }
+        return Response(
+            _posts_page_json(posts, total, limit, offset), media_type="application/json"
+        )
     
     @app.get("/api/posts/{post_id}")
     async def get_post(post_id: str):
         """Get a single post by ID."""
-        post = db.get_post(post_id)
-        if not post:
+        post = db.get_post_json(post_id)
+        if post is None:
             raise HTTPException(status_code=404, detail="Post not found")
-        return post.model_dump()
+        return Response(post, media_type="application/json")
     
     @app.delete("/api/posts/{post_id}")
     async def delete_post(post_id: str):
@@ -231,35 +589,43 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
     
     # ==================== STATS & FILTERS API ====================
     
+    response_cache = ResponseCache(db)
+    
     @app.get("/api/stats")
     async def get_stats():
         """Get collection statistics."""
-        stats = db.get_stats()
-        return stats.model_dump()
+        return response_cache.get("stats", lambda: db.get_stats().model_dump())
     
     @app.get("/api/analytics")
     async def get_analytics():
         """Get detailed analytics."""
-        return db.get_analytics()
+        return response_cache.get("analytics", db.get_analytics)
     
     @app.get("/api/filters")
     async def get_filter_options():
         """Get available filter options."""
-        return {
+        return response_cache.get("filters", lambda: {
             "platforms": [p.value for p in Platform],
             "statuses": [s.value for s in PostStatus],
             "authors": db.get_all_authors(),
             "tags": db.get_all_tags(),
             "categories": db.get_all_categories(),
-        }
+        })
+    
+    thumbnail_cache = ThumbnailCache(thumbnails_dir)
     
     @app.get("/api/thumbnail/{post_id}")
-    async def get_thumbnail(post_id: str):
-        """Get thumbnail for a post."""
-        thumb_path = thumbnails_dir / f"{post_id}.jpg"
-        if thumb_path.exists():
-            return FileResponse(thumb_path)
-        raise HTTPException(status_code=404, detail="Thumbnail not found")
+    async def get_thumbnail(post_id: str, request: Request):
+        """Get thumbnail for a post (served from memory for the hot set)."""
+        cached = thumbnail_cache.get(post_id)
+        if cached is None:
+            raise HTTPException(status_code=404, detail="Thumbnail not found")
+        
+        etag, content = cached
+        headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=content, media_type="image/jpeg", headers=headers)
     
     # ==================== COLLECTION MANAGEMENT API ====================
     
@@ -293,20 +659,22 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
     class DeleteRequest(BaseModel):
         ids: list[str]
 
-    def _delete_post_files(post_id: str):
-        """Helper to delete files associated with a post."""
-        post = db.get_post(post_id)
+    def _delete_post_files(post_id: str, post: Optional[Post] = None):
+        """
+        Helper to delete the files a post records (loaded if not given).
+        
+        Files tracked by the downloader are deleted separately, with
+        downloader.delete_media or delete_media_many.
+        """
+        if post is None:
+            post = db.get_post(post_id)
         if post:
             # Explicit paths
             if post.thumbnail_path:
                 Path(post.thumbnail_path).unlink(missing_ok=True)
             for media_path in post.media_paths:
                 Path(media_path).unlink(missing_ok=True)
-        
-        # Cleanup by convention
-        (downloader.thumbnails_dir / f"{post_id}.jpg").unlink(missing_ok=True)
-        for f in downloader.media_dir.glob(f"{post_id}.*"):
-            f.unlink(missing_ok=True)
+        thumbnail_cache.discard(post_id)
 
     @app.delete("/api/posts/{post_id}")
     async def delete_post(post_id: str):
@@ -315,27 +683,35 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             raise HTTPException(status_code=404, detail="Post not found")
         
         _delete_post_files(post_id)
+        downloader.delete_media(post_id)
         db.delete_post(post_id)
         return {"success": True, "id": post_id}
 
     @app.delete("/api/posts")
     async def delete_posts(body: DeleteRequest):
         """Delete multiple posts."""
-        deleted_count = 0
+        deleted_ids = []
         errors = []
         
-        for post_id in body.ids:
-            try:
-                if db.exists(post_id):
-                    _delete_post_files(post_id)
-                    db.delete_post(post_id)
-                    deleted_count += 1
-            except Exception as e:
-                errors.append(f"{post_id}: {str(e)}")
+        # Load every post once up front; the indexes are persisted once at the end.
+        # Posts whose file is missing or unreadable are deleted too.
+        existing = db.existing_ids(body.ids)
+        posts = db.get_posts(existing)
+        with db.batch():
+            for post_id in body.ids:
+                try:
+                    if post_id in existing:
+                        existing.discard(post_id)
+                        _delete_post_files(post_id, posts.get(post_id))
+                        db.delete_post(post_id)
+                        deleted_ids.append(post_id)
+                except Exception as e:
+                    errors.append(f"{post_id}: {str(e)}")
+        downloader.delete_media_many(deleted_ids)
         
         return {
             "success": True, 
-            "deleted_count": deleted_count, 
+            "deleted_count": len(deleted_ids), 
             "errors": errors
         }
 
@@ -347,7 +723,7 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             limit=500,
         )
         posts = db.list_posts(filters)
-        return [
+        return _json_response([
             {
                 "id": p.id,
                 "url": p.url,
@@ -357,7 +733,7 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
                 "error_message": p.error_message,
             }
             for p in posts
-        ]
+        ])
     
     @app.post("/api/scan")
     async def scan_urls(body: Optional[ScanRequest] = None):
@@ -376,47 +752,38 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             if not source.exists():
                 raise HTTPException(status_code=400, detail=f"Source directory not found: {source}")
             
-            # Scan for URLs
-            collection = scan_directory(source, pattern=pattern, recursive=recursive)
-            duplicates_report = detect_duplicates(collection.urls)
-            unique_urls = collection.unique_urls()
+            # Scan for URLs and create pending posts for new ones. This reads,
+            # hashes and writes thousands of files, so it runs in one worker
+            # thread call instead of blocking the event loop.
+            def scan():
+                collection = scan_directory(source, pattern=pattern, recursive=recursive)
+                analysis = analyze_urls(collection.urls)
+                return collection, analysis, len(_persist_scan(db, analysis.unique))
             
-            # Count new vs existing
-            new_count = 0
-            existing_count = 0
-            
-            for url_obj in unique_urls:
-                if db.exists(url_obj.id):
-                    existing_count += 1
-                else:
-                    new_count += 1
-                    # Create pending post
-                    post = Post(
-                        id=url_obj.id,
-                        url=url_obj.url,
-                        platform=Platform(url_obj.platform),
-                        status=PostStatus.PENDING,
-                        source_file=str(url_obj.source_file),
-                        source_context=url_obj.context,
-                    )
-                    db.save_post(post)
+            if not task_state.claim():
+                raise HTTPException(status_code=409, detail="Another task is running")
+            try:
+                collection, analysis, new_count = await asyncio.to_thread(scan)
+            finally:
+                task_state.is_running = False
+            unique_urls = analysis.unique
+            existing_count = len(unique_urls) - new_count
             
-            # Get platform breakdown
-            by_platform = {}
-            for url_obj in unique_urls:
-                by_platform[url_obj.platform] = by_platform.get(url_obj.platform, 0) + 1
+            by_platform = dict(analysis.by_platform)
+            duplicates_report = analysis.duplicates
                 
-            # Prepare duplicate list
-            duplicate_items = []
-            for url_id, urls in list(duplicates_report.duplicates.items())[:50]:
-                if not urls: continue
-                duplicate_items.append({
+            # Prepare duplicate list (source paths are encoded by orjson)
+            duplicate_items = [
+                {
                     "url": urls[0].url,
                     "count": len(urls),
-                    "files": [str(u.source_file) for u in urls]
-                })
+                    "files": [u.source_file for u in urls],
+                }
+                for urls in itertools.islice(duplicates_report.duplicates.values(), 50)
+                if urls
+            ]
             
-            return {
+            return _json_response({
                 "success": True,
                 "source_dir": str(source),
                 "files_scanned": len(collection.source_files),
@@ -427,7 +794,7 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
                 "duplicates": duplicates_report.total_duplicates,
                 "duplicate_list": duplicate_items,
                 "by_platform": by_platform,
-            }
+            })
         except HTTPException:
             raise
         except Exception as e:
@@ -437,20 +804,68 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
     
     @app.get("/api/task/status")
     async def get_task_status():
-        """Get current background task status."""
-        # Get and clear recent posts
-        recent = task_state.recent_posts[-10:]
-        task_state.recent_posts = []
+        """Get a snapshot of the current background task status."""
+        return {**task_state.snapshot(), "recent_posts": list(task_state.recent_posts)}
+    
+    @app.get("/api/task/stream")
+    async def stream_task_status():
+        """
+        Stream task progress as Server-Sent Events until the task finishes.
         
-        return {
-            "is_running": task_state.is_running,
-            "current_task": task_state.current_task,
-            "progress": task_state.progress,
-            "total": task_state.total,
-            "message": task_state.message,
-            "errors": task_state.errors[-10:],
-            "recent_posts": recent,  # New posts collected since last check
-        }
+        Each event is a status snapshot plus the posts collected since the
+        previous event. The stream sleeps until TaskState reports a change,
+        so nothing is polled, and snapshots are only sent when something
+        changed.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def events():
+            task_state.listeners.add(queue)
+            try:
+                loop = asyncio.get_running_loop()
+                connected_at = loop.time()
+                seen_running = False
+                last = None
+                sent_at = -STREAM_MIN_INTERVAL
+                recent = []
+                while True:
+                    status = task_state.snapshot()
+                    seen_running = seen_running or status["is_running"]
+                    finished = not status["is_running"] and (
+                        seen_running or loop.time() - connected_at > STREAM_START_GRACE
+                    )
+                    if status["is_running"] and (recent or status != last) or finished:
+                        event = {**status, "recent_posts": recent}
+                        yield b"data: " + orjson.dumps(event) + b"\n\n"
+                        last = status
+                        sent_at = loop.time()
+                    if finished:
+                        return
+                    
+                    # Wait for a change; until the task has started, only
+                    # for the rest of the grace period
+                    timeout = None
+                    if not seen_running:
+                        timeout = max(0.0, STREAM_START_GRACE - (loop.time() - connected_at))
+                    try:
+                        items = [await asyncio.wait_for(queue.get(), timeout)]
+                    except asyncio.TimeoutError:
+                        items = []
+                    # Let a burst of changes (one per finished post) gather
+                    pause = STREAM_MIN_INTERVAL - (loop.time() - sent_at)
+                    if items and pause > 0:
+                        await asyncio.sleep(pause)
+                    while not queue.empty():
+                        items.append(queue.get_nowait())
+                    recent = [item for item in items if item is not None]
+            finally:
+                task_state.listeners.discard(queue)
+        
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache"},
+        )
     
     @app.post("/api/validate")
     async def validate_urls(background_tasks: BackgroundTasks, body: Optional[ProcessRequest] = None):
@@ -463,7 +878,7 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
         
         # Get posts to validate
         if body and body.post_ids:
-            posts = [db.get_post(pid) for pid in body.post_ids if db.get_post(pid)]
+            posts = list(db.get_posts(body.post_ids).values())
         else:
             # Get all pending posts
             filters = FilterOptions(statuses=[PostStatus.PENDING], limit=500)
@@ -473,42 +888,28 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             return {"success": True, "message": "No posts to validate", "count": 0}
         
         async def validate_task():
-            task_state.is_running = True
             task_state.current_task = "Validating URLs"
             task_state.progress = 0
             task_state.total = len(posts)
-            task_state.errors = []
+            task_state.errors.clear()
+            
+            async def validate_one(post: Post) -> None:
+                result = await validator.validate(post.url)
+                
+                # Map validation result to post status
+                post.status = STATUS_MAP.get(result.status, PostStatus.FAILED)
+                post.validated_at = datetime.now()
+                post.error_message = result.error_message
+                db.save_post(post)
             
             try:
-                for i, post in enumerate(posts):
-                    task_state.progress = i + 1
-                    task_state.message = f"Validating {post.url[:50]}..."
-                    
-                    try:
-                        result = await validator.validate(post.url)
-                        
-                        # Map validation result to post status
-                        status_map = {
-                            URLStatus.ACCESSIBLE: PostStatus.ACCESSIBLE,
-                            URLStatus.PRIVATE: PostStatus.PRIVATE,
-                            URLStatus.LOGIN_REQUIRED: PostStatus.PRIVATE,
-                            URLStatus.DELETED: PostStatus.DELETED,
-                        }
-                        
-                        post.status = status_map.get(result.status, PostStatus.FAILED)
-                        post.validated_at = datetime.now()
-                        post.error_message = result.error_message
-                        db.save_post(post)
-                        
-                    except Exception as e:
-                        task_state.errors.append(f"{post.id}: {str(e)}")
-                    
-                    await asyncio.sleep(0.5)  # Rate limiting
-                    
+                await run_for_posts(posts, validate_one, delay=0.5, verb="Validating")
             finally:
                 task_state.is_running = False
                 task_state.message = "Validation complete"
         
+        if not task_state.claim():
+            raise HTTPException(status_code=409, detail="Another task is running")
         background_tasks.add_task(validate_task)
         
         return {
@@ -528,7 +929,7 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
         
         # Get posts to scrape
         if body and body.post_ids:
-            posts = [db.get_post(pid) for pid in body.post_ids if db.get_post(pid)]
+            posts = list(db.get_posts(body.post_ids).values())
         else:
             # Get accessible posts without scraped data
             filters = FilterOptions(statuses=[PostStatus.ACCESSIBLE], limit=500)
@@ -538,73 +939,68 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             return {"success": True, "message": "No posts to scrape", "count": 0}
         
         async def scrape_task():
-            task_state.is_running = True
             task_state.current_task = "Scraping metadata"
             task_state.progress = 0
             task_state.total = len(posts)
-            task_state.errors = []
+            task_state.errors.clear()
             
-            try:
-                for i, post in enumerate(posts):
-                    task_state.progress = i + 1
-                    task_state.message = f"Scraping {post.url[:50]}..."
+            async def scrape_one(post: Post) -> None:
+                result = await scrape_url(
+                    post.url, 
+                    timeout=30,
+                    cookies_from_browser=config_state.get("cookies_from_browser"),
+                    cookies_file=config_state.get("cookies_file"),
+                )
+                
+                if result.success:
+                    post.author = result.author
+                    post.author_url = result.author_url
+                    post.title = result.title
+                    post.content = result.content
+                    post.posted_at = result.posted_at
+                    post.views = result.views
+                    post.likes = result.likes
+                    post.comments = result.comments
+                    post.shares = result.shares
+                    post.thumbnail_url = result.thumbnail_url
+                    post.media_urls = result.media_urls
+                    post.media_type = result.media_type
+                    post.scraped_at = datetime.now()
                     
-                    try:
-                        result = await scrape_url(
-                            post.url, 
-                            timeout=30,
-                            cookies_from_browser=config_state.get("cookies_from_browser"),
-                            cookies_file=config_state.get("cookies_file"),
+                    # Download thumbnail
+                    if result.thumbnail_url:
+                        thumb_path = await downloader.download_thumbnail_only(
+                            post.url, post.id,
+                            cookies_from_browser=config_state.get('cookies_from_browser'),
+                            thumbnail_url=result.thumbnail_url,
                         )
-                        
-                        if result.success:
-                            post.author = result.author
-                            post.author_url = result.author_url
-                            post.title = result.title
-                            post.content = result.content
-                            post.posted_at = result.posted_at
-                            post.views = result.views
-                            post.likes = result.likes
-                            post.comments = result.comments
-                            post.shares = result.shares
-                            post.thumbnail_url = result.thumbnail_url
-                            post.media_urls = result.media_urls
-                            post.media_type = result.media_type
-                            post.scraped_at = datetime.now()
-                            
-                            # Download thumbnail
-                            if result.thumbnail_url:
-                                thumb_path = await downloader.download_thumbnail_only(
-                                    post.url, post.id, cookies_from_browser=config_state.get('cookies_from_browser')
-                                )
-                                if thumb_path:
-                                    post.thumbnail_path = thumb_path
-                            
-                            # Add to recent posts for live UI update
-                            task_state.recent_posts.append({
-                                "id": post.id,
-                                "url": post.url,
-                                "platform": post.platform,
-                                "author": post.author,
-                                "content": post.content[:100] if post.content else None,
-                                "views": post.views,
-                                "likes": post.likes,
-                                "thumbnail_path": post.thumbnail_path,
-                            })
-                        else:
-                            post.error_message = result.error_message
-                        
-                        db.save_post(post)
-                        
-                    except Exception as e:
-                        task_state.errors.append(f"{post.id}: {str(e)}")
-                    
-                    await asyncio.sleep(1.0)  # Rate limiting
+                        if thumb_path:
+                            post.thumbnail_path = thumb_path
                     
+                    # Add to recent posts for live UI update
+                    task_state.add_recent_post({
+                        "id": post.id,
+                        "url": post.url,
+                        "platform": post.platform,
+                        "author": post.author,
+                        "content": post.content[:100] if post.content else None,
+                        "views": post.views,
+                        "likes": post.likes,
+                        "thumbnail_path": post.thumbnail_path,
+                    })
+                else:
+                    post.error_message = result.error_message
+                
+                db.save_post(post)
+            
+            try:
+                await run_for_posts(posts, scrape_one, delay=1.0, verb="Scraping")
             finally:
                 task_state.is_running = False
                 task_state.message = "Scraping complete"
         
+        if not task_state.claim():
+            raise HTTPException(status_code=409, detail="Another task is running")
         background_tasks.add_task(scrape_task)
         
         return {
@@ -641,6 +1037,15 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
+    async def _download_post_media(post: Post) -> None:
+        """Download a post's media and record the files on the post."""
+        result = await downloader.download(post.url, post.id, media_urls=post.media_urls, cookies_from_browser=config_state.get('cookies_from_browser'), author=post.author)
+        if result.success:
+            post.media_paths = result.media_paths
+            if result.thumbnail_path:
+                post.thumbnail_path = result.thumbnail_path
+            db.save_post(post)
+    
     @app.post("/api/download/{post_id}")
     async def download_media(post_id: str, background_tasks: BackgroundTasks):
         """Download media for a specific post."""
@@ -653,12 +1058,7 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
         
         async def download_task():
             try:
-                result = await downloader.download(post.url, post.id, media_urls=post.media_urls, cookies_from_browser=config_state.get('cookies_from_browser'), author=post.author)
-                if result.success:
-                    post.media_paths = result.media_paths
-                    if result.thumbnail_path:
-                        post.thumbnail_path = result.thumbnail_path
-                    db.save_post(post)
+                await _download_post_media(post)
             except Exception as e:
                 pass  # Silently fail for individual downloads
         
@@ -673,42 +1073,25 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             raise HTTPException(status_code=409, detail="Another task is running")
         
         # Filter posts that need download
-        posts = []
-        for pid in body.post_ids:
-            post = db.get_post(pid)
-            if post and not post.media_paths:
-                posts.append(post)
+        posts = [post for post in db.get_posts(body.post_ids).values() if not post.media_paths]
         
         if not posts:
             return {"success": True, "message": "No media to download", "count": 0}
         
         async def download_batch_task():
-            task_state.is_running = True
             task_state.current_task = "Batch Downloading"
             task_state.progress = 0
             task_state.total = len(posts)
-            task_state.errors = []
+            task_state.errors.clear()
             
             try:
-                for i, post in enumerate(posts):
-                    task_state.progress = i + 1
-                    task_state.message = f"Downloading {post.id}..."
-                    
-                    try:
-                        result = await downloader.download(post.url, post.id, media_urls=post.media_urls, cookies_from_browser=config_state.get('cookies_from_browser'), author=post.author)
-                        if result.success:
-                            post.media_paths = result.media_paths
-                            if result.thumbnail_path:
-                                post.thumbnail_path = result.thumbnail_path
-                            db.save_post(post)
-                    except Exception as e:
-                        task_state.errors.append(f"{post.id}: {str(e)}")
-                    
-                    await asyncio.sleep(0.5)
+                await run_for_posts(posts, _download_post_media, delay=0.5, verb="Downloading")
             finally:
                 task_state.is_running = False
                 task_state.message = "Batch download complete"
         
+        if not task_state.claim():
+            raise HTTPException(status_code=409, detail="Another task is running")
         background_tasks.add_task(download_batch_task)
         return {"success": True, "message": f"Batch download started for {len(posts)} posts", "count": len(posts)}
 
@@ -731,33 +1114,19 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             return {"success": True, "message": "No media to download", "count": 0}
         
         async def download_all_task():
-            task_state.is_running = True
             task_state.current_task = "Downloading media"
             task_state.progress = 0
             task_state.total = len(posts)
-            task_state.errors = []
+            task_state.errors.clear()
             
             try:
-                for i, post in enumerate(posts):
-                    task_state.progress = i + 1
-                    task_state.message = f"Downloading {post.id}..."
-                    
-                    try:
-                        result = await downloader.download(post.url, post.id, media_urls=post.media_urls, cookies_from_browser=config_state.get('cookies_from_browser'), author=post.author)
-                        if result.success:
-                            post.media_paths = result.media_paths
-                            if result.thumbnail_path:
-                                post.thumbnail_path = result.thumbnail_path
-                            db.save_post(post)
-                    except Exception as e:
-                        task_state.errors.append(f"{post.id}: {str(e)}")
-                    
-                    await asyncio.sleep(0.5)
-                    
+                await run_for_posts(posts, _download_post_media, delay=0.5, verb="Downloading")
             finally:
                 task_state.is_running = False
                 task_state.message = "Download complete"
         
+        if not task_state.claim():
+            raise HTTPException(status_code=409, detail="Another task is running")
         background_tasks.add_task(download_all_task)
         
         return {
@@ -775,92 +1144,77 @@ def create_app(data_dir: Path, source_dir: Optional[Path] = None) -> FastAPI:
             raise HTTPException(status_code=409, detail="Another task is running")
         
         async def full_pipeline():
-            task_state.is_running = True
-            task_state.errors = []
+            task_state.errors.clear()
             
             try:
                 # Step 1: Scan
                 task_state.current_task = "Scanning MD files"
                 task_state.message = "Scanning for URLs..."
                 
-                collection = scan_directory(config_state["source_dir"], pattern="*.md", recursive=True)
-                unique_urls = collection.unique_urls()
+                def scan():
+                    collection = scan_directory(config_state["source_dir"], pattern="*.md", recursive=True)
+                    return _persist_scan(db, collection.unique_urls())
                 
-                new_posts = []
-                for url_obj in unique_urls:
-                    if not db.exists(url_obj.id):
-                        post = Post(
-                            id=url_obj.id,
-                            url=url_obj.url,
-                            platform=Platform(url_obj.platform),
-                            status=PostStatus.PENDING,
-                            source_file=str(url_obj.source_file),
-                            source_context=url_obj.context,
-                        )
-                        db.save_post(post)
-                        new_posts.append(post)
+                new_posts = await asyncio.to_thread(scan)
                 
-                # Step 2: Validate new posts
-                task_state.current_task = "Validating URLs"
+                # Step 2: Validate new posts and scrape the accessible ones.
+                # Each post goes on to scraping as soon as it validates, so
+                # scrapes overlap the rest of the validation.
+                task_state.current_task = "Validating and scraping"
+                task_state.progress = 0
                 task_state.total = len(new_posts)
                 
-                for i, post in enumerate(new_posts):
-                    task_state.progress = i + 1
-                    task_state.message = f"Validating {i+1}/{len(new_posts)}..."
-                    
-                    try:
-                        result = await validator.validate(post.url)
-                        status_map = {
-                            URLStatus.ACCESSIBLE: PostStatus.ACCESSIBLE,
-                            URLStatus.PRIVATE: PostStatus.PRIVATE,
-                            URLStatus.LOGIN_REQUIRED: PostStatus.PRIVATE,
-                            URLStatus.DELETED: PostStatus.DELETED,
-                        }
-                        post.status = status_map.get(result.status, PostStatus.FAILED)
-                        post.validated_at = datetime.now()
-                        db.save_post(post)
-                    except Exception as e:
-                        task_state.errors.append(f"Validate {post.id}: {e}")
-                    
-                    await asyncio.sleep(0.5)
-                
-                # Step 3: Scrape accessible posts
-                accessible = [p for p in new_posts if p.status == PostStatus.ACCESSIBLE]
-                task_state.current_task = "Scraping metadata"
-                task_state.total = len(accessible)
+                async def validate_one(post: Post) -> None:
+                    result = await validator.validate(post.url)
+                    post.status = STATUS_MAP.get(result.status, PostStatus.FAILED)
+                    post.validated_at = datetime.now()
+                    db.save_post(post)
                 
-                for i, post in enumerate(accessible):
-                    task_state.progress = i + 1
-                    task_state.message = f"Scraping {i+1}/{len(accessible)}..."
+                async def scrape_one(post: Post) -> None:
+                    result = await scrape_url(post.url, timeout=30)
+                    if result.success:
+                        post.author = result.author
+                        post.content = result.content
+                        post.posted_at = result.posted_at
+                        post.views = result.views
+                        post.likes = result.likes
+                        post.thumbnail_url = result.thumbnail_url
+                        post.media_urls = result.media_urls
+                        post.scraped_at = datetime.now()
+                        
+                        # Download thumbnail
+                        thumb = await downloader.download_thumbnail_only(
+                            post.url, post.id, thumbnail_url=result.thumbnail_url,
+                        )
+                        if thumb:
+                            post.thumbnail_path = thumb
                     
+                    db.save_post(post)
+                
+                async def process_one(post: Post) -> None:
                     try:
-                        result = await scrape_url(post.url, timeout=30)
-                        if result.success:
-                            post.author = result.author
-                            post.content = result.content
-                            post.posted_at = result.posted_at
-                            post.views = result.views
-                            post.likes = result.likes
-                            post.thumbnail_url = result.thumbnail_url
-                            post.media_urls = result.media_urls
-                            post.scraped_at = datetime.now()
-                            
-                            # Download thumbnail
-                            thumb = await downloader.download_thumbnail_only(post.url, post.id)
-                            if thumb:
-                                post.thumbnail_path = thumb
-                        
-                        db.save_post(post)
+                        await validate_one(post)
                     except Exception as e:
-                        task_state.errors.append(f"Scrape {post.id}: {e}")
-                    
-                    await asyncio.sleep(1.0)
+                        task_state.errors.append(f"Validate {post.id}: {str(e)}")
+                        return
+                    if post.status == PostStatus.ACCESSIBLE:
+                        await scrape_one(post)  # Errors recorded by run_for_posts
+                
+                # One index transaction (and data.js export) for the stage;
+                # the API reads the in-memory index, which is updated as it goes
+                with db.batch():
+                    await run_for_posts(
+                        new_posts, process_one, delay=1.0, verb="Processing", error_prefix="Scrape ",
+                    )
                 
+                accessible = [p for p in new_posts if p.status == PostStatus.ACCESSIBLE]
                 task_state.message = f"Complete: {len(new_posts)} new, {len(accessible)} scraped"
                 
             finally:
                 task_state.is_running = False
         
+        if not task_state.claim():
+            raise HTTPException(status_code=409, detail="Another task is running")
         background_tasks.add_task(full_pipeline)
         
         return {"success": True, "message": "Full pipeline started"}
@@ -887,6 +1241,6 @@ def run_server(
     """
     import uvicorn
     
-    app = create_app(data_dir, source_dir)
+    app = create_app(data_dir, source_dir, debug=debug)
     uvicorn.run(app, host=host, port=port, reload=debug)
 
@@ -10,7 +10,7 @@ let postsPerPage = 50;
 let currentView = 'grid';
 let selectedTags = new Set();
 let selectedPosts = new Set();
-let taskPollingInterval = null;
+let taskStream = null;
 let inaccessiblePosts = [];
 
 // API Base URL
@@ -1049,33 +1049,34 @@ function updateProgress(taskName, progress, total, message) {
 }
 
 function startTaskPolling() {
-    if (taskPollingInterval) return;
+    if (taskStream) return;
     showProgress(true);
 
-    taskPollingInterval = setInterval(async () => {
-        try {
-            const response = await fetch(`${API_BASE}/api/task/status`);
-            const status = await response.json();
+    // Server pushes progress (Server-Sent Events) instead of us polling
+    taskStream = new EventSource(`${API_BASE}/api/task/stream`);
+    taskStream.onmessage = (event) => {
+        const status = JSON.parse(event.data);
 
-            if (status.is_running) {
-                updateProgress(status.current_task, status.progress, status.total, status.message);
+        if (status.is_running) {
+            updateProgress(status.current_task, status.progress, status.total, status.message);
 
-                // Add new posts to grid in real-time
-                if (status.recent_posts && status.recent_posts.length > 0) {
-                    addRecentPosts(status.recent_posts);
-                }
-            } else {
-                stopTaskPolling();
-                showProgress(false);
-                loadStats();
-                loadPosts();
-                checkInaccessible();
-                showToast(status.message || '작업 완료!', 'success');
+            // Add new posts to grid in real-time
+            if (status.recent_posts && status.recent_posts.length > 0) {
+                addRecentPosts(status.recent_posts);
             }
-        } catch (error) {
-            console.error('Polling error:', error);
+        } else {
+            stopTaskPolling();
+            showProgress(false);
+            loadStats();
+            loadPosts();
+            checkInaccessible();
+            showToast(status.message || '작업 완료!', 'success');
         }
-    }, 1000);
+    };
+    taskStream.onerror = (error) => {
+        // EventSource reconnects by itself; just log
+        console.error('Task stream error:', error);
+    };
 }
 
 function addRecentPosts(recentPosts) {
@@ -1177,9 +1178,9 @@ function addRecentPosts(recentPosts) {
 }
 
 function stopTaskPolling() {
-    if (taskPollingInterval) {
-        clearInterval(taskPollingInterval);
-        taskPollingInterval = null;
+    if (taskStream) {
+        taskStream.close();
+        taskStream = null;
     }
 }
 
@@ -1254,7 +1255,7 @@ async function removeTag(postId, tagToRemove) {
 
 async function downloadSelectedPosts() {
     if (selectedPosts.size === 0) return;
-    if (taskPollingInterval) {
+    if (taskStream) {
         showToast('다른 작업이 진행 중입니다', 'error');
         return;
     }
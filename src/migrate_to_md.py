@@ -1,6 +1,7 @@
 
-import json
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import sys
 
@@ -10,6 +11,15 @@ sys.path.append(str(Path(__file__).parent.parent))
 from src.media_toolkit.storage.db import Database
 from src.media_toolkit.storage.models import Post
 
+def _load_json_post(json_file: Path):
+    """Read and validate one JSON post (runs in a worker process)."""
+    try:
+        # Parsed and validated in one pass by pydantic-core
+        return json_file, Post.model_validate_json(json_file.read_bytes()), None
+    except Exception as e:
+        # Send back the message: not every exception survives pickling
+        return json_file, None, str(e)
+
 def migrate():
     root_dir = Path("data")
     if not root_dir.exists():
@@ -41,29 +51,29 @@ def migrate():
     # In db.py: self.posts_dir = self.data_dir / "posts".
     # So if we pass `Path("data")`, posts_dir is `data/posts`. Correct.
     
-    db = Database(root_dir) 
+    db = Database(root_dir, synchronous="OFF")  # One-shot import; reindex can rebuild the index
     
     count = 0
-    for json_file in json_files:
-        try:
-            # Read JSON
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Validate Post
-            post = Post.model_validate(data)
+    # Parsing and validation run in worker processes; this process does all
+    # the writes, and writes the index once, not per post
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, db.batch():
+        for json_file, post, error in executor.map(_load_json_post, json_files, chunksize=64):
+            if error is not None:
+                print(f"Failed to migrate {json_file.name}: {error}")
+                continue
             
-            # Save as MD (this handles frontmatter conversion)
-            db.save_post(post)
+            try:
+                # Save as MD (this handles frontmatter conversion)
+                db.save_post(post)
             
-            # Move JSON to backup
-            shutil.move(str(json_file), str(backup_dir / json_file.name))
+                # Move JSON to backup
+                shutil.move(str(json_file), str(backup_dir / json_file.name))
             
-            count += 1
-            print(f"Migrated {post.id}")
+                count += 1
+                print(f"Migrated {post.id}")
             
-        except Exception as e:
-            print(f"Failed to migrate {json_file.name}: {e}")
+            except Exception as e:
+                print(f"Failed to migrate {json_file.name}: {e}")
     
     print(f"\nMigration complete. {count} posts migrated.")
     print(f"Original JSON files moved to {backup_dir}")
@@ -0,0 +1,143 @@
+"""Tests for the downloader module."""
+
+import requests
+
+from media_toolkit.downloader import media_downloader
+from media_toolkit.downloader.general_downloader import DownloadManager
+from media_toolkit.extractor.base import MediaItem
+
+
+class FakeContent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.chunk_sizes = []
+
+    async def iter_chunked(self, size):
+        self.chunk_sizes.append(size)
+        for chunk in self.chunks:
+            yield chunk
+
+
+class FakeResponse:
+    def __init__(self, chunks):
+        self.content = FakeContent(chunks)
+
+
+class TestStreamToFile:
+    """Tests for _stream_to_file."""
+
+    async def test_writes_chunks_in_order(self, tmp_path):
+        dest = tmp_path / "out.bin"
+        dest.write_bytes(b"old contents that are longer")
+        response = FakeResponse([b"abc", b"", b"defg"])
+
+        assert await media_downloader._stream_to_file(response, dest) == 7
+        assert dest.read_bytes() == b"abcdefg"
+        assert response.content.chunk_sizes == [media_downloader.STREAM_CHUNK_SIZE]
+
+
+class TestMediaDownloader:
+    """Tests for MediaDownloader."""
+
+    async def test_session_is_pooled_until_closed(self, tmp_path):
+        downloader = media_downloader.MediaDownloader(tmp_path / "media", tmp_path / "thumbs")
+
+        session = downloader._get_session()
+        assert downloader._get_session() is session
+
+        await downloader.close()
+        assert session.closed
+        await downloader.close()  # Closing twice is harmless
+
+    def test_delete_media_many_uses_index(self, tmp_path, monkeypatch):
+        media_dir = tmp_path / "media"
+        media_dir.mkdir()
+        legacy = media_dir / "0123456789ab_1.jpg"  # Fallback download missing from the index
+        legacy.write_bytes(b"x")
+        (media_dir / "notes.txt").write_bytes(b"keep")
+
+        downloader = media_downloader.MediaDownloader(media_dir, tmp_path / "thumbs")
+        tracked = media_dir / "alice" / "clip-xyz.mp4"
+        tracked.parent.mkdir()
+        tracked.write_bytes(b"v")
+        downloader._record_media("fedcba987654", [str(tracked)])
+        (downloader.thumbnails_dir / "fedcba987654.jpg").write_bytes(b"t")
+
+        saves = []
+        monkeypatch.setattr(downloader, "_save_index", lambda: saves.append(1))
+        assert downloader.delete_media_many(["0123456789ab", "fedcba987654", "missing"]) == 2
+        assert saves == [1]
+        assert not legacy.exists() and not tracked.exists()
+        assert not (downloader.thumbnails_dir / "fedcba987654.jpg").exists()
+        assert (media_dir / "notes.txt").exists()
+        assert downloader.delete_media("fedcba987654") is False
+
+    async def test_thumbnail_only_keeps_existing(self, tmp_path, monkeypatch):
+        downloader = media_downloader.MediaDownloader(tmp_path / "media", tmp_path / "thumbs")
+        fetched = []
+
+        async def fetch(thumbnail_url, post_id):
+            fetched.append(post_id)
+            return "new.jpg"
+
+        monkeypatch.setattr(downloader, "_fetch_thumbnail", fetch)
+        existing = downloader.thumbnails_dir / "abc.jpg"
+        existing.write_bytes(b"jpeg")
+        (downloader.thumbnails_dir / "empty.jpg").write_bytes(b"")
+
+        assert await downloader.download_thumbnail_only("u", "abc", thumbnail_url="t") == str(existing)
+        assert fetched == []
+        assert await downloader.download_thumbnail_only("u", "empty", thumbnail_url="t") == "new.jpg"
+        assert await downloader.download_thumbnail_only("u", "abc", thumbnail_url="t", refresh=True) == "new.jpg"
+        assert fetched == ["empty", "abc"]
+
+
+class ExpiredResponse:
+    status_code = 403
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        raise requests.HTTPError("403 Forbidden", response=self)
+
+
+class FakeYDL:
+    def __init__(self):
+        self.processed = []
+        self.downloaded = []
+
+    def process_ie_result(self, info, download=False):
+        self.processed.append((info["id"], download))
+
+    def download(self, urls):
+        self.downloaded.extend(urls)
+
+
+class TestDownloadManager:
+    """Tests for DownloadManager."""
+
+    def test_expired_direct_url_falls_back_to_ytdlp(self, tmp_path, monkeypatch):
+        manager = DownloadManager(str(tmp_path))
+        ydl = FakeYDL()
+        monkeypatch.setattr(manager, "_get_ydl", lambda: ydl)
+        responses = iter([ExpiredResponse()])
+
+        def get(url, **kwargs):
+            response = next(responses, None)
+            if response is None:
+                raise requests.ConnectionError("connection reset")
+            return response
+
+        monkeypatch.setattr(manager.session, "get", get)
+        info = {"id": "abc", "direct_url": "https://cdn.example/v.mp4?sig=old", "formats": [{}]}
+        manager._download_video(MediaItem(url="https://example.com/v/abc", type="video", original_data=info))
+        manager._download_video(MediaItem(url="https://example.com/v/def", type="video",
+                                          original_data={"id": "def", "direct_url": "https://cdn.example/d.mp4"}))
+
+        assert ydl.processed == [("abc", True)]
+        assert ydl.downloaded == ["https://example.com/v/def"]
+        assert list(tmp_path.iterdir()) == []
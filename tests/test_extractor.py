@@ -36,11 +36,20 @@ class TestMediaItem:
 class TestYouTubeExtractor:
     """Tests for YouTubeExtractor."""
 
-    def test_is_supported_any_url(self):
+    def test_is_supported_video_urls(self):
         extractor = YouTubeExtractor()
-        # yt-dlp supports any URL (returns True always)
         assert extractor.is_supported("https://www.youtube.com/watch?v=abc") is True
-        assert extractor.is_supported("https://example.com") is True
+        assert extractor.is_supported("https://youtu.be/abc") is True
+        assert extractor.is_supported("https://vimeo.com/123456") is True
+
+    def test_is_not_supported_plain_pages(self):
+        extractor = YouTubeExtractor()
+        # Generic pages fall through to the image extractor
+        assert extractor.is_supported("https://example.com") is False
+        assert extractor.is_supported("https://example.com/photo.jpg") is False
+
+    def test_accepts_cookies(self):
+        assert YouTubeExtractor().accepts_cookies is True
 
 
 class TestWebImageExtractor:
@@ -51,6 +60,26 @@ class TestWebImageExtractor:
         # Fallback extractor - supports any URL
         assert extractor.is_supported("https://example.com") is True
 
+    def test_does_not_accept_cookies(self):
+        assert WebImageExtractor().accepts_cookies is False
+
+    def test_parse_images_skips_icons_and_data_uris(self):
+        html = b"""<html><body>
+            <img src="/photos/big.jpg" alt="Big" width="800" height="600">
+            <img src="/icons/star.png" width="16" height="16">
+            <img src="data:image/gif;base64,R0lGODlhAQABAAAAACw=">
+            <img src="/photos/fluid.jpg?w=1" width="100%" height="20">
+            <img src="/photos/big.jpg">
+        </body></html>"""
+        items = WebImageExtractor()._parse_images(html, "https://example.com/page")
+
+        assert [item.url for item in items] == [
+            "https://example.com/photos/big.jpg",
+            "https://example.com/photos/fluid.jpg?w=1",
+        ]
+        assert items[0].title == "Big"
+        assert items[1].title == "fluid.jpg"
+
 
 class TestGetAllExtractors:
     """Tests for get_all_extractors."""
@@ -11,6 +11,7 @@ from media_toolkit.parser import (
     parse_md_file,
     scan_directory,
     detect_duplicates,
+    analyze_urls,
     detect_platform,
 )
 
@@ -87,6 +88,16 @@ class TestExtractedURL:
             line_number=1,
         )
         assert url1.id == url2.id
+    
+    def test_id_is_stable(self):
+        """IDs are stored on disk, so the hash must not change."""
+        url = ExtractedURL(
+            url="https://instagram.com/p/ABC123/",
+            platform="instagram",
+            source_file=Path("/test.md"),
+            line_number=1,
+        )
+        assert url.id == "c8d359698fe1"
 
 
 class TestURLCollection:
@@ -193,6 +204,19 @@ https://www.instagram.com/p/ABC123/
         
         assert len(urls) == 1
         assert urls[0].platform == "instagram"
+        assert urls[0].line_number == 7
+    
+    def test_parse_with_crlf_frontmatter(self, tmp_path):
+        path = tmp_path / "crlf.md"
+        path.write_bytes(
+            b"---\r\nsource: https://instagram.com/p/FRONT/\r\n---\r\n"
+            b"# Test\r\n\r\nhttps://www.instagram.com/p/ABC123/\r\n"
+        )
+        
+        urls = parse_md_file(path)
+        
+        assert [url.url for url in urls] == ["https://www.instagram.com/p/ABC123/"]
+        assert urls[0].line_number == 6
     
     def test_parse_with_context(self):
         content = """# Test
@@ -209,6 +233,25 @@ https://www.instagram.com/reel/ABC123/
         assert len(urls) == 1
         assert urls[0].context == "가요이"
     
+    def test_parse_empty_file(self, tmp_path):
+        path = tmp_path / "empty.md"
+        path.write_bytes(b"")
+        
+        assert parse_md_file(path) == []
+    
+    def test_url_scan_matches_regex(self):
+        from media_toolkit.parser import md_parser
+        
+        buf = (
+            b"intro https://www.instagram.com/p/A1/ and HTTPS://Facebook.com/reel/B2\n"
+            b"https://www.facebook.com/share/?u=https://instagram.com/p/C3/\n"
+            b"https://threads.net/@x/post/D4) https://www.linkedin.com/posts/e5"
+        )
+        
+        for pos in (0, 10):
+            expected = [m.span() for m in md_parser.COMBINED_PATTERN_B.finditer(buf, pos)]
+            assert [m.span() for m in md_parser._iter_url_matches(buf, pos)] == expected
+    
     def test_file_not_found(self):
         with pytest.raises(FileNotFoundError):
             parse_md_file(Path("/nonexistent/file.md"))
@@ -263,3 +306,51 @@ class TestDetectDuplicates:
         assert report
         assert report.total_duplicates == 2  # 3 total - 1 original = 2 duplicates
         assert report.unique_duplicated_count == 1  # 1 unique URL with duplicates
+
+
+class TestAnalyzeUrls:
+    """Tests for analyze_urls function."""
+    
+    def test_matches_separate_passes(self):
+        def make(url, platform="instagram", name="a.md"):
+            return ExtractedURL(
+                url=url, platform=platform, source_file=Path(name), line_number=1,
+            )
+        
+        urls = [
+            make("https://instagram.com/p/ABC/"),
+            make("https://www.threads.net/@u/post/1", platform="threads"),
+            make("https://instagram.com/p/ABC/?igsh=xyz", name="b.md"),
+            make("https://instagram.com/p/XYZ/"),
+            make("https://instagram.com/p/ABC/", name="c.md"),
+        ]
+        collection = URLCollection(urls=urls)
+        
+        analysis = analyze_urls(urls)
+        assert analysis.unique == collection.unique_urls()
+        assert analysis.duplicates == detect_duplicates(urls)
+        assert analysis.duplicates.total_duplicates == 2
+        assert analysis.by_platform == {"instagram": 2, "threads": 1}
+        assert not analyze_urls([]).duplicates
+
+
+class TestScanDirectory:
+    """Tests for scan_directory function."""
+    
+    def test_parallel_matches_serial(self, tmp_path):
+        for i in range(40):
+            (tmp_path / f"note_{i:02d}.md").write_text(
+                f"# Note {i}\n\nhttps://www.instagram.com/p/POST{i}/\n",
+                encoding='utf-8',
+            )
+        
+        serial = scan_directory(tmp_path, max_workers=1)
+        parallel = scan_directory(tmp_path, max_workers=2)
+        
+        assert len(serial) == 40
+        assert [u.url for u in parallel] == [u.url for u in serial]
+        assert parallel.source_files == serial.source_files
+    
+    def test_not_a_directory(self, tmp_path):
+        with pytest.raises(NotADirectoryError):
+            scan_directory(tmp_path / "missing")
@@ -1,5 +1,8 @@
 """Tests for the scraper module."""
 
+import re
+from datetime import datetime
+
 import pytest
 
 from media_toolkit.scraper import (
@@ -7,9 +10,13 @@ from media_toolkit.scraper import (
     ScrapeResult,
     InstagramScraper,
     FacebookScraper,
+    classify,
     get_scraper,
+    scrape_urls,
     list_supported_platforms,
 )
+from media_toolkit.scraper import factory
+from media_toolkit.scraper.factory import _scraper_classes
 
 
 class TestScrapeResult:
@@ -55,6 +62,91 @@ class TestBaseScraper:
         assert scraper._parse_count(None) is None
         assert scraper._parse_count("invalid") is None
     
+    def test_parse_meta(self):
+        class TestScraper(BaseScraper):
+            def supports(self, url): return False
+            async def scrape(self, url): return ScrapeResult(success=False, url=url)
+        
+        scraper = TestScraper()
+        html = """<html><head>
+            <meta property="og:title" content="Tom &amp; Jerry">
+            <meta content="First" property="og:description">
+            <meta property="og:description" content="Second">
+            <meta name="article:author" content="Jane">
+        </head><body></body></html>"""
+        
+        meta = scraper._parse_meta(html)
+        assert meta["og:title"] == "Tom & Jerry"
+        assert meta["og:description"] == "First"
+        assert meta["article:author"] == "Jane"
+        assert scraper._parse_meta("") == {}
+    
+    def test_find_counts_takes_first_of_each(self):
+        class TestScraper(BaseScraper):
+            def supports(self, url): return False
+            async def scrape(self, url): return ScrapeResult(success=False, url=url)
+        
+        pattern = re.compile(r'"a":\s*(?P<a>\d+)|"b":\s*(?P<b>\d+)')
+        text = '{"b": 2, "a": 1, "b": 3, "a": 4}'
+        
+        assert TestScraper()._find_counts(pattern, text) == {"a": 1, "b": 2}
+        assert TestScraper()._find_counts(pattern, '{"a": 7}') == {"a": 7}
+    
+    async def test_read_html_stops_after_head_and_stats(self):
+        class TestScraper(BaseScraper):
+            def supports(self, url): return False
+            async def scrape(self, url): return ScrapeResult(success=False, url=url)
+        
+        class FakeContent:
+            def __init__(self, data, size):
+                self.chunks = [data[i:i + size] for i in range(0, len(data), size)]
+                self.read = 0
+            
+            async def iter_chunked(self, chunk_size):
+                for chunk in self.chunks:
+                    self.read += 1
+                    yield chunk
+        
+        class FakeResponse:
+            charset = 'utf-8'
+            
+            def __init__(self, data, size):
+                self.content = FakeContent(data, size)
+        
+        pattern = re.compile(r'"a":\s*(?P<a>\d+)')
+        page = '<html><head><title>한글</title></head><body>{"a": 1}'.encode() + b'x' * 1000
+        
+        response = FakeResponse(page, 7)
+        html = await TestScraper()._read_html(response, pattern)
+        assert '<title>한글</title>' in html
+        assert '"a": 1' in html
+        assert response.content.read < len(response.content.chunks)
+        
+        # Without the stat present the whole page is read
+        response = FakeResponse(page.replace(b'"a"', b'"b"'), 7)
+        html = await TestScraper()._read_html(response, pattern)
+        assert len(html.encode()) == len(page)
+    
+    def test_headers_are_shared_for_default_user_agent(self):
+        assert InstagramScraper()._headers is FacebookScraper()._headers
+        
+        custom = InstagramScraper(user_agent="custom-agent")
+        assert custom._headers['User-Agent'] == "custom-agent"
+        assert InstagramScraper()._headers['User-Agent'] != "custom-agent"
+    
+    async def test_session_is_reused_until_closed(self):
+        scraper = InstagramScraper()
+        
+        session = scraper._get_session()
+        assert scraper._get_session() is session
+        
+        await scraper.close()
+        assert session.closed
+        
+        new_session = scraper._get_session()
+        assert new_session is not session
+        await scraper.close()
+    
     def test_clean_text(self):
         class TestScraper(BaseScraper):
             def supports(self, url): return False
@@ -92,6 +184,15 @@ class TestInstagramScraper:
         ]
         for url in invalid_urls:
             assert scraper.supports(url) is False
+    
+    def test_parse_upload_date(self, scraper):
+        url = "https://www.instagram.com/reel/ABC123/"
+        
+        result = scraper._parse_ytdlp_result(url, {"upload_date": "20240131"})
+        assert result.posted_at == datetime(2024, 1, 31)
+        
+        result = scraper._parse_ytdlp_result(url, {"upload_date": "2024013x"})
+        assert result.posted_at is None
 
 
 class TestFacebookScraper:
@@ -118,6 +219,15 @@ class TestFacebookScraper:
         ]
         for url in invalid_urls:
             assert scraper.supports(url) is False
+    
+    def test_parse_upload_date(self, scraper):
+        url = "https://www.facebook.com/reel/ABC123/"
+        
+        result = scraper._parse_ytdlp_result(url, {"upload_date": "20240131"})
+        assert result.posted_at == datetime(2024, 1, 31)
+        
+        result = scraper._parse_ytdlp_result(url, {"upload_date": "20241341"})
+        assert result.posted_at is None
 
 
 class TestGetScraper:
@@ -134,6 +244,54 @@ class TestGetScraper:
     def test_get_scraper_unknown_url(self):
         scraper = get_scraper("https://www.youtube.com/watch?v=ABC")
         assert scraper is None
+    
+    def test_reuses_instances_per_kwargs(self):
+        url = "https://www.instagram.com/reel/ABC/"
+        assert get_scraper(url, timeout=5) is get_scraper(url, timeout=5)
+        assert get_scraper(url, timeout=5) is not get_scraper(url, timeout=10)
+        assert get_scraper(url, timeout=10).timeout == 10
+    
+    def test_supports_is_classmethod(self):
+        assert InstagramScraper.supports("https://www.instagram.com/p/ABC/")
+        assert not FacebookScraper.supports("https://www.instagram.com/p/ABC/")
+    
+    def test_classify_matches_supports(self):
+        urls = [
+            "https://www.instagram.com/p/ABC/",
+            "https://WWW.FACEBOOK.COM/reel/123",
+            "https://www.threads.net/@user/post/ABC",
+            "https://www.linkedin.com/posts/user_activity-123",
+            "https://example.com/",
+            "https://example.com/ünïcode",
+        ]
+        for url in urls:
+            expected = next((cls for cls in _scraper_classes() if cls.supports(url)), None)
+            assert classify(url) is expected
+    
+    def test_classify_by_host(self):
+        assert classify("https://m.facebook.com/reel/123") is FacebookScraper
+        assert classify("https://fb.watch/abc/") is FacebookScraper
+        assert classify("https://www.instagram.com/explore/") is None
+    
+    def test_classify_by_pattern_without_hyperscan(self, monkeypatch):
+        factory._refresh_dispatch()
+        monkeypatch.setattr(factory, "_hs_db", None)
+        
+        embedded = "https://example.com/?u=https://WWW.INSTAGRAM.COM/p/ABC/"
+        assert factory._classify_by_pattern(embedded) is InstagramScraper
+        assert factory._classify_by_pattern("https://www.youtube.com/watch?v=x") is None
+
+
+class TestScrapeUrls:
+    """Tests for scrape_urls."""
+    
+    async def test_keeps_input_order(self):
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        
+        results = await scrape_urls(urls, concurrency=2)
+        
+        assert [r.url for r in results] == urls
+        assert all(not r.success for r in results)
 
 
 class TestListSupportedPlatforms:
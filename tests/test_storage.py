@@ -0,0 +1,386 @@
+"""Tests for the storage module."""
+
+import gzip
+import json
+import time
+from datetime import datetime
+
+import pytest
+
+from media_toolkit.storage import Database, FilterOptions, Post, columns
+from media_toolkit.storage.models import Platform, PostStatus
+
+
+def make_post(post_id: str = "abc123", platform: str = "instagram", **kwargs) -> Post:
+    return Post(
+        id=post_id,
+        url=f"https://www.instagram.com/p/{post_id}/",
+        platform=platform,
+        source_file="notes.md",
+        **kwargs,
+    )
+
+
+class TestDatabase:
+    """Tests for Database."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        return Database(tmp_path)
+
+    def test_save_and_get_post(self, db):
+        db.save_post(make_post(content="Hello", tags=["a"]))
+
+        post = db.get_post("abc123")
+        assert post is not None
+        assert post.content == "Hello"
+        assert post.tags == ["a"]
+        assert Database(db.data_dir)._index["abc123"]["tags"] == ["a"]
+
+    def test_batch_writes_index_once(self, db, monkeypatch):
+        writes = []
+        monkeypatch.setattr(db, "_save_index", lambda: writes.append(len(db._index)))
+
+        with db.batch():
+            for i in range(5):
+                db.save_post(make_post(f"post{i}"))
+            assert writes == []
+
+        assert writes == [5]
+        assert (db.data_dir / "data.js").exists()
+
+    def test_save_posts_writes_index_once(self, db, monkeypatch):
+        writes = []
+        monkeypatch.setattr(db, "_save_index", lambda: writes.append(len(db._index)))
+
+        assert db.save_posts(make_post(f"post{i}") for i in range(3)) == 3
+        assert writes == [3]
+        assert db.save_posts([]) == 0
+
+    def test_flush_delay_coalesces_writes(self, tmp_path):
+        db = Database(tmp_path, flush_delay=0.05)
+
+        db.save_post(make_post("one"))
+        db.save_post(make_post("two"))
+        assert Database(tmp_path)._index == {}
+
+        time.sleep(0.3)
+        assert set(Database(tmp_path)._index) == {"one", "two"}
+
+    def test_delete_post(self, db):
+        db.save_post(make_post())
+
+        assert db.delete_post("abc123") is True
+        assert db.get_post("abc123") is None
+        assert Database(db.data_dir)._index == {}
+        assert db.delete_post("abc123") is False
+
+    def test_index_persists_in_sqlite(self, db):
+        db.save_post(make_post("one", tags=["x"], thumbnail_path="t.jpg"))
+        db.save_post(make_post("two"))
+        db.delete_post("one")
+        db.save_post(make_post("three", media_paths=["a.mp4"]))
+
+        reloaded = Database(db.data_dir)
+        assert set(reloaded._index) == {"two", "three"}
+        assert reloaded._index == db._index
+        assert reloaded._index["three"]["has_media"] is True
+
+    def test_imports_legacy_index_json(self, tmp_path):
+        legacy = {"old": {"url": "u", "platform": "instagram", "tags": ["a"], "has_media": False}}
+        (tmp_path / "index.json").write_text(json.dumps(legacy))
+
+        db = Database(tmp_path)
+        assert db.get_all_tags() == ["a"]
+        assert set(Database(tmp_path)._index) == {"old"}
+
+    def test_aggregates_follow_updates(self, db):
+        db.save_post(make_post("one", author="alice", tags=["x", "y"], category="news", likes=3))
+        db.save_post(make_post("two", author="bob", tags=["y"], status="accessible", likes=1))
+        db.save_post(make_post("one", author="alice", tags=["z"], likes=5))  # Update
+        db.delete_post("two")
+
+        assert db.get_all_tags() == ["z"]
+        assert db.get_all_categories() == []
+        assert db.get_all_authors() == ["alice"]
+
+        stats = db.get_stats()
+        assert stats.total_posts == 1
+        assert stats.pending == 1
+        assert stats.accessible == 0
+        assert stats.by_platform == {"instagram": 1}
+        assert stats.by_author == {"alice": 1}
+
+        analytics = db.get_analytics()
+        assert analytics["author_stats"] == [
+            {"name": "alice", "count": 1, "likes": 5, "comments": 0}
+        ]
+        assert analytics["status_counts"] == {"pending": 1}
+
+        reloaded = Database(db.data_dir)
+        assert reloaded.get_analytics() == analytics
+
+    def test_update_tags_keeps_body(self, db):
+        db.save_post(make_post(content="Body text\n\n---\n\nmore", tags=["old"], note="n"))
+        before = db._post_path("abc123").read_text()
+
+        assert db.update_tags("abc123", ["new", "tags"]) is True
+        assert db.update_category("abc123", "news") is True
+        assert db.update_tags("missing", ["x"]) is False
+
+        post = db.get_post("abc123")
+        assert post.tags == ["new", "tags"]
+        assert post.category == "news"
+        assert post.note == "n"
+        assert post.content == "Body text\n\n---\n\nmore"
+        after = db._post_path("abc123").read_text()
+        assert after.split("---\n", 2)[2] == before.split("---\n", 2)[2]
+        assert db.get_all_tags() == ["new", "tags"]
+        assert Database(db.data_dir)._index["abc123"]["category"] == "news"
+
+    def test_reindex_rebuilds_from_files(self, db):
+        db.save_post(make_post("one", tags=["x"], author="alice"))
+        db.save_post(make_post("two", media_paths=["a.mp4"]))
+        (db.posts_dir / "broken.md").write_text("---\nid: [unclosed\n---\n")
+        expected = dict(db._index)
+        db._index.clear()
+
+        assert db.reindex() == 2
+        assert db._index == expected
+        assert db.get_all_authors() == ["alice"]
+
+    def test_durable_barrier_syncs_written_files(self, db, monkeypatch):
+        db.save_post(make_post("one"))
+        db.save_post(make_post("two"))
+        db.delete_post("two")
+        assert not list(db.posts_dir.glob("*.tmp"))
+
+        synced = []
+        monkeypatch.setattr("os.fsync", synced.append)
+        db.durable_barrier()
+        assert len(synced) == 1
+        assert db._unsynced == set()
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_list_posts_by_tag(self, db, monkeypatch, vectorized):
+        if not vectorized:
+            monkeypatch.setattr(columns, "np", None)
+
+        db.save_post(make_post("one", tags=["x", "y"]))
+        db.save_post(make_post("two", tags=["y"]))
+        db.save_post(make_post("three"))
+        db.save_post(make_post("two", tags=["z"]))  # Update
+
+        def ids(**kwargs):
+            return {post.id for post in db.list_posts(FilterOptions(**kwargs))}
+
+        assert ids(tags=["y"]) == {"one"}
+        assert ids(tags=["x", "z"]) == {"one", "two"}
+        assert ids(tags=["missing"]) == set()
+        assert ids() == {"one", "two", "three"}
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_list_posts_filter_sort_paginate(self, db, monkeypatch, vectorized):
+        if not vectorized:
+            monkeypatch.setattr(columns, "np", None)
+        db.save_post(make_post("a", author="alice", likes=5, posted_at=datetime(2024, 1, 1)))
+        db.save_post(make_post("b", author="bob", likes=9, posted_at=datetime(2024, 3, 1)))
+        db.save_post(make_post("c", author="alice", likes=5, status="accessible"))
+        db.save_post(make_post("d", author="carol", platform="threads", likes=1))
+
+        def ids(**kwargs):
+            return [post.id for post in db.list_posts(FilterOptions(**kwargs))]
+
+        assert ids(sort_by="likes") == ["b", "a", "c", "d"]
+        assert ids(sort_by="likes", sort_desc=False) == ["d", "a", "c", "b"]
+        assert ids(sort_by="author", sort_desc=False) == ["a", "c", "b", "d"]
+        assert ids(sort_by="posted_at") == ["b", "a", "c", "d"]
+        assert ids(authors=["alice"], statuses=[PostStatus.PENDING]) == ["a"]
+        assert ids(platforms=[Platform.THREADS]) == ["d"]
+        assert ids(authors=["nobody"]) == []
+        assert ids(posted_after=datetime(2024, 2, 1), posted_before=datetime(2024, 4, 1)) == ["b"]
+        assert ids(sort_by="likes", offset=1, limit=2) == ["a", "c"]
+
+    def test_get_post_is_cached_until_changed(self, db, monkeypatch):
+        db.save_post(make_post(tags=["a"]))
+        first = db.get_post("abc123")
+        first.tags.append("mutated")
+
+        loads = []
+        monkeypatch.setattr("frontmatter.load", lambda *a, **kw: loads.append(1))
+        assert db.get_post("abc123").tags == ["a"]
+        assert loads == []
+
+        monkeypatch.undo()
+        db.update_tags("abc123", ["b"])
+        assert db.get_post("abc123").tags == ["b"]
+        db.delete_post("abc123")
+        assert db.get_post("abc123") is None
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_list_posts_posted_before_alone(self, db, monkeypatch, vectorized):
+        if not vectorized:
+            monkeypatch.setattr(columns, "np", None)
+        db.save_post(make_post("old", posted_at=datetime(2023, 6, 1)))
+        db.save_post(make_post("new", posted_at=datetime(2024, 6, 1)))
+        db.save_post(make_post("undated"))
+
+        def ids(**kwargs):
+            return {post.id for post in db.list_posts(FilterOptions(**kwargs))}
+
+        assert ids(posted_before=datetime(2024, 1, 1)) == {"old"}
+        assert ids(posted_after=datetime(2024, 1, 1)) == {"new"}
+
+    def test_save_post_skips_unchanged_file(self, db, monkeypatch):
+        db.save_post(make_post(content="Body", tags=["a"]))
+        post = db.get_post("abc123")
+
+        writes = []
+        monkeypatch.setattr(db, "_mark_dirty", lambda post_id=None: writes.append(post_id))
+        monkeypatch.setattr("media_toolkit.storage.db.atomic_write_bytes", lambda *a: writes.append(a))
+        db.save_post(post)
+        assert writes == []
+
+        post.tags = ["b"]
+        db.save_post(post)
+        assert len(writes) == 2
+
+    def test_save_post_writes_plain_values(self, db):
+        post = make_post(posted_at=datetime(2024, 1, 2, 3, 4, 5))
+        post.status = PostStatus.ACCESSIBLE  # Assigned enums are not coerced
+        db.save_post(post)
+
+        text = db._post_path("abc123").read_text()
+        assert "status: accessible\n" in text
+        assert "posted_at: '2024-01-02T03:04:05'\n" in text
+        assert db.get_post("abc123").status == "accessible"
+
+    def test_stats_top_authors(self, db):
+        with db.batch():
+            for i in range(25):
+                for j in range(i + 1):
+                    db.save_post(make_post(f"p{i}-{j}", author=f"user{i}"))
+            for j in range(30):
+                db.save_post(make_post(f"anon{j}"))
+
+        by_author = db.get_stats().by_author
+        assert list(by_author) == [f"user{i}" for i in range(24, 4, -1)]
+        assert db.get_analytics()["author_stats"][0] == {
+            "name": "Unknown", "count": 30, "likes": 0, "comments": 0
+        }
+
+    def test_export_static_data_writes_gzip_copy(self, db):
+        db.save_post(make_post("one"))
+        db.flush()
+
+        data_js = (db.data_dir / "data.js").read_bytes()
+        assert data_js.startswith(b"window.POSTS_DATA = [")
+        assert gzip.decompress((db.data_dir / "data.js.gz").read_bytes()) == data_js
+
+    def test_count_posts_follows_filters_and_writes(self, db):
+        db.save_post(make_post("one", author="alice"))
+        db.save_post(make_post("two", author="bob"))
+        alice = FilterOptions(authors=["alice"], limit=1)
+
+        assert len(db.list_posts(alice)) == 1
+        assert db.count_posts(alice) == 1
+        assert db.count_posts(FilterOptions()) == 2
+
+        db.save_post(make_post("three", author="alice"))
+        assert db.count_posts(alice.model_copy(update={"offset": 1})) == 2
+
+    def test_get_posts(self, db):
+        for post_id in ("one", "two", "three"):
+            db.save_post(make_post(post_id))
+
+        posts = db.get_posts(["three", "missing", "one", "three"])
+        assert list(posts) == ["three", "one"]
+        assert posts["one"].id == "one"
+        assert db.get_posts([]) == {}
+
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_list_posts_search_query(self, db, monkeypatch, vectorized):
+        if not vectorized:
+            monkeypatch.setattr(columns, "np", None)
+        db.save_post(make_post("one", title="Python tips", content="50% off_sale", author="alice"))
+        db.save_post(make_post("two", content="맛집 추천 리스트", author="bob"))
+        db.save_post(make_post("three", content="Rust and python", author="carol"))
+
+        def ids(query):
+            return {post.id for post in db.list_posts(FilterOptions(search_query=query))}
+
+        assert ids("python") == {"one", "three"}
+        assert ids("PYTHON rust") == {"three"}
+        assert ids("ali") == {"one"}
+        assert ids("추천") == {"two"}
+        assert ids("0%") == {"one"}
+        assert ids("f_s") == {"one"}
+        assert ids("o_f") == set()
+        assert ids("   ") == {"one", "two", "three"}
+        assert db.count_posts(FilterOptions(search_query="python")) == 2
+
+        db.save_post(make_post("three", content="Rust only", author="carol"))  # Update
+        db.delete_post("one")
+        assert ids("python") == set()
+        assert ids("rust") == {"three"}
+
+        db._index.clear()
+        db.reindex()
+        assert ids("rust") == {"three"}
+        assert ids("리스트") == {"two"}
+        assert {p.id for p in Database(db.data_dir).list_posts(FilterOptions(search_query="rust"))} == {"three"}
+
+    def test_count_posts_survives_cache_clear(self, db, monkeypatch):
+        db.save_post(make_post("one"))
+        db.save_post(make_post("two", platform="facebook"))
+        # A save from another thread can clear the cache right after it is filled
+        monkeypatch.setattr(db, "_cache_count", lambda filters, total: db._count_cache.clear())
+
+        assert db.count_posts(FilterOptions(platforms=[Platform.FACEBOOK])) == 1
+        assert db.count_posts(FilterOptions()) == 2
+
+    def test_search_in_batch_does_not_flush(self, db, monkeypatch):
+        db.save_post(make_post("one", content="Python tips"))
+        db.save_post(make_post("two", content="Rust tips"))
+        exports = []
+        monkeypatch.setattr(db, "export_static_data", lambda: exports.append(1))
+
+        def ids(query):
+            return {post.id for post in db.list_posts(FilterOptions(search_query=query))}
+
+        with db.batch():
+            db.save_post(make_post("three", content="More python"))
+            db.save_post(make_post("one", content="Go tips"))  # Update
+            db.delete_post("two")
+            assert ids("python") == {"three"}
+            assert ids("TIPS") == {"one"}
+            assert exports == []
+        assert exports == [1]
+        assert ids("python") == {"three"}
+
+    def test_list_posts_json_matches_model_dump(self, db, monkeypatch):
+        db.save_post(make_post("one", tags=["a"], likes=2, posted_at=datetime(2024, 1, 2, 3, 4, 5)))
+        db.save_post(make_post("two", likes=1))
+
+        rows = db.list_posts_json(FilterOptions(sort_by="likes"))
+        expected = db.list_posts(FilterOptions(sort_by="likes"))
+        assert [json.loads(row) for row in rows] == [json.loads(p.model_dump_json()) for p in expected]
+        assert db.get_post_json("missing") is None
+
+        monkeypatch.setattr("media_toolkit.storage.db._POST_JSON", None)  # Cached: never used
+        assert db.get_post_json("one") is rows[0]
+        monkeypatch.undo()
+
+        db.update_tags("one", ["b"])
+        assert json.loads(db.get_post_json("one"))["tags"] == ["b"]
+
+    def test_synchronous_level(self, tmp_path):
+        db = Database(tmp_path, synchronous="off")
+        assert db._conn.execute("PRAGMA synchronous").fetchone() == (0,)
+        db.save_post(make_post())
+        db.close()
+        assert not (tmp_path / "index.sqlite-wal").exists()
+        assert set(Database(tmp_path)._index) == {"abc123"}
+
+        with pytest.raises(ValueError):
+            Database(tmp_path, synchronous="NORMAL; DROP TABLE posts")
@@ -0,0 +1,51 @@
+"""Tests for the utils module."""
+
+from media_toolkit.utils import atomic_write_bytes, human_readable_size, sanitize_filename
+
+
+class TestHumanReadableSize:
+    """Tests for human_readable_size."""
+
+    def test_units(self):
+        assert human_readable_size(512) == "512.00 B"
+        assert human_readable_size(1536) == "1.50 KB"
+        assert human_readable_size(10 * 1024 * 1024) == "10.00 MB"
+
+    def test_none(self):
+        assert human_readable_size(None) == "Unknown"
+
+    def test_unit_boundaries(self):
+        assert human_readable_size(0) == "0.00 B"
+        assert human_readable_size(1023.5) == "1023.50 B"
+        assert human_readable_size(1024 ** 2 - 1) == "1024.00 KB"
+        assert human_readable_size(1024 ** 5) == "1.00 PB"
+        assert human_readable_size(3 * 1024 ** 6) == "3072.00 PB"
+
+
+class TestSanitizeFilename:
+    """Tests for sanitize_filename."""
+
+    def test_strips_unsafe_characters(self):
+        assert sanitize_filename('a/b:c*?"<>|.jpg') == "abc.jpg"
+
+    def test_keeps_allowed_punctuation(self):
+        assert sanitize_filename("My Clip (1)_final-v2.mp4") == "My Clip (1)_final-v2.mp4"
+
+    def test_keeps_unicode_letters(self):
+        assert sanitize_filename("가요이 영상.mp4") == "가요이 영상.mp4"
+
+    def test_strips_trailing_whitespace(self):
+        assert sanitize_filename("name   ") == "name"
+        assert sanitize_filename("@@@") == ""
+
+
+class TestAtomicWriteBytes:
+    """Tests for atomic_write_bytes."""
+
+    def test_replaces_contents(self, tmp_path):
+        path = tmp_path / "data.js"
+        path.write_bytes(b"old")
+
+        atomic_write_bytes(path, b"new", fsync=True)
+        assert path.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [path]
@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from media_toolkit.validator import url_validator
 from media_toolkit.validator import (
     URLStatus,
     ValidationResult,
@@ -57,6 +58,29 @@ class TestURLValidator:
     def test_analyze_content_accessible(self, validator):
         content = "<html><body>Normal page content here</body></html>"
         assert validator._analyze_content(content) == URLStatus.ACCESSIBLE
+    
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_analyze_content_deleted_wins(self, validator, monkeypatch, fast):
+        if not fast:
+            monkeypatch.setattr(url_validator, "_compile_indicator_db", lambda _: None)
+        content = "PRIVATE ACCOUNT ... this page may have been REMOVED"
+        assert validator._analyze_content(content) == URLStatus.DELETED
+        assert validator._analyze_content("Log in to see photos") == URLStatus.PRIVATE
+
+
+    @pytest.mark.asyncio
+    async def test_read_head_is_capped(self, validator):
+        chunks = [b"x" * 1000] * 200
+        response = MagicMock(charset="utf-8")
+        
+        async def iter_chunked(size):
+            for chunk in chunks:
+                yield chunk
+        
+        response.content.iter_chunked = iter_chunked
+        
+        content = await validator._read_head(response)
+        assert len(content) == validator.MAX_CONTENT_BYTES
 
 
 class TestBatchValidate:
@@ -67,3 +91,66 @@ class TestBatchValidate:
         validator = URLValidator()
         results = await validator.batch_validate([])
         assert results == []
+    
+    @pytest.mark.asyncio
+    async def test_session_is_shared_until_closed(self):
+        async with URLValidator() as validator:
+            session = validator._get_session()
+            assert validator._get_session() is session
+        
+        assert session.closed
+        assert validator._session is None
+
+
+class TestValidateRequest:
+    """Tests for the requests validate makes."""
+    
+    @staticmethod
+    def fake_session(statuses, body=b"<html>ok</html>"):
+        """Session whose responses have the given statuses, recording requests."""
+        calls = []
+        
+        def request(method, url, **kwargs):
+            calls.append((method, kwargs))
+            response = MagicMock(status=statuses[len(calls) - 1], charset="utf-8")
+            
+            async def iter_chunked(size):
+                yield body
+            
+            response.content.iter_chunked = iter_chunked
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=False)
+            return context
+        
+        return MagicMock(request=request), calls
+    
+    @pytest.mark.asyncio
+    async def test_get_asks_for_checked_window(self, monkeypatch):
+        validator = URLValidator(max_retries=1)
+        session, calls = self.fake_session([206], body=b"Page Not Found")
+        monkeypatch.setattr(validator, "_get_session", lambda: session)
+        
+        result = await validator.validate("https://example.com/p/1")
+        assert result.status == URLStatus.DELETED
+        assert result.http_status == 206
+        method, kwargs = calls[0]
+        assert method == "GET"
+        assert kwargs["headers"]["Range"] == f"bytes=0-{validator.MAX_CONTENT_BYTES - 1}"
+        assert kwargs["max_redirects"] == validator.MAX_REDIRECTS
+    
+    @pytest.mark.asyncio
+    async def test_head_falls_back_to_get(self, monkeypatch):
+        validator = URLValidator(max_retries=1)
+        session, calls = self.fake_session([200, 404])
+        monkeypatch.setattr(validator, "_get_session", lambda: session)
+        
+        result = await validator.validate("https://example.com/p/1", method="HEAD")
+        assert result.status == URLStatus.ACCESSIBLE
+        assert "Range" not in calls[0][1]["headers"]
+        
+        session, calls = self.fake_session([405, 404])
+        monkeypatch.setattr(validator, "_get_session", lambda: session)
+        result = await validator.validate("https://example.com/p/1", method="HEAD")
+        assert result.status == URLStatus.DELETED
+        assert [method for method, _ in calls] == ["HEAD", "GET"]
@@ -0,0 +1,409 @@
+"""Tests for the viewer module."""
+
+import asyncio
+import os
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+import pytest
+from fastapi import BackgroundTasks, HTTPException
+from starlette.requests import Request
+
+from media_toolkit.parser import ExtractedURL
+from media_toolkit.scraper.base import ScrapeResult
+from media_toolkit.storage import Database, Post
+from media_toolkit.viewer import server
+from media_toolkit.validator import URLStatus, URLValidator, ValidationResult
+from media_toolkit.viewer.server import ResponseCache, ThumbnailCache
+
+
+class TestThumbnailCache:
+    """Tests for ThumbnailCache."""
+
+    def test_serves_from_memory_until_file_changes(self, tmp_path):
+        thumb = tmp_path / "abc.jpg"
+        thumb.write_bytes(b"first")
+        cache = ThumbnailCache(tmp_path)
+
+        etag, content = cache.get("abc")
+        assert content == b"first"
+        assert cache.get("abc") == (etag, b"first")
+
+        thumb.write_bytes(b"second!")
+        os.utime(thumb, ns=(1, 1))
+        new_etag, content = cache.get("abc")
+        assert content == b"second!"
+        assert new_etag != etag
+
+    def test_missing_and_evicted(self, tmp_path):
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.jpg").write_bytes(name.encode())
+        cache = ThumbnailCache(tmp_path, maxsize=1)
+
+        assert cache.get("missing") is None
+        cache.get("a")
+        cache.get("b")
+        assert list(cache._entries) == ["b"]
+
+        (tmp_path / "b.jpg").unlink()
+        assert cache.get("b") is None
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_rebuilds_after_index_changes(self, tmp_path):
+        db = Database(tmp_path)
+        cache = ResponseCache(db)
+        builds = []
+
+        def build():
+            builds.append(1)
+            return {"authors": db.get_all_authors()}
+
+        assert orjson.loads(cache.get("filters", build).body) == {"authors": []}
+        cache.get("filters", build)
+        assert len(builds) == 1
+
+        db.save_post(Post(
+            id="abc", url="https://www.instagram.com/p/abc/", platform="instagram",
+            source_file="notes.md", author="alice",
+        ))
+        assert orjson.loads(cache.get("filters", build).body) == {"authors": ["alice"]}
+        assert len(builds) == 2
+
+
+class TestPostsPageJson:
+    """Tests for the /api/posts response body."""
+
+    def test_matches_model_dump(self):
+        posts = [
+            Post(
+                id=f"p{i}", url=f"https://www.instagram.com/p/p{i}/", platform="instagram",
+                source_file="notes.md", tags=["a"], likes=i,
+                posted_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+            )
+            for i in range(3)
+        ]
+
+        body = orjson.loads(server._posts_page_json([p.model_dump_json().encode() for p in posts], 10, 3, 6))
+        assert body == {
+            "posts": orjson.loads(orjson.dumps([post.model_dump() for post in posts])),
+            "total": 10,
+            "limit": 3,
+            "offset": 6,
+        }
+        assert orjson.loads(server._posts_page_json([], 0, 50, 0))["posts"] == []
+
+
+class TestTaskStream:
+    """Tests for the /api/task/stream endpoint."""
+
+    async def test_streams_posts_until_task_finishes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        state = server.task_state
+        app = server.create_app(tmp_path)
+        endpoint = next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/api/task/stream")
+
+        state.is_running = True
+        state.current_task = "Scraping"
+        response = await endpoint()
+        events = response.body_iterator
+
+        first = orjson.loads((await anext(events))[len(b"data: "):])
+        assert first["current_task"] == "Scraping"
+        assert first["recent_posts"] == []
+
+        state.add_recent_post({"id": "abc"})
+        second = orjson.loads((await anext(events))[len(b"data: "):])
+        assert second["recent_posts"] == [{"id": "abc"}]
+
+        state.is_running = False
+        last = orjson.loads((await anext(events))[len(b"data: "):])
+        assert last["is_running"] is False
+        assert [chunk async for chunk in events] == []
+        assert state.listeners == set()
+
+    async def test_wakes_on_status_change_only(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        state = server.task_state
+        app = server.create_app(tmp_path)
+        endpoint = next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/api/task/stream")
+
+        state.is_running = True
+        events = (await endpoint()).body_iterator
+        await anext(events)
+
+        state.progress = 1
+        assert orjson.loads((await anext(events))[len(b"data: "):])["progress"] == 1
+
+        state.progress = 1  # Unchanged: no event
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(anext(events), 0.2)
+
+    async def test_coalesces_bursts(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        state = server.task_state
+        app = server.create_app(tmp_path)
+        endpoint = next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/api/task/stream")
+
+        state.is_running = True
+        events = (await endpoint()).body_iterator
+        received = []
+
+        async def consume():
+            async for chunk in events:
+                received.append(orjson.loads(chunk[len(b"data: "):]))
+
+        consumer = asyncio.create_task(consume())
+        for i in range(1, 51):
+            state.progress = i
+            await asyncio.sleep(0.005)
+        state.is_running = False
+        await consumer
+
+        assert len(received) < 10
+        assert received[-1]["progress"] == 50
+        assert received[-1]["is_running"] is False
+
+    def test_history_is_bounded(self):
+        state = server.TaskState()
+        for i in range(server.TASK_HISTORY_SIZE + 5):
+            state.add_recent_post({"id": i})
+            state.errors.append(f"error {i}")
+
+        assert [post["id"] for post in state.recent_posts] == list(range(5, server.TASK_HISTORY_SIZE + 5))
+        assert state.snapshot()["errors"][0] == "error 5"
+        assert server.TaskState().errors is not state.errors
+
+
+class TestRunForPosts:
+    """Tests for run_for_posts."""
+
+    async def test_bounds_concurrency_per_host(self, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        monkeypatch.setattr(server, "HOST_CONCURRENCY", 2)
+        posts = [
+            Post(id=f"{host}{i}", url=f"https://{host}.com/p/{i}", platform="unknown", source_file="x.md")
+            for host in ("a", "b")
+            for i in range(4)
+        ]
+        in_flight = Counter()
+        peak = Counter()
+
+        async def work(post):
+            host = post.url.split("/")[2]
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            if post.id == "a3":
+                raise ValueError("boom")
+
+        await server.run_for_posts(posts, work, delay=0, verb="Testing", error_prefix="Test ")
+
+        assert peak == {"a.com": 2, "b.com": 2}
+        assert server.task_state.progress == 8
+        assert list(server.task_state.errors) == ["Test a3: boom"]
+
+
+    async def test_paces_starts_per_host(self, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        monkeypatch.setattr(server, "HOST_CONCURRENCY", 2)
+        posts = [
+            Post(id=f"a{i}", url=f"https://a.com/p/{i}", platform="unknown", source_file="x.md")
+            for i in range(6)
+        ]
+        starts = []
+
+        async def work(post):
+            starts.append(time.monotonic())
+
+        await server.run_for_posts(posts, work, delay=0.2, verb="Testing")
+
+        # Two start at once, then one every 0.1s
+        assert starts[1] - starts[0] < 0.05
+        assert starts[5] - starts[0] >= 0.35
+
+
+class TestPersistScan:
+    """Tests for _persist_scan."""
+
+    def test_creates_pending_posts_for_new_urls(self, tmp_path):
+        db = Database(tmp_path)
+        urls = [
+            ExtractedURL(
+                url=f"https://www.instagram.com/p/{code}/", platform="instagram",
+                source_file=Path("notes.md"), line_number=1,
+            )
+            for code in ("A", "B")
+        ]
+
+        assert [post.id for post in server._persist_scan(db, urls)] == [u.id for u in urls]
+        assert db.get_post(urls[0].id).status == "pending"
+        assert server._persist_scan(db, urls) == []
+
+
+class TestIndexPage:
+    """Tests for the / endpoint."""
+
+    async def test_conditional_get(self, tmp_path):
+        app = server.create_app(tmp_path)
+        endpoint = next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/")
+
+        response = await endpoint(Request({"type": "http", "headers": []}))
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        request = Request({"type": "http", "headers": [(b"if-none-match", etag.encode())]})
+        assert (await endpoint(request)).status_code == 304
+
+    async def test_template_is_reread_only_in_debug(self, tmp_path, monkeypatch):
+        template = tmp_path / "templates" / "index.html"
+        template.parent.mkdir()
+        template.write_text("<p>one</p>")
+        monkeypatch.setattr(server, "MODULE_DIR", tmp_path)
+        request = Request({"type": "http", "headers": []})
+
+        def index_endpoint(debug):
+            app = server.create_app(tmp_path / "data", debug=debug)
+            return next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/")
+
+        cached, live = index_endpoint(False), index_endpoint(True)
+        template.write_text("<p>two</p>")
+        assert (await cached(request)).body == b"<p>one</p>"
+        assert (await live(request)).body == b"<p>two</p>"
+
+
+class TestTaskClaim:
+    """Tests for claiming the background task slot."""
+
+    async def test_second_request_is_rejected_before_first_task_starts(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        Database(tmp_path).save_post(Post(
+            id="abc", url="https://www.instagram.com/p/abc/", platform="instagram",
+            source_file="notes.md", status="accessible",
+        ))
+        app = server.create_app(tmp_path)
+        endpoint = next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/api/download-all")
+
+        first = BackgroundTasks()
+        assert (await endpoint(first))["count"] == 1
+        assert len(first.tasks) == 1
+        assert server.task_state.is_running
+
+        with pytest.raises(HTTPException) as excinfo:
+            await endpoint(BackgroundTasks())
+        assert excinfo.value.status_code == 409
+
+
+class TestJsonEndpoints:
+    """Tests for endpoints encoding their bodies with orjson."""
+
+    async def test_scan_reports_duplicate_files(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        notes = tmp_path / "notes"
+        notes.mkdir()
+        for name in ("a.md", "b.md"):
+            (notes / name).write_text("https://www.instagram.com/p/abc123/\n")
+        app = server.create_app(tmp_path / "data", source_dir=notes)
+        endpoint = next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/api/scan")
+
+        body = orjson.loads((await endpoint(None)).body)
+        assert body["new_urls"] == 1
+        assert body["duplicates"] == 1
+        [duplicate] = body["duplicate_list"]
+        assert duplicate["count"] == 2
+        assert sorted(Path(f).name for f in duplicate["files"]) == ["a.md", "b.md"]
+
+    async def test_inaccessible_posts(self, tmp_path):
+        db = Database(tmp_path)
+        for post_id, status in (("gone", "deleted"), ("ok", "accessible")):
+            db.save_post(Post(
+                id=post_id, url=f"https://www.instagram.com/p/{post_id}/", platform="instagram",
+                source_file="notes.md", status=status, error_message="404",
+            ))
+        db.flush()
+        app = server.create_app(tmp_path)
+        endpoint = next(
+            r.endpoint for r in app.routes if getattr(r, "path", "") == "/api/posts/inaccessible"
+        )
+
+        assert orjson.loads((await endpoint()).body) == [{
+            "id": "gone", "url": "https://www.instagram.com/p/gone/", "status": "deleted",
+            "platform": "instagram", "source_file": "notes.md", "error_message": "404",
+        }]
+
+
+class TestProcessAll:
+    """Tests for the /api/process-all pipeline."""
+
+    async def test_scrapes_overlap_validation(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(server, "task_state", server.TaskState())
+        notes = tmp_path / "notes"
+        notes.mkdir()
+        (notes / "a.md").write_text(
+            "https://www.instagram.com/p/fast1/\n"
+            "https://www.instagram.com/p/gone2/\n"
+            "https://www.instagram.com/p/slow3/\n"
+        )
+        log = []
+
+        async def validate(self, url, method="GET"):
+            await asyncio.sleep(0.2 if "slow" in url else 0.01)
+            log.append(("validated", url))
+            status = URLStatus.DELETED if "gone" in url else URLStatus.ACCESSIBLE
+            return ValidationResult(url=url, status=status)
+
+        async def scrape(url, timeout=30):
+            log.append(("scraped", url))
+            return ScrapeResult(success=True, url=url, author="alice")
+
+        async def thumbnail(self, url, post_id, **kwargs):
+            return None
+
+        monkeypatch.setattr(URLValidator, "validate", validate)
+        monkeypatch.setattr(server, "scrape_url", scrape)
+        monkeypatch.setattr(server.MediaDownloader, "download_thumbnail_only", thumbnail)
+        app = server.create_app(tmp_path / "data", source_dir=notes)
+        endpoint = next(r.endpoint for r in app.routes if getattr(r, "path", "") == "/api/process-all")
+
+        tasks = BackgroundTasks()
+        await endpoint(tasks)
+        await tasks()
+
+        fast, slow = "https://www.instagram.com/p/fast1/", "https://www.instagram.com/p/slow3/"
+        assert log.index(("scraped", fast)) < log.index(("validated", slow))
+        assert [entry for entry in log if entry[0] == "scraped"] == [("scraped", fast), ("scraped", slow)]
+        assert server.task_state.message == "Complete: 3 new, 2 scraped"
+        assert not server.task_state.is_running
+
+
+class TestDeletePosts:
+    """Tests for batch DELETE /api/posts."""
+
+    async def test_deletes_posts_whose_file_is_missing_or_broken(self, tmp_path):
+        db = Database(tmp_path)
+        for post_id in ("ok", "missing", "broken"):
+            db.save_post(Post(
+                id=post_id, url=f"https://www.instagram.com/p/{post_id}/", platform="instagram",
+                source_file="notes.md",
+            ))
+        db.flush()
+        app = server.create_app(tmp_path)
+        (tmp_path / "posts" / "missing.md").unlink()
+        (tmp_path / "posts" / "broken.md").write_text("---\nid: [unclosed\n---\n")
+        endpoint = next(
+            r.endpoint for r in app.routes
+            if getattr(r, "path", "") == "/api/posts" and "DELETE" in r.methods
+        )
+
+        body = endpoint.__annotations__["body"](ids=["ok", "missing", "broken", "ok", "nope"])
+        result = await endpoint(body)
+
+        assert result == {"success": True, "deleted_count": 3, "errors": []}
+        assert Database(tmp_path)._index == {}
+        assert not (tmp_path / "posts" / "broken.md").exists()